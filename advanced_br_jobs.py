@@ -10,8 +10,17 @@ import random
 import re
 from datetime import datetime
 
+from src.scrapers.engine import SourceEngine
+
 class APIJobSearcher:
+    # Fontes exibidas na interface -> fontes registradas no SourceEngine
+    SOURCE_KEYS = {
+        'ProgramaThor': 'programathor',
+        'Gupy': 'gupy'
+    }
+
     def __init__(self):
+        self.engine = SourceEngine()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
@@ -22,64 +31,29 @@ class APIJobSearcher:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
-    def search_programathor(self, query, location, max_results=10):
-        jobs = []
-        try:
-            # ProgramaThor API endpoint
-            api_url = "https://api.programathor.com.br/v1/jobs"
-            params = {
-                'search': query,
-                'city': location,
-                'page': 1,
-                'per_page': max_results
+    def search(self, sources, query, location, max_results=10):
+        """Busca concorrente nas fontes registradas no SourceEngine"""
+        keys = [self.SOURCE_KEYS[source] for source in sources]
+        results = self.engine.search_sync(query, location, keys, max_results)
+        return [
+            {
+                'title': job.title,
+                'company': job.company,
+                'location': job.location,
+                'salary': job.salary or 'Não informado',
+                'remote': 'Remoto' if job.remote else 'Presencial',
+                'url': job.url,
+                'skills': job.requirements or 'Não especificado',
+                'source': job.source
             }
-            
-            response = self.session.get(api_url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                for job in data.get('jobs', []):
-                    jobs.append({
-                        'title': job.get('title'),
-                        'company': job.get('company', {}).get('name'),
-                        'location': f"{job.get('city', '')}, {job.get('state', '')}",
-                        'salary': job.get('salary_range', 'Não informado'),
-                        'remote': 'Remoto' if job.get('remote') else 'Presencial',
-                        'url': f"https://programathor.com.br/jobs/{job.get('slug')}",
-                        'skills': ', '.join(job.get('skills', [])),
-                        'source': 'ProgramaThor'
-                    })
-        except Exception as e:
-            print(f"Error in ProgramaThor search: {e}")
-        return jobs
+            for key in keys for job in results.get(key, [])
+        ]
+
+    def search_programathor(self, query, location, max_results=10):
+        return self.search(['ProgramaThor'], query, location, max_results)
 
     def search_gupy(self, query, location, max_results=10):
-        jobs = []
-        try:
-            # Gupy API endpoint
-            api_url = "https://portal.api.gupy.io/api/v1/jobs"
-            params = {
-                'jobName': query,
-                'city': location,
-                'limit': max_results,
-                'offset': 0
-            }
-            
-            response = self.session.get(api_url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                for job in data.get('data', []):
-                    jobs.append({
-                        'title': job.get('name'),
-                        'company': job.get('company', {}).get('name'),
-                        'location': f"{job.get('city', '')}, {job.get('state', '')}",
-                        'remote': job.get('workplaceType', 'Não especificado'),
-                        'url': f"https://portal.gupy.io/job/{job.get('id')}",
-                        'skills': job.get('requirements', 'Não especificado'),
-                        'source': 'Gupy'
-                    })
-        except Exception as e:
-            print(f"Error in Gupy search: {e}")
-        return jobs
+        return self.search(['Gupy'], query, location, max_results)
 
     def search_custom_url(self, url, max_results=10):
         jobs = []
@@ -273,24 +247,22 @@ class AdvancedJobTracker:
         self.details_text.delete('1.0', tk.END)
         
         def search_thread():
-            all_jobs = []
             active_sources = [source for source, var in self.source_vars.items() if var.get()]
-            progress_step = 100 / len(active_sources)
+            engine_sources = [source for source in active_sources if source in APIJobSearcher.SOURCE_KEYS]
             
             try:
-                for i, source in enumerate(active_sources):
-                    self.status_var.set(f"Buscando em {source}...")
-                    
-                    if source == 'ProgramaThor':
-                        jobs = self.job_searcher.search_programathor(keywords, location, max_results)
-                    elif source == 'Gupy':
-                        jobs = self.job_searcher.search_gupy(keywords, location, max_results)
-                    elif source == 'URL Personalizada' and custom_url:
-                        jobs = self.job_searcher.search_custom_url(custom_url, max_results)
-                    
-                    all_jobs.extend(jobs)
-                    self.progress_var.set((i + 1) * progress_step)
+                self.status_var.set(f"Buscando em {', '.join(active_sources)}...")
+                
+                # ProgramaThor e Gupy são consultados ao mesmo tempo
+                all_jobs = []
+                if engine_sources:
+                    all_jobs.extend(self.job_searcher.search(engine_sources, keywords, location, max_results))
+                    self.progress_var.set(50)
+                
+                if 'URL Personalizada' in active_sources and custom_url:
+                    all_jobs.extend(self.job_searcher.search_custom_url(custom_url, max_results))
                 
+                self.progress_var.set(100)
                 self.root.after(0, lambda: self.display_results(all_jobs))
                 
             except Exception as e:
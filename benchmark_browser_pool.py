@@ -0,0 +1,88 @@
+import argparse
+import logging
+import statistics
+import time
+from typing import Callable, List
+
+from newsmalltest import JobScraper
+from src.config import settings
+from src.services.browser_pool import BrowserPool
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def build_stage(scraper: JobScraper, keywords: str, location: str, url: str) -> Callable[[], List]:
+    """Busca medida: URL personalizada ou todos os sites do JobScraper"""
+    if url:
+        return lambda: scraper.scrape_custom_url(url)
+    return lambda: scraper.scrape_jobs(keywords, location)
+
+
+def measure(name: str, iterations: int, run: Callable[[], List]):
+    """Executar ``run`` e imprimir p50/p95 e vagas"""
+    latencies = []
+    total_jobs = 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        try:
+            jobs = run() or []
+        except Exception as e:
+            print(f"[X] {name}: {str(e)}")
+            return
+        latencies.append(time.perf_counter() - started)
+        total_jobs += len(jobs)
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000
+    print(f"{name:16} {p50:10.1f} {p95:10.1f} {total_jobs // len(latencies):6d}")
+
+
+def run_benchmark(keywords: str, location: str, url: str, iterations: int, pool_size: int):
+    """Comparar Chromium novo a cada busca com o pool aquecido e as estratégias de espera"""
+    target = url or f"'{keywords}' em '{location}'"
+    print(f"\nBenchmark do pool de navegadores - {target} - {iterations} iterações, pool={pool_size}\n")
+    print(f"{'Modo':16} {'p50 ms':>10} {'p95 ms':>10} {'vagas':>6}")
+
+    # Frio: um navegador novo por busca, como antes do pool
+    def cold():
+        scraper = JobScraper(BrowserPool(size=pool_size), wait_strategy="fixed")
+        try:
+            return build_stage(scraper, keywords, location, url)()
+        finally:
+            scraper.close()
+
+    measure("frio/fixed", iterations, cold)
+
+    # Quente: o mesmo navegador e contextos em todas as buscas, comparando a
+    # espera fixa (networkidle + rolagens) com a espera adaptativa
+    pool = BrowserPool(size=pool_size)
+    try:
+        pool.run(pool.start())
+        for strategy in ("fixed", "adaptive"):
+            scraper = JobScraper(pool, wait_strategy=strategy)
+            measure(f"quente/{strategy}", iterations, build_stage(scraper, keywords, location, url))
+            if scraper.site_timings:
+                timings = ", ".join(f"{site} {seconds * 1000:.0f} ms" for site, seconds in scraper.site_timings.items())
+                print(f"{'':16} por site (última): {timings}")
+    finally:
+        pool.shutdown()
+
+    print(f"\nInicialização do Chromium: {pool.startup_seconds * 1000:.1f} ms")
+    print(f"Navegadores iniciados: {pool.launches} | contextos reciclados: {pool.recycled}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do pool de navegadores (frio vs. quente)")
+    parser.add_argument("keywords", nargs="?", default="python developer", help="Palavras-chave para busca")
+    parser.add_argument("location", nargs="?", default="New York", help="Localização")
+    parser.add_argument("--url", help="Medir scrape_custom_url nesta URL em vez dos sites padrão")
+    parser.add_argument("--iterations", "-n", type=int, default=5, help="Iterações por modo")
+    parser.add_argument("--pool-size", type=int, default=settings.browser.pool_size, help="Contextos no pool")
+
+    args = parser.parse_args()
+    run_benchmark(args.keywords, args.location, args.url, args.iterations, args.pool_size)
@@ -0,0 +1,178 @@
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+import re
+
+from forth_v import JobSearcher
+from src.services.extraction import HYBRID_TERMS, REMOTE_TERMS, JobText, RequirementsExtractor, SkillExtractor, is_remote
+
+FILLER = (
+    "Estamos buscando profissionais para integrar nosso time de segurança da informação. "
+    "You will work with cross-functional teams to assess risks and improve our security posture. "
+    "Oferecemos plano de saúde, vale refeição e horário flexível. "
+    "The ideal candidate is curious, communicates clearly and enjoys solving hard problems. "
+)
+
+
+def build_corpus(skills: List[str], levels: Dict[str, List[str]], count: int, words: int, seed: int) -> List[str]:
+    """Descrições sintéticas com habilidades e níveis espalhados no texto"""
+    rng = random.Random(seed)
+    filler = FILLER.split()
+    terms = skills + [term for keywords in levels.values() for term in keywords]
+    corpus = []
+    for _ in range(count):
+        tokens = [rng.choice(filler) for _ in range(words)]
+        for _ in range(max(1, words // 40)):
+            tokens.insert(rng.randrange(len(tokens)), rng.choice(terms).upper() if rng.random() < 0.3 else rng.choice(terms))
+        corpus.append(" ".join(tokens))
+    return corpus
+
+
+def naive_extract(skills: List[str], levels: Dict[str, List[str]]) -> Callable[[str], Dict]:
+    """Varredura original: uma busca de substring por termo"""
+    def extract(text: str) -> Dict:
+        text_lower = text.lower()
+        level = None
+        for name, keywords in levels.items():
+            if any(keyword in text_lower for keyword in keywords):
+                level = name
+                break
+        return {"skills": [skill for skill in skills if skill.lower() in text_lower], "level": level}
+    return extract
+
+
+SECTIONS = [
+    "Requisitos:\n- Python\n- Experiência com pentest em aplicações web\n- Inglês intermediário\n\n",
+    "Requirements:\n- 3+ years of offensive security experience\n- OSCP or equivalent\n\n",
+    "Diferenciais: Kubernetes, Terraform e AWS\n",
+    "Nice to have\n- Bug bounty track record\n\n",
+    "Benefícios:\n- Vale refeição\n- Plano de saúde\n\n",
+]
+
+
+def build_long_corpus(count: int, words: int, seed: int) -> List[str]:
+    """Descrições longas com seções de requisitos no meio do texto"""
+    rng = random.Random(seed)
+    filler = FILLER.split()
+    corpus = []
+    for _ in range(count):
+        paragraphs = []
+        for _ in range(max(1, words // 80)):
+            paragraphs.append(" ".join(rng.choice(filler) for _ in range(80)) + "\n\n")
+            if rng.random() < 0.4:
+                paragraphs.append(rng.choice(SECTIONS))
+        corpus.append("".join(paragraphs))
+    return corpus
+
+
+def naive_requirements(description: str) -> str:
+    """Extração original do newsmalltest: seis regex sobre o texto em minúsculas"""
+    if not description:
+        return ''
+    requirement_patterns = [
+        r'requisitos:.*?(?=\n|$)',
+        r'requirements:.*?(?=\n|$)',
+        r'necessário:.*?(?=\n|$)',
+        r'perfil:.*?(?=\n|$)',
+        r'qualificações:.*?(?=\n|$)',
+        r'experiência.*?(?=\n|$)'
+    ]
+    requirements = []
+    for pattern in requirement_patterns:
+        for match in re.finditer(pattern, description.lower(), re.IGNORECASE | re.MULTILINE):
+            requirements.append(match.group(0))
+    return ' | '.join(requirements) if requirements else ''
+
+
+def measure(name: str, run: Callable[[], List], descriptions: int, megabytes: float):
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f"{name:22} {elapsed * 1000:10.1f} {descriptions / elapsed:12.0f} {megabytes / elapsed:8.2f}")
+
+
+def run_benchmark(count: int, words: int, extra_terms: int, seed: int):
+    """Comparar a varredura por termo com o autômato, com e sem termos extras"""
+    searcher = JobSearcher()
+    skills = list(searcher.common_pentesting_skills)
+    levels = searcher.level_keywords
+    # Taxonomia maior, como a de um usuário com muitas habilidades cadastradas
+    skills += [f"tool{index}" for index in range(extra_terms)]
+
+    corpus = build_corpus(searcher.common_pentesting_skills, levels, count, words, seed)
+    megabytes = sum(len(text.encode("utf-8")) for text in corpus) / 1024 / 1024
+
+    naive = naive_extract(skills, levels)
+    started = time.perf_counter()
+    extractor = SkillExtractor(skills, levels)
+    extractor.matcher.build()
+    build_ms = (time.perf_counter() - started) * 1000
+
+    print(f"\n{count} descrições de ~{words} palavras ({megabytes:.1f} MB), {len(skills)} habilidades")
+    print(f"Autômato: {len(extractor.matcher)} termos compilados em {build_ms:.1f} ms\n")
+    print(f"{'Método':22} {'total ms':>10} {'descrições/s':>12} {'MB/s':>8}")
+    measure("substring por termo", lambda: [naive(text) for text in corpus], count, megabytes)
+    measure("autômato (batch)", lambda: extractor.extract_batch(corpus), count, megabytes)
+
+
+def run_requirements_benchmark(count: int, words: int, seed: int):
+    """Comparar as seis regex originais com o extrator de passada única"""
+    corpus = build_long_corpus(count, words, seed)
+    megabytes = sum(len(text.encode("utf-8")) for text in corpus) / 1024 / 1024
+    extractor = RequirementsExtractor()
+
+    print(f"\nRequisitos: {count} descrições de ~{words} palavras ({megabytes:.1f} MB)\n")
+    print(f"{'Método':22} {'total ms':>10} {'descrições/s':>12} {'MB/s':>8}")
+    measure("seis regex", lambda: [naive_requirements(text) for text in corpus], count, megabytes)
+    measure("passada única", lambda: [extractor.extract(text) for text in corpus], count, megabytes)
+
+
+def run_pipeline_benchmark(count: int, words: int, seed: int):
+    """Classificadores por vaga: cada um normalizando o texto vs. JobText compartilhado"""
+    searcher = JobSearcher()
+    corpus = build_long_corpus(count, words, seed)
+    jobs = [("Analista de Segurança Sênior", "São Paulo, SP (Remoto)", description) for description in corpus]
+    megabytes = sum(len(description.encode("utf-8")) for description in corpus) / 1024 / 1024
+    skills = SkillExtractor(searcher.common_pentesting_skills, searcher.level_keywords)
+    requirements = RequirementsExtractor()
+    remote_terms = REMOTE_TERMS + HYBRID_TERMS
+
+    def separate():
+        results = []
+        for title, location, description in jobs:
+            # Como antes: cada classificador faz sua própria passada de normalização
+            remote_text = (location + description).lower()
+            remote = any(term in remote_text for term in ["remoto", "remote", "home office", "híbrido", "hybrid"])
+            full_text = f"{title}\n{location}\n{description}"
+            results.append((remote, skills.extract_skills(full_text), skills.detect_level(full_text),
+                            requirements.extract(description)))
+        return results
+
+    def shared():
+        results = []
+        for job in jobs:
+            text = JobText(*job)
+            found = skills.extract(text)
+            results.append((is_remote(text, remote_terms), found["skills"], found["level"], requirements.extract(text)))
+        return results
+
+    print(f"\nPipeline por vaga (remoto, habilidades, nível, requisitos): {count} vagas ({megabytes:.1f} MB)\n")
+    print(f"{'Método':22} {'total ms':>10} {'vagas/s':>12} {'MB/s':>8}")
+    measure("passadas separadas", separate, count, megabytes)
+    measure("JobText compartilhado", shared, count, megabytes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark da extração de habilidades, senioridade e requisitos")
+    parser.add_argument("--descriptions", "-n", type=int, default=2000, help="Quantidade de descrições")
+    parser.add_argument("--words", type=int, default=400, help="Palavras por descrição")
+    parser.add_argument("--extra-terms", type=int, default=500, help="Habilidades extras na taxonomia")
+    parser.add_argument("--long-words", type=int, default=3000, help="Palavras por descrição longa (requisitos)")
+    parser.add_argument("--seed", type=int, default=42)
+
+    args = parser.parse_args()
+    run_benchmark(args.descriptions, args.words, args.extra_terms, args.seed)
+    run_requirements_benchmark(args.descriptions // 4, args.long_words, args.seed)
+    run_pipeline_benchmark(args.descriptions // 4, args.words * 2, args.seed)
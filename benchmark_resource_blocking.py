@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Dict, List
+from urllib.parse import quote_plus
+
+from newsmalltest import JobScraper
+from src.services.browser_pool import BrowserPool
+from src.services.resource_blocking import PAGE_METRICS_JS, ResourceBlocker
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def site_urls(keywords: str, location: str) -> Dict[str, str]:
+    """URLs de busca dos sites do newsmalltest"""
+    # O pool só inicia o navegador no primeiro uso; aqui apenas os sites interessam
+    job_sites = JobScraper(BrowserPool(size=1)).job_sites
+    return {
+        name: info['base_url'].format(quote_plus(keywords), quote_plus(location))
+        for name, info in job_sites.items()
+    }
+
+
+async def measure_playwright(pool: BrowserPool, url: str) -> Dict:
+    """Bytes recebidos (corpo + cabeçalhos) e tempo de carregamento de uma página"""
+    finished = []
+    async with pool.page(url) as page:
+        page.on("requestfinished", finished.append)
+        started = time.perf_counter()
+        await page.goto(url, wait_until="load", timeout=30000)
+        elapsed = (time.perf_counter() - started) * 1000
+        metrics = await page.evaluate(PAGE_METRICS_JS)
+        sizes = await asyncio.gather(*(request.sizes() for request in finished), return_exceptions=True)
+    received = sum(
+        size["responseBodySize"] + size["responseHeadersSize"]
+        for size in sizes if isinstance(size, dict)
+    )
+    return {"bytes": received, "requests": len(finished), "load_ms": metrics["load_ms"] or elapsed}
+
+
+def measure_selenium(manager, url: str) -> Dict:
+    """Mesma medição via WebDriver (bytes pela Resource Timing API)"""
+    with manager.driver(url) as driver:
+        started = time.perf_counter()
+        driver.get(url)
+        elapsed = (time.perf_counter() - started) * 1000
+        metrics = driver.execute_script(f"return ({PAGE_METRICS_JS})()")
+    return {"bytes": metrics["bytes"], "requests": metrics["requests"], "load_ms": metrics["load_ms"] or elapsed}
+
+
+def run_benchmark(keywords: str, location: str, urls: List[str], engine: str, iterations: int):
+    """Comparar bytes e tempo de carregamento com e sem bloqueio, por site"""
+    targets = {url: url for url in urls} if urls else site_urls(keywords, location)
+
+    print(f"\nBloqueio de recursos ({engine}) - {iterations} iterações por site\n")
+    print(f"{'Site':12} {'bloqueio':>8} {'KB':>10} {'reqs':>6} {'load ms':>10}")
+
+    for enabled in (False, True):
+        blocker = ResourceBlocker(enabled=enabled)
+        if engine == "selenium":
+            from src.services.webdriver_manager import WebDriverManager
+            runner = WebDriverManager(pool_size=1, max_browsers=1, blocker=blocker)
+            measure = lambda url: measure_selenium(runner, url)
+        else:
+            runner = BrowserPool(size=1, blocker=blocker)
+            measure = lambda url: runner.run(measure_playwright(runner, url))
+
+        try:
+            if engine == "selenium":
+                # Drivers aquecidos antes de medir: a inicialização não entra no tempo de carga
+                runner.warm()
+            for name, url in targets.items():
+                results = []
+                for _ in range(iterations):
+                    try:
+                        results.append(measure(url))
+                    except Exception as e:
+                        print(f"[X] {name}: {str(e)}")
+                        break
+                if not results:
+                    continue
+                kb = statistics.median(r["bytes"] for r in results) / 1024
+                requests_count = statistics.median(r["requests"] for r in results)
+                load_ms = statistics.median(r["load_ms"] for r in results)
+                print(f"{name[:12]:12} {'on' if enabled else 'off':>8} {kb:10.1f} {requests_count:6.0f} {load_ms:10.1f}")
+        finally:
+            if engine == "selenium":
+                runner.close()
+            else:
+                runner.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do bloqueio de recursos nos navegadores headless")
+    parser.add_argument("keywords", nargs="?", default="python developer", help="Palavras-chave para busca")
+    parser.add_argument("location", nargs="?", default="New York", help="Localização")
+    parser.add_argument("--url", action="append", default=[], help="Medir estas URLs em vez dos sites padrão")
+    parser.add_argument("--engine", choices=["playwright", "selenium"], default="playwright")
+    parser.add_argument("--iterations", "-n", type=int, default=3, help="Iterações por site")
+
+    args = parser.parse_args()
+    run_benchmark(args.keywords, args.location, args.url, args.engine, args.iterations)
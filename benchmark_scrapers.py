@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from src.config import settings
+from src.database.db import Database
+from src.models.job import JobSearch
+from src.scrapers.linkedin import LinkedInScraper
+from src.services.adzuna_client import AdzunaClient
+from src.services.enrichment import EnrichmentQueue
+from src.services.job_scraper import JobScraper
+from src.services.job_service_async import AsyncJobService
+from src.services.http_fixtures import FixtureStore, http_fixtures
+from src.services.quota import QuotaBudget
+from src.services.shared_state import SharedCache, SharedState, SingleFlight
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+def build_stages(keywords: str, location: str) -> Dict[str, Callable[[], List]]:
+    """Estágios do pipeline medidos pelo benchmark"""
+    adzuna = AdzunaClient()  # loop próprio: as conexões são reaproveitadas entre iterações
+    linkedin = LinkedInScraper()
+    job_scraper = JobScraper()
+
+    # Serviço com banco e estado temporários para não afetar a cota nem o jobs.db reais;
+    # o banco é recriado a cada execução
+    state_file = Path(tempfile.gettempdir()) / "benchmark_state.db"
+    for path in state_file.parent.glob(f"{state_file.name}*"):
+        path.unlink()
+    service = AsyncJobService()
+    service.db = Database(str(state_file))
+    service.enrichment = EnrichmentQueue(service.db, service.engine)
+    service.state = SharedState(service.db)
+    service.results = SharedCache(service.state, "results")
+    service.singleflight = SingleFlight(service.state)
+    service.quota = QuotaBudget(service.state, daily_limit=10 ** 9, user_share=1.0)
+
+    search = JobSearch(keywords=keywords, location=location, sources=["adzuna"])
+
+    return {
+        "AdzunaClient.search_jobs": lambda: adzuna.search_jobs(what=keywords, where=location),
+        "LinkedInScraper.search_jobs": lambda: asyncio.run(
+            linkedin.search_jobs(keywords=keywords, location=location)
+        ),
+        "JobScraper.scrape_site": lambda: job_scraper.scrape_site(
+            "LinkedIn", settings.SITE_CONFIGS["LinkedIn"], keywords, location
+        ),
+        "AsyncJobService.search_jobs": lambda: asyncio.run(
+            # Sem o cache de resultados: cada iteração passa pelo pipeline inteiro
+            service.search_jobs(search, "benchmark", use_cache=False)
+        ),
+    }
+
+
+def run_benchmark(keywords: str, location: str, mode: str, iterations: int, fixtures_dir: str, version: str):
+    """Executar cada estágio e imprimir latência e vazão"""
+    store = FixtureStore(fixtures_dir, version)
+    stages = build_stages(keywords, location)
+
+    # Gravação: uma única execução por estágio contra a internet
+    if mode == "record":
+        iterations = 1
+
+    print(f"\nBenchmark ({mode}) - '{keywords}' em '{location}' - {iterations} iterações")
+    print(f"Fixtures: {store.root}\n")
+    print(f"{'Estágio':32} {'p50 ms':>9} {'p95 ms':>9} {'transp. ms':>11} {'vagas':>6} {'vagas/s':>9}")
+
+    with http_fixtures(mode, store) as harness:
+        for name, stage in stages.items():
+            latencies = []
+            transport = []
+            total_jobs = 0
+
+            for _ in range(iterations):
+                harness.stats.reset()
+                started = time.perf_counter()
+                try:
+                    jobs = stage() or []
+                except Exception as e:
+                    print(f"[X] {name}: {str(e)}")
+                    break
+                latencies.append(time.perf_counter() - started)
+                transport.append(harness.stats.seconds)
+                total_jobs += len(jobs)
+
+            if not latencies:
+                continue
+
+            latencies.sort()
+            p50 = statistics.median(latencies) * 1000
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000
+            transport_ms = statistics.median(transport) * 1000
+            throughput = total_jobs / sum(latencies) if sum(latencies) else 0.0
+            print(
+                f"{name:32} {p50:9.2f} {p95:9.2f} {transport_ms:11.2f} "
+                f"{total_jobs // len(latencies):6d} {throughput:9.1f}"
+            )
+
+    if harness.missing:
+        print(f"\n[X] {len(harness.missing)} requisições sem fixture. Rode com --mode record primeiro.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dos scrapers com fixtures gravadas")
+    parser.add_argument("keywords", help="Palavras-chave para busca")
+    parser.add_argument("location", help="Localização")
+    parser.add_argument("--mode", choices=["record", "replay"], default="replay",
+                        help="record grava as respostas reais, replay roda offline")
+    parser.add_argument("--iterations", "-n", type=int, default=20, help="Iterações por estágio")
+    parser.add_argument("--fixtures-dir", default=settings.fixtures.directory, help="Diretório das fixtures")
+    parser.add_argument("--fixtures-version", default=settings.fixtures.version, help="Versão das fixtures")
+
+    args = parser.parse_args()
+    run_benchmark(args.keywords, args.location, args.mode, args.iterations,
+                  args.fixtures_dir, args.fixtures_version)
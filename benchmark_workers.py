@@ -0,0 +1,167 @@
+import asyncio
+import argparse
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import aiohttp
+
+from src.database.db import Database
+from src.models.job import Job, JobSearch
+from src.services.job_service_async import AsyncJobService
+from src.services.shared_state import SharedCache, SharedState
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay"]
+SOURCES = ["Gupy", "ProgramaThor", "Vagas.com", "LinkedIn"]
+
+
+def seed(db_path: str, keywords: str, location: str, sources: List[str], count: int) -> str:
+    """Gravar vagas sintéticas e publicar a busca no cache compartilhado
+
+    Assim todos os workers servem a mesma busca sem acessar a internet; sem
+    o cache compartilhado cada worker começaria frio e faria a busca real.
+    """
+    rng = random.Random(42)
+    db = Database(db_path)
+    search = JobSearch(keywords=keywords, location=location, sources=sources)
+    jobs = [
+        Job(
+            title=f"{keywords} {index}",
+            company=rng.choice(COMPANIES),
+            location=location,
+            description=f"Vaga {index} para {keywords}. " * 20,
+            url=f"https://example.com/vagas/{index}",
+            source=rng.choice(SOURCES),
+            remote=rng.random() < 0.4,
+            salary=f"R$ {rng.randrange(3, 20)}.000/mês",
+        )
+        for index in range(count)
+    ]
+    db.save_jobs(jobs, search.search_id, search.scraper_version)
+    cache = SharedCache(SharedState(db), "results")
+    cache.set(
+        AsyncJobService.result_key(search),
+        {"search_id": search.search_id, "jobs": [job.model_dump(mode="json") for job in jobs]},
+        ttl=24 * 3600
+    )
+    return search.search_id
+
+
+def start_server(workers: int, port: int, db_path: str) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        DATABASE_URL=db_path,
+        SCHEDULER_ENABLED="False",
+        ENRICHMENT_ENABLED="False",
+        API_USAGE_FILE=str(Path(db_path).with_suffix(".json")),
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL  # o main.py registra cada busca em INFO
+    )
+
+
+async def wait_ready(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(f"{url}/api/jobs/usage") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("Servidor não respondeu")
+
+
+async def load(url: str, params: Dict, requests: int, concurrency: int) -> Dict:
+    """Disparar ``requests`` buscas com ``concurrency`` clientes simultâneos"""
+    latencies: List[float] = []
+    search_ids = set()
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def client(session: aiohttp.ClientSession):
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                async with session.post(f"{url}/api/jobs/search", params=params) as response:
+                    body = await response.json()
+                    if response.status != 200:
+                        errors += 1
+                        continue
+                    search_ids.add(body["search_id"])
+            except aiohttp.ClientError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+        await asyncio.gather(*(client(session) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000 if latencies else 0.0,
+        "errors": errors,
+        "search_ids": search_ids,
+    }
+
+
+def run_benchmark(keywords: str, location: str, workers: List[int], requests: int, concurrency: int,
+                  jobs: int, port: int):
+    """Medir a vazão do servidor com 1..N workers sobre o mesmo estado compartilhado"""
+    db_path = str(Path(tempfile.mkdtemp()) / "benchmark_workers.db")
+    sources = ["gupy"]
+    search_id = seed(db_path, keywords, location, sources, jobs)
+    url = f"http://127.0.0.1:{port}"
+    params = {"keywords": keywords, "location": location, "sources": sources, "limit": "50"}
+
+    print(f"\n{jobs} vagas, {requests} buscas por rodada, {concurrency} clientes simultâneos ({os.cpu_count()} CPUs)")
+    print(f"{'workers':>8} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'erros':>6}  cache compartilhado")
+    baseline = None
+    for count in workers:
+        server = start_server(count, port, db_path)
+        try:
+            asyncio.run(wait_ready(url))
+            asyncio.run(load(url, params, min(requests, concurrency * 2), concurrency))  # aquecimento
+            result = asyncio.run(load(url, params, requests, concurrency))
+        finally:
+            server.terminate()
+            server.wait()
+
+        baseline = baseline or result["rps"]
+        shared = "sim" if result["search_ids"] == {search_id} else f"não ({len(result['search_ids'])} buscas)"
+        print(
+            f"{count:8d} {result['rps']:9.1f} {result['p50']:9.2f} {result['p95']:9.2f} "
+            f"{result['errors']:6d}  {shared}  (x{result['rps'] / baseline:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Teste de carga do servidor com vários workers")
+    parser.add_argument("keywords", nargs="?", default="python developer", help="Palavras-chave da busca")
+    parser.add_argument("location", nargs="?", default="São Paulo", help="Localização")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Quantidades de workers")
+    parser.add_argument("--requests", "-n", type=int, default=500, help="Buscas por rodada")
+    parser.add_argument("--concurrency", "-c", type=int, default=32, help="Clientes simultâneos")
+    parser.add_argument("--jobs", type=int, default=200, help="Vagas sintéticas na busca")
+    parser.add_argument("--port", type=int, default=8765)
+
+    args = parser.parse_args()
+    run_benchmark(args.keywords, args.location, args.workers, args.requests, args.concurrency,
+                  args.jobs, args.port)
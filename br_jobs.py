@@ -1,130 +1,46 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import requests
-from bs4 import BeautifulSoup
 import threading
-import json
-from urllib.parse import quote, urlencode
-import time
-import random
+
+from src.scrapers.engine import SourceEngine
 
 class BrazilianJobSearcher:
+    # Fontes exibidas na interface -> fontes registradas no SourceEngine
+    SOURCE_KEYS = {
+        'Vagas.com.br': 'vagas',
+        'InfoJobs': 'infojobs',
+        'Catho': 'catho'
+    }
+
     def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-        }
-        
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.engine = SourceEngine()
+
+    def search(self, sources, query, location, max_results=10):
+        """Search the selected sources concurrently"""
+        keys = [self.SOURCE_KEYS[source] for source in sources]
+        results = self.engine.search_sync(query, location, keys, max_results)
+        return [
+            {
+                'title': job.title,
+                'company': job.company,
+                'location': job.location,
+                'url': job.url,
+                'source': job.source
+            }
+            for key in keys for job in results.get(key, [])
+        ]
 
     def search_vagas(self, query, location):
         """Search jobs on Vagas.com.br"""
-        jobs = []
-        try:
-            # Vagas.com.br search URL
-            url = f"https://www.vagas.com.br/vagas-de-{quote(query.replace(' ', '-'))}?onde={quote(location)}"
-            response = self.session.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all('li', class_='vaga')
-                
-                for card in job_cards[:10]:
-                    try:
-                        title = card.find('a', class_='link-detalhes-vaga')
-                        company = card.find('span', class_='emprVaga')
-                        location = card.find('span', class_='local')
-                        
-                        if title and company:
-                            job_url = f"https://www.vagas.com.br{title['href']}"
-                            jobs.append({
-                                'title': title.get_text(strip=True),
-                                'company': company.get_text(strip=True),
-                                'location': location.get_text(strip=True) if location else '',
-                                'url': job_url,
-                                'source': 'Vagas.com.br'
-                            })
-                    except Exception as e:
-                        print(f"Error processing Vagas.com.br job: {e}")
-                        continue
-                        
-        except Exception as e:
-            print(f"Error searching Vagas.com.br: {e}")
-        return jobs
+        return self.search(['Vagas.com.br'], query, location)
 
     def search_infojobs(self, query, location):
         """Search jobs on InfoJobs"""
-        jobs = []
-        try:
-            # InfoJobs search URL
-            url = f"https://www.infojobs.com.br/empregos.aspx?palabra={quote(query)}&ubicacion={quote(location)}"
-            response = self.session.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all('div', class_='vaga')
-                
-                for card in job_cards[:10]:
-                    try:
-                        title = card.find('h2', class_='vaga-title')
-                        company = card.find('span', class_='company-name')
-                        location = card.find('span', class_='location')
-                        link = card.find('a', class_='vaga-link')
-                        
-                        if title and company and link:
-                            job_url = f"https://www.infojobs.com.br{link['href']}"
-                            jobs.append({
-                                'title': title.get_text(strip=True),
-                                'company': company.get_text(strip=True),
-                                'location': location.get_text(strip=True) if location else '',
-                                'url': job_url,
-                                'source': 'InfoJobs'
-                            })
-                    except Exception as e:
-                        print(f"Error processing InfoJobs job: {e}")
-                        continue
-                        
-        except Exception as e:
-            print(f"Error searching InfoJobs: {e}")
-        return jobs
+        return self.search(['InfoJobs'], query, location)
 
     def search_catho(self, query, location):
         """Search jobs on Catho"""
-        jobs = []
-        try:
-            # Catho search URL
-            url = f"https://www.catho.com.br/vagas/{quote(query)}/{quote(location)}/"
-            response = self.session.get(url, headers=self.headers)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all('div', class_='job-card')
-                
-                for card in job_cards[:10]:
-                    try:
-                        title = card.find('h2', class_='job-title')
-                        company = card.find('div', class_='company-name')
-                        location = card.find('div', class_='location')
-                        link = card.find('a', class_='job-link')
-                        
-                        if title and link:
-                            job_url = f"https://www.catho.com.br{link['href']}"
-                            jobs.append({
-                                'title': title.get_text(strip=True),
-                                'company': company.get_text(strip=True) if company else 'Empresa Confidencial',
-                                'location': location.get_text(strip=True) if location else '',
-                                'url': job_url,
-                                'source': 'Catho'
-                            })
-                    except Exception as e:
-                        print(f"Error processing Catho job: {e}")
-                        continue
-                        
-        except Exception as e:
-            print(f"Error searching Catho: {e}")
-        return jobs
+        return self.search(['Catho'], query, location)
 
 class BrazilianJobTracker:
     def __init__(self, root):
@@ -203,24 +119,13 @@ class BrazilianJobTracker:
         self.results_text.delete("1.0", tk.END)
         
         def search_thread():
-            all_jobs = []
             active_sources = [source for source, var in self.source_vars.items() if var.get()]
-            progress_step = 100 / len(active_sources)
             
             try:
-                for i, source in enumerate(active_sources):
-                    self.status_var.set(f"Buscando em {source}...")
-                    
-                    if source == 'Vagas.com.br':
-                        jobs = self.job_searcher.search_vagas(keywords, location)
-                    elif source == 'InfoJobs':
-                        jobs = self.job_searcher.search_infojobs(keywords, location)
-                    elif source == 'Catho':
-                        jobs = self.job_searcher.search_catho(keywords, location)
-                    
-                    all_jobs.extend(jobs)
-                    self.progress_var.set((i + 1) * progress_step)
-                    time.sleep(1)  # Prevent overwhelming the sites
+                # Todas as fontes são consultadas ao mesmo tempo
+                self.status_var.set(f"Buscando em {', '.join(active_sources)}...")
+                all_jobs = self.job_searcher.search(active_sources, keywords, location)
+                self.progress_var.set(100)
                 
                 self.root.after(0, lambda: self.display_results(all_jobs))
                 
@@ -1,114 +1,43 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import requests
-from bs4 import BeautifulSoup
 import threading
-import json
-from urllib.parse import quote
-import time
+
+from src.scrapers.engine import SourceEngine
 
 class BrazilianJobSearch:
+    # Sites exibidos na interface -> fontes registradas no SourceEngine
+    SOURCE_KEYS = {
+        'Vagas.com.br': 'vagas',
+        'Trabalha Brasil': 'trabalhabrasil',
+        'Indeed': 'indeed_br'
+    }
+
     def __init__(self):
-        self.session = requests.Session()
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0',
-            'Accept': 'text/html,application/json,*/*',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7'
-        }
-        self.session.headers.update(self.headers)
+        self.engine = SourceEngine()
+
+    def search(self, sites, query, location, max_results=20):
+        # Busca concorrente em todos os sites selecionados
+        keys = [self.SOURCE_KEYS[site] for site in sites]
+        results = self.engine.search_sync(query, location, keys, max_results)
+        return [
+            {
+                'title': job.title,
+                'company': job.company,
+                'location': job.location,
+                'url': job.url,
+                'source': job.source
+            }
+            for key in keys for job in results.get(key, [])
+        ]
 
     def search_vagas_com_br(self, query, location):
-        jobs = []
-        try:
-            # Usando a API real do Vagas.com.br
-            api_url = f"https://www.vagas.com.br/pesquisa/{quote(query)}"
-            params = {'onde': location}
-            response = self.session.get(api_url, params=params)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                cards = soup.find_all('li', class_=['vaga', 'vaga-container'])
-                
-                for card in cards:
-                    title_elem = card.find(['a', 'h2'], class_=['link-detalhes-vaga', 'cargo'])
-                    company_elem = card.find(['span', 'div'], class_=['emprVaga', 'empresa'])
-                    location_elem = card.find(['span', 'div'], class_=['local', 'localizacao'])
-                    
-                    if title_elem:
-                        url = f"https://www.vagas.com.br{title_elem.get('href', '')}"
-                        jobs.append({
-                            'title': title_elem.text.strip(),
-                            'company': company_elem.text.strip() if company_elem else 'Empresa Confidencial',
-                            'location': location_elem.text.strip() if location_elem else location,
-                            'url': url,
-                            'source': 'Vagas.com.br'
-                        })
-        except Exception as e:
-            print(f"Erro Vagas.com.br: {e}")
-        return jobs
+        return self.search(['Vagas.com.br'], query, location)
 
     def search_trabalhabrasil(self, query, location):
-        jobs = []
-        try:
-            # URL otimizada do Trabalha Brasil
-            url = f"https://www.trabalhabrasil.com.br/api/v1.0/job-search"
-            params = {
-                'q': query,
-                'city': location,
-                'page': 1,
-                'perPage': 20
-            }
-            
-            response = self.session.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                for job in data.get('jobs', []):
-                    jobs.append({
-                        'title': job.get('title'),
-                        'company': job.get('company'),
-                        'location': f"{job.get('city')}, {job.get('state')}",
-                        'url': f"https://www.trabalhabrasil.com.br/vaga/{job.get('slug')}",
-                        'source': 'Trabalha Brasil'
-                    })
-        except Exception as e:
-            print(f"Erro Trabalha Brasil: {e}")
-        return jobs
+        return self.search(['Trabalha Brasil'], query, location)
 
     def search_indeed(self, query, location):
-        jobs = []
-        try:
-            # Indeed Brasil API
-            url = "https://br.indeed.com/jobs"
-            params = {
-                'q': query,
-                'l': location,
-                'sort': 'date',
-                'fromage': 7
-            }
-            
-            response = self.session.get(url, params=params)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                cards = soup.find_all('div', class_='job_seen_beacon')
-                
-                for card in cards:
-                    title_elem = card.find(['h2', 'a'], class_=['jobTitle', 'title'])
-                    company_elem = card.find(['span', 'div'], class_=['company', 'companyName'])
-                    location_elem = card.find(['div'], class_=['companyLocation'])
-                    
-                    if title_elem:
-                        job_id = card.get('data-jk', '')
-                        url = f"https://br.indeed.com/viewjob?jk={job_id}"
-                        jobs.append({
-                            'title': title_elem.text.strip(),
-                            'company': company_elem.text.strip() if company_elem else 'Empresa não informada',
-                            'location': location_elem.text.strip() if location_elem else location,
-                            'url': url,
-                            'source': 'Indeed'
-                        })
-        except Exception as e:
-            print(f"Erro Indeed: {e}")
-        return jobs
+        return self.search(['Indeed'], query, location)
 
 class CompactJobTracker:
     def __init__(self, root):
@@ -238,24 +167,13 @@ class CompactJobTracker:
         self.progress['value'] = 0
         
         def search_thread():
-            all_jobs = []
             active_sites = [site for site, var in self.sites_vars.items() if var.get()]
-            progress_step = 100 / len(active_sites)
             
             try:
-                for i, site in enumerate(active_sites):
-                    self.status_var.set(f"Buscando em {site}...")
-                    
-                    if site == 'Vagas.com.br':
-                        jobs = self.job_searcher.search_vagas_com_br(keywords, location)
-                    elif site == 'Trabalha Brasil':
-                        jobs = self.job_searcher.search_trabalhabrasil(keywords, location)
-                    elif site == 'Indeed':
-                        jobs = self.job_searcher.search_indeed(keywords, location)
-                    
-                    all_jobs.extend(jobs)
-                    self.progress['value'] = (i + 1) * progress_step
-                    time.sleep(1)  # Evitar sobrecarga
+                # Sites consultados ao mesmo tempo pelo SourceEngine
+                self.status_var.set(f"Buscando em {', '.join(active_sites)}...")
+                all_jobs = self.job_searcher.search(active_sites, keywords, location)
+                self.progress['value'] = 100
                 
                 self.root.after(0, lambda: self.display_results(all_jobs))
                 
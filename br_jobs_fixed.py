@@ -1,130 +1,43 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import requests
-from bs4 import BeautifulSoup
 import threading
-import json
-from urllib.parse import quote, urlencode
-import time
+
+from src.scrapers.engine import SourceEngine
 
 class JobSearcher:
+    # Sites exibidos na interface -> fontes registradas no SourceEngine
+    SOURCE_KEYS = {
+        'LinkedIn': 'linkedin',
+        'Gupy': 'gupy',
+        'Vagas.com.br': 'vagas'
+    }
+
     def __init__(self):
-        self.session = requests.Session()
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7'
-        }
-        self.session.headers.update(self.headers)
+        self.engine = SourceEngine()
 
-    def search_linkedin(self, query, location):
-        jobs = []
-        try:
-            # LinkedIn search URL
-            base_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-            params = {
-                'keywords': query,
-                'location': location,
-                'geoId': '',
-                'trk': 'public_jobs_jobs-search-bar_search-submit',
-                'start': 0
+    def search(self, sites, query, location, max_results=20):
+        # Busca concorrente em todos os sites selecionados
+        keys = [self.SOURCE_KEYS[site] for site in sites]
+        results = self.engine.search_sync(query, location, keys, max_results)
+        return [
+            {
+                'title': job.title,
+                'company': job.company,
+                'location': job.location,
+                'url': job.url,
+                'source': job.source
             }
-            
-            response = self.session.get(base_url, params=params)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all('div', class_='base-card')
-                
-                for card in job_cards:
-                    try:
-                        title = card.find('h3', class_='base-search-card__title')
-                        company = card.find('h4', class_='base-search-card__subtitle')
-                        location = card.find('span', class_='job-search-card__location')
-                        link = card.find('a', class_='base-card__full-link')
-                        
-                        if title and link:
-                            jobs.append({
-                                'title': title.get_text(strip=True),
-                                'company': company.get_text(strip=True) if company else 'Empresa não informada',
-                                'location': location.get_text(strip=True) if location else '',
-                                'url': link['href'].split('?')[0],
-                                'source': 'LinkedIn'
-                            })
-                    except Exception as e:
-                        print(f"Erro processando vaga LinkedIn: {e}")
-                        continue
-                        
-        except Exception as e:
-            print(f"Erro na busca LinkedIn: {e}")
-        return jobs
+            for key in keys for job in results.get(key, [])
+        ]
+
+    def search_linkedin(self, query, location):
+        return self.search(['LinkedIn'], query, location)
 
     def search_gupy(self, query, location):
-        jobs = []
-        try:
-            # Gupy API endpoint
-            url = "https://portal.api.gupy.io/api/job"
-            params = {
-                'jobName': query,
-                'cityName': location,
-                'limit': 20,
-                'offset': 0
-            }
-            
-            headers = {
-                **self.headers,
-                'Origin': 'https://portal.gupy.io',
-                'Referer': 'https://portal.gupy.io/'
-            }
-            
-            response = self.session.get(url, params=params, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                for job in data.get('data', []):
-                    jobs.append({
-                        'title': job.get('name', ''),
-                        'company': job.get('company', {}).get('name', 'Empresa não informada'),
-                        'location': f"{job.get('city', '')}, {job.get('state', '')}",
-                        'url': f"https://portal.gupy.io/job/{job.get('id')}",
-                        'source': 'Gupy'
-                    })
-        except Exception as e:
-            print(f"Erro na busca Gupy: {e}")
-        return jobs
+        return self.search(['Gupy'], query, location)
 
     def search_vagas(self, query, location):
-        jobs = []
-        try:
-            # Vagas.com.br search
-            url = f"https://www.vagas.com.br/vagas-de-{quote(query.replace(' ', '-'))}"
-            params = {'onde': location}
-            
-            response = self.session.get(url, params=params)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                job_cards = soup.find_all(['li', 'div'], class_=['vaga', 'vaga-container'])
-                
-                for card in job_cards:
-                    try:
-                        title_elem = card.find(['a', 'h2'], class_=['link-detalhes-vaga', 'cargo'])
-                        company_elem = card.find(['span', 'div'], class_=['emprVaga', 'empresa'])
-                        location_elem = card.find(['span', 'div'], class_='local')
-                        
-                        if title_elem:
-                            url = f"https://www.vagas.com.br{title_elem.get('href', '')}"
-                            jobs.append({
-                                'title': title_elem.get_text(strip=True),
-                                'company': company_elem.get_text(strip=True) if company_elem else 'Empresa Confidencial',
-                                'location': location_elem.get_text(strip=True) if location_elem else location,
-                                'url': url,
-                                'source': 'Vagas.com.br'
-                            })
-                    except Exception as e:
-                        print(f"Erro processando vaga Vagas.com.br: {e}")
-                        continue
-                        
-        except Exception as e:
-            print(f"Erro na busca Vagas.com.br: {e}")
-        return jobs
+        return self.search(['Vagas.com.br'], query, location)
 
 class JobTracker:
     def __init__(self, root):
@@ -233,26 +146,17 @@ class JobTracker:
         self.status_var.set("Iniciando busca...")
         
         def search_thread():
-            all_jobs = []
             active_sites = [site for site, var in self.sites_vars.items() if var.get()]
-            progress_step = 100 / len(active_sites)
             
             try:
-                for i, site in enumerate(active_sites):
-                    self.status_var.set(f"Buscando em {site}...")
-                    print(f"Buscando em {site}...")  # Debug
-                    
-                    if site == 'LinkedIn':
-                        jobs = self.job_searcher.search_linkedin(keywords, location)
-                    elif site == 'Gupy':
-                        jobs = self.job_searcher.search_gupy(keywords, location)
-                    elif site == 'Vagas.com.br':
-                        jobs = self.job_searcher.search_vagas(keywords, location)
-                    
-                    print(f"Encontradas {len(jobs)} vagas em {site}")  # Debug
-                    all_jobs.extend(jobs)
-                    self.progress['value'] = (i + 1) * progress_step
-                    time.sleep(1)  # Prevenir sobrecarga
+                # Sites consultados ao mesmo tempo pelo SourceEngine
+                self.status_var.set(f"Buscando em {', '.join(active_sites)}...")
+                print(f"Buscando em {active_sites}...")  # Debug
+                
+                all_jobs = self.job_searcher.search(active_sites, keywords, location)
+                
+                print(f"Encontradas {len(all_jobs)} vagas")  # Debug
+                self.progress['value'] = 100
                 
                 self.root.after(0, lambda: self.display_results(all_jobs))
                 
@@ -0,0 +1,92 @@
+import asyncio
+import argparse
+import logging
+import multiprocessing
+
+from src.config import settings
+from src.scrapers.sources import available_sources
+from src.services.task_queue import CrawlWorker, TaskQueue
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s'
+)
+
+
+def enqueue(args):
+    queue = TaskQueue()
+    crawl_id = queue.enqueue(
+        args.sources or available_sources(),
+        args.keywords,
+        args.location,
+        range(1, args.pages + 1),
+        args.crawl_id
+    )
+    print(f"[OK] Crawl {crawl_id} enfileirado")
+    print("     Rode 'python crawl.py work' para processar (ou retomar) as tarefas")
+
+
+def _work(concurrency: int, max_pages: int, forever: bool):
+    worker = CrawlWorker(concurrency=concurrency, max_pages=max_pages)
+    asyncio.run(worker.run(stop_when_empty=not forever))
+    print(f"[OK] {worker.owner}: {worker.processed} páginas processadas, {worker.failed} falhas")
+
+
+def work(args):
+    if args.processes <= 1:
+        _work(args.concurrency, args.max_pages, args.forever)
+        return
+    processes = [
+        multiprocessing.Process(target=_work, args=(args.concurrency, args.max_pages, args.forever),
+                                name=f"crawl-{index}")
+        for index in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def status(args):
+    stats = TaskQueue().stats(args.crawl_id)
+    print(f"\nTarefas{' do crawl ' + args.crawl_id if args.crawl_id else ''}:")
+    for state, total in stats.items():
+        print(f"  {state:8} {total:6d}")
+
+
+def retry(args):
+    total = TaskQueue().retry_failed(args.crawl_id)
+    print(f"[OK] {total} tarefas devolvidas para a fila")
+
+
+if __name__ == "__main__":
+    config = settings.crawl
+    parser = argparse.ArgumentParser(description="Crawl em lote com fila persistente e workers retomáveis")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("enqueue", help="Enfileirar as páginas de uma busca")
+    command.add_argument("keywords", help="Palavras-chave para busca")
+    command.add_argument("location", help="Localização")
+    command.add_argument("--sources", nargs="+", help="Fontes (padrão: todas as registradas)")
+    command.add_argument("--pages", type=int, default=1, help="Páginas iniciais por fonte")
+    command.add_argument("--crawl-id", help="Reusar um crawl existente (enfileirar é idempotente)")
+    command.set_defaults(handler=enqueue)
+
+    command = commands.add_parser("work", help="Processar a fila")
+    command.add_argument("--processes", type=int, default=config.processes, help="Processos worker")
+    command.add_argument("--concurrency", type=int, default=config.concurrency, help="Tarefas simultâneas por processo")
+    command.add_argument("--max-pages", type=int, default=config.max_pages, help="Página máxima por fonte")
+    command.add_argument("--forever", action="store_true", help="Continuar esperando novas tarefas")
+    command.set_defaults(handler=work)
+
+    command = commands.add_parser("status", help="Tarefas por estado")
+    command.add_argument("--crawl-id", help="Filtrar por crawl")
+    command.set_defaults(handler=status)
+
+    command = commands.add_parser("retry", help="Devolver tarefas que falharam para a fila")
+    command.add_argument("--crawl-id", help="Filtrar por crawl")
+    command.set_defaults(handler=retry)
+
+    args = parser.parse_args()
+    args.handler(args)
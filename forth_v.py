@@ -4,16 +4,28 @@ import sqlite3
 from datetime import datetime
 import webbrowser
 import requests
-from bs4 import BeautifulSoup
 import json
 import threading
 import re
-from urllib.parse import quote, urlencode
-import time
-import random
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.scrapers.engine import SourceEngine
+from src.scrapers.sources import get_source
+from src.services.extraction import SkillExtractor
+from src.services.rate_limiter import rate_limiter
 
 class JobSearcher:
-    def __init__(self):
+    # Sources shown in the UI -> sources registered in the source engine
+    SOURCE_KEYS = {
+        'LinkedIn': 'linkedin',
+        'Indeed': 'indeed',
+        'Monster': 'monster'
+    }
+
+    def __init__(self, max_workers=6, max_results=10):
+        self.max_workers = max_workers
+        self.max_results = max_results
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -27,6 +39,7 @@ class JobSearcher:
         
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        self.engine = SourceEngine()
         
         self.common_pentesting_skills = [
             "penetration testing", "ethical hacking", "vulnerability assessment",
@@ -43,190 +56,88 @@ class JobSearcher:
             'mid': ['mid level', 'intermediate', '2-5 years', '3-5 years', 'mid-level'],
             'senior': ['senior', 'lead', '5+ years', '6+ years', 'principal', 'architect']
         }
+        
+        # Skills and level terms compiled into one automaton (one scan per description)
+        self.extractor = SkillExtractor(self.common_pentesting_skills, self.level_keywords)
 
     def detect_level(self, text):
-        text_lower = text.lower()
-        for level, keywords in self.level_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return level.capitalize()
-        return "Not Specified"
+        level = self.extractor.detect_level(text)
+        return level.capitalize() if level else "Not Specified"
 
     def extract_skills_from_text(self, text):
-        found_skills = []
-        text_lower = text.lower()
-        for skill in self.common_pentesting_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        return found_skills
+        return self.extractor.extract_skills(text)
 
-    def search_linkedin(self, query, location):
-        jobs = []
+    def analyze_description(self, text):
+        """Level and skills from a single scan of the description"""
+        found = self.extractor.extract(text)
+        level = found['level'].capitalize() if found['level'] else "Not Specified"
+        return level, found['skills']
+
+    def fetch_job_details(self, source, job):
+        """Download one job's detail page and enrich it with level and skills"""
+        description_text = ""
         try:
-            # Using LinkedIn's API-like endpoint
-            params = {
-                'keywords': query,
-                'location': location,
-                'f_TPR': 'r86400',  # Last 24 hours
-                'position': 1,
-                'pageNum': 0,
-                'start': 0
-            }
-            
-            url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(params)}"
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            job_cards = soup.find_all('div', class_='base-card')[:10]
-            
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    link_elem = card.find('a', class_='base-card__full-link')
-                    
-                    if all([title_elem, company_elem, location_elem, link_elem]):
-                        job_url = link_elem['href'].split('?')[0]
-                        
-                        # Get detailed job info
-                        time.sleep(random.uniform(1, 2))  # Random delay to avoid rate limiting
-                        job_response = self.session.get(job_url)
-                        job_soup = BeautifulSoup(job_response.text, 'html.parser')
-                        
-                        description = job_soup.find('div', class_='description__text')
-                        description_text = description.get_text() if description else ""
-                        
-                        level = self.detect_level(description_text)
-                        skills = self.extract_skills_from_text(description_text)
-                        
-                        jobs.append({
-                            'title': title_elem.get_text().strip(),
-                            'company': company_elem.get_text().strip(),
-                            'location': location_elem.get_text().strip(),
-                            'url': job_url,
-                            'skills': ', '.join(skills) if skills else 'No specific skills listed',
-                            'level': level,
-                            'source': 'LinkedIn'
-                        })
-                except Exception as e:
-                    print(f"Error processing LinkedIn job: {e}")
-                    continue
-                    
+            # Paced per host by the shared rate limiter
+            with rate_limiter.limit_sync(job.url):
+                job_response = self.session.get(job.url, timeout=30)
+            # Error pages (404, 429, 5xx) are not job details
+            job_response.raise_for_status()
+            description_text = source.parse_detail(job_response.text)
         except Exception as e:
-            print(f"Error searching LinkedIn: {e}")
-        return jobs
+            print(f"Error fetching {source.label} job details: {e}")
+        
+        level, skills = self.analyze_description(description_text)
+        
+        return {
+            'title': job.title,
+            'company': job.company,
+            'location': job.location,
+            'url': job.url,
+            'skills': ', '.join(skills) if skills else 'No specific skills listed',
+            'level': level,
+            'source': source.label
+        }
 
-    def search_indeed(self, query, location):
-        jobs = []
-        try:
-            # Using Indeed's mobile API endpoint for better results
-            params = {
-                'q': query,
-                'l': location,
-                'filter': '0',
-                'sort': 'date',
-                'limit': '10'
+    def search(self, sources, query, location, on_job=None):
+        """Search the selected sources and enrich every result in parallel.
+        
+        Listings for all sources are fetched concurrently by the source engine,
+        then detail pages go through a bounded thread pool. ``on_job(job, done, total)``
+        is called as each job completes; the returned list keeps listing order.
+        """
+        names = [self.SOURCE_KEYS[source] for source in sources]
+        listings = self.engine.search_sync(query, location, names, self.max_results)
+        pending = [(get_source(name), job) for name in names for job in listings.get(name, [])]
+        
+        results = [None] * len(pending)
+        if not pending:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_job_details, source, job): index
+                for index, (source, job) in enumerate(pending)
             }
-            
-            url = f"https://www.indeed.com/m/jobs?{urlencode(params)}"
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            job_cards = soup.find_all('div', class_='job_seen_beacon')[:10]
-            
-            for card in job_cards:
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
                 try:
-                    title = card.find(['h2', 'h3'], class_=['jobTitle', 'title'])
-                    company = card.find(['span', 'div'], class_=['company', 'companyName'])
-                    location = card.find(['div', 'span'], class_=['companyLocation', 'location'])
-                    
-                    if all([title, company, location]):
-                        job_link = card.find('a', href=True)
-                        job_url = 'https://www.indeed.com' + job_link['href'] if job_link else ''
-                        
-                        # Get detailed job info
-                        time.sleep(random.uniform(1, 2))
-                        if job_url:
-                            job_response = self.session.get(job_url)
-                            job_soup = BeautifulSoup(job_response.text, 'html.parser')
-                            description = job_soup.find('div', class_='jobsearch-jobDescriptionText')
-                            description_text = description.get_text() if description else ""
-                            
-                            level = self.detect_level(description_text)
-                            skills = self.extract_skills_from_text(description_text)
-                            
-                            jobs.append({
-                                'title': title.get_text().strip(),
-                                'company': company.get_text().strip(),
-                                'location': location.get_text().strip(),
-                                'url': job_url,
-                                'skills': ', '.join(skills) if skills else 'No specific skills listed',
-                                'level': level,
-                                'source': 'Indeed'
-                            })
+                    results[index] = future.result()
                 except Exception as e:
-                    print(f"Error processing Indeed job: {e}")
+                    print(f"Error processing job: {e}")
                     continue
-                    
-        except Exception as e:
-            print(f"Error searching Indeed: {e}")
-        return jobs
+                if on_job:
+                    on_job(results[index], done, len(pending))
+        
+        return [job for job in results if job]
+
+    def search_linkedin(self, query, location):
+        return self.search(['LinkedIn'], query, location)
+
+    def search_indeed(self, query, location):
+        return self.search(['Indeed'], query, location)
 
     def search_monster(self, query, location):
-        jobs = []
-        try:
-            # Using Monster's search API
-            params = {
-                'q': query,
-                'where': location,
-                'page': '1'
-            }
-            
-            url = f"https://www.monster.com/jobs/search?{urlencode(params)}"
-            response = self.session.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Monster's new layout uses React/JavaScript, so we'll parse their job cards
-            job_cards = soup.find_all('section', class_='card-content')[:10]
-            
-            for card in job_cards:
-                try:
-                    title = card.find(['h2', 'h3'], class_='title')
-                    company = card.find(['div', 'span'], class_='company')
-                    location = card.find(['div', 'span'], class_='location')
-                    
-                    if all([title, company, location]):
-                        job_link = card.find('a', href=True)
-                        job_url = job_link['href'] if job_link else ''
-                        
-                        # Get detailed job info
-                        time.sleep(random.uniform(1, 2))
-                        if job_url:
-                            job_response = self.session.get(job_url)
-                            job_soup = BeautifulSoup(job_response.text, 'html.parser')
-                            description = job_soup.find('div', class_='job-description')
-                            description_text = description.get_text() if description else ""
-                            
-                            level = self.detect_level(description_text)
-                            skills = self.extract_skills_from_text(description_text)
-                            
-                            jobs.append({
-                                'title': title.get_text().strip(),
-                                'company': company.get_text().strip(),
-                                'location': location.get_text().strip(),
-                                'url': job_url,
-                                'skills': ', '.join(skills) if skills else 'No specific skills listed',
-                                'level': level,
-                                'source': 'Monster'
-                            })
-                except Exception as e:
-                    print(f"Error processing Monster job: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"Error searching Monster: {e}")
-        return jobs
+        return self.search(['Monster'], query, location)
 
 class PenTestingJobTracker:
     def __init__(self, root):
@@ -333,8 +244,13 @@ class PenTestingJobTracker:
         self.search_button.config(state='disabled')
         self.results_text.delete("1.0", tk.END)
         
+        def on_job(job, done, total):
+            # Called from the search thread; hand each enriched job to the Tk loop
+            self.progress_var.set(done * 100 / total)
+            if selected_level == "Any" or job['level'] == selected_level:
+                self.root.after(0, lambda: self.append_search_result(job))
+        
         def search_thread():
-            all_jobs = []
             active_sources = [source for source, var in self.source_vars.items() if var.get()]
             
             if not active_sources:
@@ -342,22 +258,8 @@ class PenTestingJobTracker:
                 self.search_button.config(state='normal')
                 return
             
-            progress_step = 100 / len(active_sources)
-            current_progress = 0
-            
-            for source in active_sources:
-                self.update_status(f"Searching {source}...")
-                
-                if source == 'LinkedIn':
-                    jobs = self.job_searcher.search_linkedin(keywords, location)
-                elif source == 'Indeed':
-                    jobs = self.job_searcher.search_indeed(keywords, location)
-                elif source == 'Monster':
-                    jobs = self.job_searcher.search_monster(keywords, location)
-                
-                all_jobs.extend(jobs)
-                current_progress += progress_step
-                self.progress_var.set(current_progress)
+            self.update_status(f"Searching {', '.join(active_sources)}...")
+            all_jobs = self.job_searcher.search(active_sources, keywords, location, on_job=on_job)
             
             # Filter by level if specified
             if selected_level != "Any":
@@ -369,13 +271,8 @@ class PenTestingJobTracker:
         
         threading.Thread(target=search_thread, daemon=True).start()
 
-    def display_search_results(self, jobs):
-        self.results_text.delete("1.0", tk.END)
-        if not jobs:
-            self.results_text.insert(tk.END, "No jobs found. Try different keywords, location, or job sources.\n")
-        else:
-            for job in jobs:
-                job_info = f"""
+    def format_job(self, job):
+        return f"""
 Source: {job['source']}
 Title: {job['title']}
 Company: {job['company']}
@@ -385,7 +282,17 @@ Required Skills: {job['skills']}
 URL: {job['url']}
 ------------------------
 """
-                self.results_text.insert(tk.END, job_info)
+
+    def append_search_result(self, job):
+        self.results_text.insert(tk.END, self.format_job(job))
+
+    def display_search_results(self, jobs):
+        self.results_text.delete("1.0", tk.END)
+        if not jobs:
+            self.results_text.insert(tk.END, "No jobs found. Try different keywords, location, or job sources.\n")
+        else:
+            for job in jobs:
+                self.results_text.insert(tk.END, self.format_job(job))
         
         self.search_button.config(state='normal')
 
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
@@ -8,7 +9,7 @@ import os
 from pathlib import Path
 import logging
 
-from src.api.jobs import router as jobs_router
+from src.api.jobs import job_service, router as jobs_router, scheduler
 from src.config import settings
 
 # Configurar logging
@@ -27,12 +28,24 @@ TEMPLATES_DIR = Path("src/templates")
 STATIC_DIR.mkdir(exist_ok=True, parents=True)
 TEMPLATES_DIR.mkdir(exist_ok=True, parents=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Iniciar e parar as tarefas em segundo plano"""
+    if settings.enrichment.enabled:
+        await job_service.enrichment.start()
+    if settings.scheduler.enabled:
+        await scheduler.start()
+    yield
+    await scheduler.stop()
+    await job_service.enrichment.stop()
+
 # Criar app
 app = FastAPI(
     title=settings.app.name,
     version=settings.app.version,
     description=settings.app.description,
-    debug=settings.server.debug
+    debug=settings.server.debug,
+    lifespan=lifespan
 )
 
 # Configurar CORS
@@ -6,15 +6,26 @@ import webbrowser
 from bs4 import BeautifulSoup
 import json
 import threading
-import re
 from urllib.parse import urljoin, urlparse, quote_plus
-import time
+import asyncio
 import random
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+import time
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.services.browser_pool import BrowserPool
+from src.services.extraction import HYBRID_TERMS, REMOTE_TERMS, JobText, is_remote, requirements_extractor
 
 class JobScraper:
-    def __init__(self):
+    def __init__(self, browser_pool=None, wait_strategy='adaptive'):
         self.db_path = 'jobs.db'
+        # Long-lived Chromium shared by every search (warm contexts)
+        self.browser_pool = browser_pool or BrowserPool()
+        # 'adaptive' scrolls only while cards keep appearing; 'fixed' is the old
+        # networkidle + 5 scrolls, kept for benchmarks
+        self.wait_strategy = wait_strategy
+        self.target_count = 25  # stop scrolling once this many cards are loaded
+        self.time_budget = 20  # seconds per site (sites may override with 'time_budget')
+        self.growth_timeout = 2000  # ms to wait for new cards after each scroll
+        self.site_timings = {}  # last scrape latency per site, in seconds
         self.setup_database()
         self.job_sites = {
             'LinkedIn': {
@@ -80,47 +91,35 @@ class JobScraper:
             ''')
 
     def scrape_jobs(self, keywords, location):
-        all_jobs = []
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            for site_name, site_info in self.job_sites.items():
-                try:
-                    page = context.new_page()
-                    jobs = self._scrape_site(page, site_name, site_info, keywords, location)
-                    all_jobs.extend(jobs)
-                    page.close()
-                except Exception as e:
-                    print(f"Error scraping {site_name}: {str(e)}")
-                    continue
-                
-            browser.close()
-        return all_jobs
+        return self.browser_pool.run(self.scrape_jobs_async(keywords, location))
 
-    def _scrape_site(self, page, site_name, site_info, keywords, location):
+    async def scrape_jobs_async(self, keywords, location):
+        # One page per site, all sites in parallel
+        results = await asyncio.gather(*(
+            self._scrape_site(site_name, site_info, keywords, location)
+            for site_name, site_info in self.job_sites.items()
+        ))
+        return [job for jobs in results for job in jobs]
+
+    async def _scrape_site(self, site_name, site_info, keywords, location):
         jobs = []
         try:
-            # Format URL based on site
-            if site_name in ['LinkedIn', 'Indeed']:
-                url = site_info['base_url'].format(quote_plus(keywords), quote_plus(location))
-            elif site_name == 'Glassdoor':
-                url = site_info['base_url'].format(quote_plus(keywords), quote_plus(location))
-            
-            # Navigate to page
-            page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            # Wait for job cards to load
-            page.wait_for_selector(site_info['selectors']['job_cards'], timeout=10000)
+            url = site_info['base_url'].format(quote_plus(keywords), quote_plus(location))
             
-            # Scroll to load more jobs
-            self._scroll_page(page)
+            started = time.perf_counter()
+            async with self.browser_pool.page(url) as page:
+                if self.wait_strategy == 'fixed':
+                    await page.goto(url, wait_until='networkidle', timeout=30000)
+                    await page.wait_for_selector(site_info['selectors']['job_cards'], timeout=10000)
+                    await self._scroll_page(page)
+                else:
+                    budget = site_info.get('time_budget', self.time_budget)
+                    await self._load_cards(page, url, site_info['selectors']['job_cards'], time.monotonic() + budget)
+                
+                # Get page content
+                content = await page.content()
+            self.site_timings[site_name] = time.perf_counter() - started
             
-            # Get page content and parse
-            content = page.content()
             soup = BeautifulSoup(content, 'html.parser')
             
             # Find all job cards
@@ -138,15 +137,39 @@ class JobScraper:
         
         return jobs
 
-    def _scroll_page(self, page):
+    async def _load_cards(self, page, url, selector, deadline):
+        """Load the page and scroll only while the number of cards keeps growing"""
+        def remaining_ms():
+            # Playwright treats a timeout of 0 as "no timeout"
+            return max(1, (deadline - time.monotonic()) * 1000)
+        
+        # Cards are in the DOM long before trackers and images settle
+        await page.goto(url, wait_until='domcontentloaded', timeout=remaining_ms())
+        await page.wait_for_selector(selector, state='attached', timeout=remaining_ms())
+        
+        count = await page.locator(selector).count()
+        while count < self.target_count and time.monotonic() < deadline:
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            try:
+                await page.wait_for_function(
+                    '([selector, count]) => document.querySelectorAll(selector).length > count',
+                    arg=[selector, count],
+                    timeout=min(self.growth_timeout, remaining_ms())
+                )
+            except PlaywrightTimeoutError:
+                break  # count stopped growing
+            count = await page.locator(selector).count()
+        return count
+
+    async def _scroll_page(self, page):
         try:
             # Scroll slowly to simulate human behavior and load dynamic content
             for _ in range(5):  # Scroll 5 times
-                page.evaluate('window.scrollBy(0, window.innerHeight)')
-                time.sleep(random.uniform(0.5, 1.0))  # Random delay between scrolls
+                await page.evaluate('window.scrollBy(0, window.innerHeight)')
+                await asyncio.sleep(random.uniform(0.5, 1.0))  # Random delay between scrolls
                 
             # Wait for any new content to load
-            page.wait_for_timeout(1000)
+            await page.wait_for_timeout(1000)
         except Exception as e:
             print(f"Error during scrolling: {str(e)}")
 
@@ -177,58 +200,42 @@ class JobScraper:
             if not (title_elem and company_elem):
                 return None
 
+            # Normalized once, shared by the remote and requirements classifiers
+            text = JobText(
+                title_elem.get_text(strip=True) if title_elem else None,
+                location_elem.get_text(strip=True) if location_elem else None,
+                description_elem.get_text(strip=True) if description_elem else None
+            )
+
             # Extract text content
             job_data = {
-                'title': title_elem.get_text(strip=True) if title_elem else 'Não especificado',
+                'title': text.title.text or 'Não especificado',
                 'company': company_elem.get_text(strip=True) if company_elem else 'Não especificado',
-                'location': location_elem.get_text(strip=True) if location_elem else 'Não especificado',
-                'description': description_elem.get_text(strip=True) if description_elem else '',
+                'location': text.location.text or 'Não especificado',
+                'description': text.description.text,
                 'url': url,
                 'source': source,
                 'posted_date': posted_date_elem.get_text(strip=True) if posted_date_elem else 'Não especificado',
                 'job_type': job_type_elem.get_text(strip=True) if job_type_elem else 'Não especificado',
                 'salary': salary_elem.get_text(strip=True) if salary_elem else 'Não especificado',
-                'remote': self._is_remote(location_elem, description_elem)
+                'remote': self._is_remote(text)
             }
 
             # Extract requirements from description
-            job_data['requirements'] = self._extract_requirements(job_data['description'])
+            job_data['requirements'] = self._extract_requirements(text)
 
             return job_data
         except Exception as e:
             print(f"Error extracting job data: {str(e)}")
             return None
 
-    def _is_remote(self, location_elem, description_elem):
-        remote_keywords = ['remoto', 'remote', 'home office', 'trabalho remoto', 'híbrido', 'hybrid']
-        text = ''
-        if location_elem:
-            text += location_elem.get_text(strip=True).lower()
-        if description_elem:
-            text += description_elem.get_text(strip=True).lower()
-        return any(keyword in text for keyword in remote_keywords)
+    def _is_remote(self, text):
+        # Hybrid positions count as remote in this app
+        return is_remote(text, REMOTE_TERMS + HYBRID_TERMS)
 
     def _extract_requirements(self, description):
-        if not description:
-            return ''
-        
-        # Common requirement indicators
-        requirement_patterns = [
-            r'requisitos:.*?(?=\n|$)',
-            r'requirements:.*?(?=\n|$)',
-            r'necessário:.*?(?=\n|$)',
-            r'perfil:.*?(?=\n|$)',
-            r'qualificações:.*?(?=\n|$)',
-            r'experiência.*?(?=\n|$)'
-        ]
-        
-        requirements = []
-        for pattern in requirement_patterns:
-            matches = re.finditer(pattern, description.lower(), re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                requirements.append(match.group(0))
-        
-        return ' | '.join(requirements) if requirements else ''
+        # Shared single-pass extractor (Portuguese and English sections)
+        return requirements_extractor.summary(description)
 
     def save_to_db(self, jobs):
         with sqlite3.connect(self.db_path) as conn:
@@ -259,54 +266,52 @@ class JobScraper:
             conn.commit()
 
     def scrape_custom_url(self, url):
+        return self.browser_pool.run(self.scrape_custom_url_async(url))
+
+    async def scrape_custom_url_async(self, url):
         jobs = []
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            page = context.new_page()
-            try:
-                page.goto(url, wait_until='networkidle', timeout=30000)
-                
-                # Get page content and parse
-                content = page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Find all job cards
-                job_cards = soup.select('.jl')
-                
-                for card in job_cards:
-                    job_data = self._extract_job_data(card, {
-                        'title': '.jobLink',
-                        'company': '.jobEmpolyerName',
-                        'location': '.loc',
-                        'description': '.jobDesc',
-                        'posted_date': '.jobLabels .jobLabel',
-                        'job_type': '.jobType',
-                        'salary': '.salaryEstimate'
-                    }, 'Glassdoor', url)
-                    if job_data:
-                        jobs.append(job_data)
+        try:
+            async with self.browser_pool.page(url) as page:
+                if self.wait_strategy == 'fixed':
+                    await page.goto(url, wait_until='networkidle', timeout=30000)
+                else:
+                    await self._load_cards(page, url, '.jl', time.monotonic() + self.time_budget)
+                content = await page.content()
             
-            except PlaywrightTimeoutError:
-                print(f"Timeout while loading custom URL")
-            except Exception as e:
-                print(f"Error scraping custom URL: {str(e)}")
+            # Parse and find all job cards
+            soup = BeautifulSoup(content, 'html.parser')
+            job_cards = soup.select('.jl')
             
-            page.close()
-            browser.close()
+            for card in job_cards:
+                job_data = self._extract_job_data(card, {
+                    'title': '.jobLink',
+                    'company': '.jobEmpolyerName',
+                    'location': '.loc',
+                    'description': '.jobDesc',
+                    'posted_date': '.jobLabels .jobLabel',
+                    'job_type': '.jobType',
+                    'salary': '.salaryEstimate'
+                }, 'Glassdoor', url)
+                if job_data:
+                    jobs.append(job_data)
+        
+        except PlaywrightTimeoutError:
+            print(f"Timeout while loading custom URL")
+        except Exception as e:
+            print(f"Error scraping custom URL: {str(e)}")
         
         return jobs
 
+    def close(self):
+        self.browser_pool.shutdown()
+
 class JobSearchApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Buscador Avançado de Vagas")
         self.setup_ui()
         self.scraper = JobScraper()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def setup_ui(self):
         # Main frame
@@ -518,6 +523,10 @@ Requisitos encontrados:
         self.search_button.state(['!disabled'])
         self.progress.stop()
 
+    def on_close(self):
+        self.scraper.close()
+        self.root.destroy()
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = JobSearchApp(root)
@@ -9,6 +9,8 @@ import json
 import threading
 import re
 
+from src.services.extraction import SkillExtractor
+
 class JobSearcher:
     def __init__(self):
         self.headers = {
@@ -23,14 +25,10 @@ class JobSearcher:
             "CISSP", "CEH", "OSCP", "security+", "network+",
             "risk assessment", "security auditing", "compliance"
         ]
+        self.extractor = SkillExtractor(self.common_pentesting_skills)
 
     def extract_skills_from_text(self, text):
-        found_skills = []
-        text_lower = text.lower()
-        for skill in self.common_pentesting_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        return found_skills
+        return self.extractor.extract_skills(text)
 
     def search_linkedin(self, query, location):
         jobs = []
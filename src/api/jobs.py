@@ -1,8 +1,12 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
+import asyncio
 import logging
-from ..models.job import Job, JobSearch
+from ..models.job import Job, JobFilters, JobSearch, SavedSearch
+from ..services.circuit_breaker import breakers
 from ..services.job_service_async import AsyncJobService
+from ..services.retry import retry_metrics
+from ..services.scheduler import SavedSearchScheduler
 from ..config import settings
 
 # Configurar logging
@@ -13,6 +17,50 @@ router = APIRouter()
 
 # Instanciar serviço
 job_service = AsyncJobService()
+# Buscas salvas (iniciado pelo lifespan em main.py)
+scheduler = SavedSearchScheduler(job_service)
+
+def job_filters(
+    remote: Optional[bool] = Query(None, description="Apenas vagas remotas (true) ou presenciais (false)"),
+    source: Optional[str] = Query(None, description="Fonte da vaga"),
+    job_type: Optional[str] = Query(None, description="Tipo de contrato"),
+    company: Optional[str] = Query(None, description="Empresa"),
+    min_salary: Optional[float] = Query(None, description="Salário mínimo (faixas que se sobrepõem)"),
+    max_salary: Optional[float] = Query(None, description="Salário máximo"),
+    currency: Optional[str] = Query(None, description="Moeda (BRL, USD, EUR...)"),
+    period: Optional[str] = Query(None, description="Período (hour, day, week, month, year)")
+) -> JobFilters:
+    """Filtros comuns aos endpoints que leem vagas guardadas"""
+    return JobFilters(
+        remote=remote, source=source, job_type=job_type, company=company,
+        min_salary=min_salary, max_salary=max_salary, currency=currency, period=period
+    )
+
+
+def page_params(
+    sort_by: Optional[str] = Query(
+        None,
+        description="Ordenação: relevance, date, posted, salary ou salary_min "
+                    "(padrão: relevance nos resultados de uma busca, date no histórico; "
+                    "salary e salary_min exigem currency e comparam o valor anual)"
+    ),
+    order: str = Query("desc", description="asc ou desc"),
+    limit: int = Query(20, ge=1, le=500, description="Vagas por página"),
+    offset: int = Query(0, ge=0)
+) -> dict:
+    """Ordenação e paginação"""
+    return {"sort_by": sort_by, "descending": order.lower() != "asc", "limit": limit, "offset": offset}
+
+
+async def query_page(filters: JobFilters, page: dict) -> dict:
+    """Página filtrada, ordenada e com facetas, calculada no SQL"""
+    if page["sort_by"] is None:
+        # A relevância só vale dentro da busca que pontuou as vagas
+        page = {**page, "sort_by": "relevance" if filters.search_id else "date"}
+    try:
+        return await asyncio.to_thread(job_service.db.query_jobs, filters, **page)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/search")
 async def search_jobs(
@@ -20,10 +68,19 @@ async def search_jobs(
     location: str = Query(..., description="Localização"),
     remote_only: bool = Query(False, description="Apenas vagas remotas"),
     user_id: str = Query("test_user", description="ID do usuário"),
-    sources: List[str] = Query(None, description="Fontes de dados para busca")
+    sources: List[str] = Query(None, description="Fontes de dados para busca"),
+    countries: List[str] = Query(None, description="Países da Adzuna (ex.: br, us, gb)"),
+    filters: JobFilters = Depends(job_filters),
+    page: dict = Depends(page_params)
 ) -> dict:
     """
     Buscar vagas com os parâmetros especificados
+
+    Retorna só a página pedida, já filtrada e ordenada, com as facetas
+    (fonte, remoto, tipo, empresa). As próximas páginas e outros filtros
+    vêm de GET /results/{search_id}, sem repetir a busca. ``partial`` indica
+    que alguma fonte falhou, estourou o prazo ou foi pulada pelo disjuntor
+    (a situação de cada uma vem em ``sources``).
     """
     try:
         # Usar fontes padrão se não especificadas
@@ -35,7 +92,8 @@ async def search_jobs(
             keywords=keywords,
             location=location,
             remote_only=remote_only,
-            sources=sources
+            sources=sources,
+            **({"countries": countries} if countries else {})
         )
         
         # Buscar vagas
@@ -43,11 +101,17 @@ async def search_jobs(
         jobs = await job_service.search_jobs(search, user_id)
         logger.info(f"Busca finalizada. Encontradas {len(jobs)} vagas")
         
+        filters = filters.model_copy(update={"search_id": search.search_id})
         return {
-            "total": len(jobs),
-            "jobs": jobs
+            "search_id": search.search_id,
+            "found": len(jobs),
+            "partial": search.partial,
+            "sources": search.source_status,
+            **await query_page(filters, page)
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Erro ao buscar vagas: {str(e)}")
         raise HTTPException(
@@ -55,6 +119,112 @@ async def search_jobs(
             detail=f"Erro ao buscar vagas: {str(e)}"
         )
 
+@router.get("/results/{search_id}")
+async def get_search_results(
+    search_id: str,
+    filters: JobFilters = Depends(job_filters),
+    page: dict = Depends(page_params)
+) -> dict:
+    """
+    Resultados guardados de uma busca, filtrados, ordenados e paginados
+    """
+    try:
+        filters = filters.model_copy(update={"search_id": search_id})
+        return {"search_id": search_id, **await query_page(filters, page)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Erro ao consultar resultados: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao consultar resultados: {str(e)}"
+        )
+
+@router.get("/history")
+async def get_job_history(
+    filters: JobFilters = Depends(job_filters),
+    page: dict = Depends(page_params)
+) -> dict:
+    """
+    Vagas já encontradas em todas as buscas, filtradas e ordenadas no banco
+    """
+    try:
+        return await query_page(filters, page)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Erro ao consultar histórico: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao consultar histórico: {str(e)}"
+        )
+
+@router.post("/saved")
+async def create_saved_search(saved: SavedSearch) -> SavedSearch:
+    """
+    Salvar uma busca para ser repetida periodicamente pelo agendador
+    """
+    saved.interval_minutes = max(saved.interval_minutes, settings.scheduler.min_interval // 60)
+    return await asyncio.to_thread(job_service.db.create_saved_search, saved)
+
+@router.get("/saved")
+async def list_saved_searches() -> List[SavedSearch]:
+    """
+    Listar as buscas salvas com a última e a próxima execução
+    """
+    return await asyncio.to_thread(job_service.db.list_saved_searches)
+
+@router.delete("/saved/{saved_id}")
+async def delete_saved_search(saved_id: int) -> dict:
+    """
+    Remover uma busca salva
+    """
+    if not await asyncio.to_thread(job_service.db.delete_saved_search, saved_id):
+        raise HTTPException(status_code=404, detail="Busca salva não encontrada")
+    return {"deleted": saved_id}
+
+@router.get("/enrichment")
+async def get_enrichment_metrics() -> dict:
+    """
+    Profundidade e vazão da fila de enriquecimento
+    """
+    return job_service.enrichment.metrics()
+
+@router.get("/queries")
+async def get_top_queries(
+    days: int = Query(7, ge=1, le=365, description="Janela em dias"),
+    limit: int = Query(20, ge=1, le=200)
+) -> List[dict]:
+    """
+    Buscas mais frequentes, agrupadas pela forma canônica (grafias
+    equivalentes contam como a mesma busca), com a taxa de acerto do cache
+    """
+    return await asyncio.to_thread(job_service.db.top_queries, days, limit)
+
+@router.get("/quota")
+async def get_quota_budget() -> dict:
+    """
+    Orçamento da cota diária da Adzuna: uso por usuário, folga reservada às
+    buscas interativas, ritmo do segundo plano e horário previsto de esgotamento
+    """
+    return await asyncio.to_thread(job_service.quota.snapshot)
+
+@router.get("/sources/health")
+async def get_sources_health() -> dict:
+    """
+    Disjuntores das fontes neste worker: estado (closed, open, half_open),
+    falhas seguidas e segundos até a próxima tentativa
+    """
+    return breakers.snapshot()
+
+@router.get("/sources/metrics")
+async def get_sources_metrics() -> dict:
+    """
+    Requisições, tentativas, novas tentativas, falhas e latência (p50/p95
+    por tentativa) de cada fonte neste worker
+    """
+    return retry_metrics.snapshot()
+
 @router.get("/usage")
 async def get_api_usage(user_id: str = Query("test_user")) -> dict:
     """
@@ -48,6 +48,11 @@ class APIConfig(BaseModel):
     adzuna_app_id: str = os.getenv("ADZUNA_APP_ID", "")
     adzuna_api_key: str = os.getenv("ADZUNA_API_KEY", "")
     daily_limit: int = int(os.getenv("API_DAILY_LIMIT", "100"))
+    adzuna_max_pages: int = int(os.getenv("ADZUNA_MAX_PAGES", "1"))  # cada página é uma requisição da cota
+    # Países consultados na Adzuna quando a busca não informa (ex.: "br,us,gb")
+    adzuna_countries: List[str] = [
+        country.strip().lower() for country in os.getenv("ADZUNA_COUNTRIES", "us").split(",") if country.strip()
+    ]
     
     def get_credentials(self) -> tuple:
         """Retorna as credenciais apropriadas baseado no ambiente"""
@@ -64,12 +69,177 @@ class CacheConfig(BaseModel):
     ttl: int = int(os.getenv("CACHE_TTL", "3600"))
     max_size: int = int(os.getenv("CACHE_MAX_SIZE", "1000"))
     enabled: bool = os.getenv("CACHE_ENABLED", "True").lower() == "true"
+    partial_ttl: int = int(os.getenv("CACHE_PARTIAL_TTL", "60"))  # resultados parciais expiram antes
 
 class ScraperConfig(BaseModel):
     """Configurações dos scrapers"""
     timeout: int = 30
-    retry_attempts: int = 3
     batch_size: int = 50
+    max_concurrency: int = int(os.getenv("SCRAPER_MAX_CONCURRENCY", "8"))
+    limit_per_host: int = int(os.getenv("SCRAPER_LIMIT_PER_HOST", "4"))
+    tier_state_file: str = os.getenv("FETCH_TIERS_FILE", "fetch_tiers.json")
+    tier_recheck: int = int(os.getenv("FETCH_TIER_RECHECK", "3600"))  # segundos até testar camadas mais baratas
+    search_deadline: float = float(os.getenv("SEARCH_DEADLINE", "20"))  # segundos; depois disso, resultados parciais
+
+class RetryConfig(BaseModel):
+    """Novas tentativas dos clientes HTTP das fontes (backoff exponencial com jitter)"""
+    attempts: int = int(os.getenv("RETRY_ATTEMPTS", "3"))
+    base_delay: float = float(os.getenv("RETRY_BASE_DELAY", "0.5"))  # segundos, dobra a cada tentativa
+    max_delay: float = float(os.getenv("RETRY_MAX_DELAY", "10"))
+    budget: float = float(os.getenv("RETRY_BUDGET", "15"))  # segundos no total por requisição
+    statuses: List[int] = [
+        int(status) for status in os.getenv("RETRY_STATUSES", "408,425,429,500,502,503,504").split(",")
+    ]
+
+class CircuitBreakerConfig(BaseModel):
+    """Disjuntores por fonte: fontes com falhas seguidas são puladas por um tempo"""
+    failure_threshold: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+    reset_timeout: float = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "60"))  # segundos aberto até o teste
+    half_open_probes: int = int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "1"))
+
+class RateLimitConfig(BaseModel):
+    """Limites de requisições por host (token bucket)"""
+    rate: float = float(os.getenv("RATE_LIMIT_RATE", "1.0"))  # requisições por segundo
+    burst: int = int(os.getenv("RATE_LIMIT_BURST", "2"))
+    concurrency: int = int(os.getenv("RATE_LIMIT_CONCURRENCY", "2"))
+    hosts: Dict[str, Dict[str, float]] = {
+        "api.adzuna.com": {"rate": 5.0, "burst": 5, "concurrency": 4},
+        "portal.api.gupy.io": {"rate": 2.0, "burst": 4, "concurrency": 2},
+        "api.programathor.com.br": {"rate": 2.0, "burst": 4, "concurrency": 2},
+        "www.linkedin.com": {"rate": 0.5, "burst": 2, "concurrency": 2},
+    }
+
+class FixtureConfig(BaseModel):
+    """Configurações de gravação/reprodução de respostas HTTP"""
+    mode: str = os.getenv("SCRAPER_HTTP_MODE", "live")  # live, record ou replay
+    directory: str = os.getenv("FIXTURES_DIR", "fixtures")
+    version: str = os.getenv("FIXTURES_VERSION", "v1")
+    redact_params: List[str] = ["app_id", "app_key"]
+
+class BrowserConfig(BaseModel):
+    """Configurações do pool de navegadores (Playwright)"""
+    pool_size: int = int(os.getenv("BROWSER_POOL_SIZE", "3"))  # contextos (páginas simultâneas)
+    max_uses: int = int(os.getenv("BROWSER_MAX_USES", "20"))  # usos antes de reciclar o contexto
+    page_memory_mb: int = int(os.getenv("BROWSER_PAGE_MEMORY_MB", "512"))  # heap JS máximo por página
+    headless: bool = os.getenv("BROWSER_HEADLESS", "True").lower() == "true"
+    viewport: Dict[str, int] = {"width": 1920, "height": 1080}
+    user_agent: str = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+class WebDriverConfig(BaseModel):
+    """Configurações do pool de WebDrivers (Selenium)"""
+    pool_size: int = int(os.getenv("WEBDRIVER_POOL_SIZE", "2"))  # drivers aquecidos
+    max_browsers: int = int(os.getenv("WEBDRIVER_MAX_BROWSERS", "4"))  # limite rígido de navegadores
+    max_age: int = int(os.getenv("WEBDRIVER_MAX_AGE", "900"))  # segundos até reciclar
+    max_uses: int = int(os.getenv("WEBDRIVER_MAX_USES", "50"))
+    checkout_timeout: int = 120
+    ready_timeout: int = 10
+
+class BlockingConfig(BaseModel):
+    """Recursos bloqueados nos navegadores headless (Playwright e Selenium)"""
+    enabled: bool = os.getenv("BLOCK_RESOURCES", "True").lower() == "true"
+    resource_types: List[str] = ["image", "font", "media", "stylesheet"]
+    trackers: List[str] = [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*facebook.net*",
+        "*hotjar.com*",
+        "*segment.io*",
+        "*scorecardresearch.com*",
+        "*bat.bing.com*",
+    ]
+    # Host do site -> tipos de recurso ou padrões de URL liberados
+    allow: Dict[str, List[str]] = {
+        "www.glassdoor.com": ["stylesheet"],
+        "www.indeed.com": ["stylesheet"],
+    }
+
+class EnrichmentConfig(BaseModel):
+    """Fila de enriquecimento em segundo plano (detalhes, habilidades, nível, salário, duplicatas)"""
+    enabled: bool = os.getenv("ENRICHMENT_ENABLED", "True").lower() == "true"
+    workers: int = int(os.getenv("ENRICHMENT_WORKERS", "4"))
+    queue_size: int = int(os.getenv("ENRICHMENT_QUEUE_SIZE", "1000"))  # vagas aguardando; acima disso são descartadas
+    fetch_details: bool = os.getenv("ENRICHMENT_FETCH_DETAILS", "True").lower() == "true"
+    min_description: int = 300  # descrições menores que isso buscam a página de detalhes
+    skills: List[str] = [
+        "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C#", "C++", "PHP", "Ruby", "Kotlin",
+        "Swift", "SQL", "PostgreSQL", "MySQL", "MongoDB", "Redis", "React", "Angular", "Vue", "Node.js",
+        "Django", "Flask", "FastAPI", "Spring", ".NET", "AWS", "Azure", "GCP", "Docker", "Kubernetes",
+        "Terraform", "Linux", "Git", "CI/CD", "Kafka", "Spark", "Airflow", "Pandas", "Machine Learning",
+        "Pentest", "SIEM", "OWASP", "Burp Suite", "Metasploit", "Nmap", "ISO 27001", "Scrum",
+    ]
+    levels: Dict[str, List[str]] = {
+        "Estágio": ["estágio", "estagiário", "intern", "internship"],
+        "Júnior": ["júnior", "junior", "jr", "entry level"],
+        "Sênior": ["sênior", "senior", "sr"],
+        "Pleno": ["pleno", "mid-level", "mid level"],
+        "Especialista": ["especialista", "staff", "principal", "lead", "tech lead"],
+    }
+
+class SchedulerConfig(BaseModel):
+    """Buscas salvas executadas periodicamente para aquecer os resultados"""
+    enabled: bool = os.getenv("SCHEDULER_ENABLED", "True").lower() == "true"
+    tick: int = int(os.getenv("SCHEDULER_TICK", "30"))  # segundos entre verificações
+    jitter: float = float(os.getenv("SCHEDULER_JITTER", "0.1"))  # fração aleatória do intervalo
+    min_interval: int = int(os.getenv("SCHEDULER_MIN_INTERVAL", "900"))  # segundos
+    concurrency: int = int(os.getenv("SCHEDULER_CONCURRENCY", "2"))
+    user_id: str = "scheduler"  # usuário da cota da Adzuna usado pelas buscas salvas
+
+class CrawlQueueConfig(BaseModel):
+    """Fila persistente de tarefas de crawl (fonte, busca, página) no SQLite"""
+    visibility_timeout: int = int(os.getenv("CRAWL_VISIBILITY_TIMEOUT", "300"))  # segundos de posse de uma tarefa
+    max_attempts: int = int(os.getenv("CRAWL_MAX_ATTEMPTS", "3"))
+    retry_delay: int = int(os.getenv("CRAWL_RETRY_DELAY", "30"))  # segundos, dobra a cada tentativa
+    concurrency: int = int(os.getenv("CRAWL_CONCURRENCY", "4"))  # tarefas simultâneas por processo
+    processes: int = int(os.getenv("CRAWL_PROCESSES", "1"))
+    poll_interval: float = float(os.getenv("CRAWL_POLL_INTERVAL", "2"))
+    max_pages: int = int(os.getenv("CRAWL_MAX_PAGES", "5"))
+
+class QueryConfig(BaseModel):
+    """Normalização das buscas (chaves de cache, coalescência, crawl e estatísticas)"""
+    # Nome canônico -> grafias equivalentes (comparadas sem acentos e sem pontuação)
+    location_aliases: Dict[str, List[str]] = {
+        "São Paulo": ["sp", "sampa", "sao paulo capital", "sao paulo sp", "são paulo brasil"],
+        "Rio de Janeiro": ["rj", "rio", "rio de janeiro rj"],
+        "Belo Horizonte": ["bh", "belo horizonte mg"],
+        "Brasília": ["df", "distrito federal", "brasilia df"],
+        "Porto Alegre": ["poa", "porto alegre rs"],
+        "Florianópolis": ["floripa", "florianopolis sc"],
+        "Curitiba": ["curitiba pr"],
+        "Recife": ["recife pe"],
+        "Brasil": ["brazil", "br", "todo o brasil"],
+        "Remoto": ["remote", "remota", "home office", "anywhere", "trabalho remoto", "100% remoto"],
+        "Estados Unidos": ["usa", "us", "eua", "united states", "united states of america"],
+        "New York": ["nyc", "new york city", "new york ny", "nova york", "nova iorque"],
+        "Portugal": ["pt"],
+        "Lisboa": ["lisbon", "lisboa portugal"],
+    }
+
+class RankingConfig(BaseModel):
+    """Ordenação das vagas de uma busca por relevância (BM25, recência e remoto)"""
+    k1: float = float(os.getenv("RANK_K1", "1.2"))  # saturação da frequência dos termos
+    b: float = float(os.getenv("RANK_B", "0.75"))  # normalização pelo tamanho do campo
+    title_weight: float = float(os.getenv("RANK_TITLE_WEIGHT", "2.0"))
+    description_weight: float = float(os.getenv("RANK_DESCRIPTION_WEIGHT", "1.0"))
+    recency_weight: float = float(os.getenv("RANK_RECENCY_WEIGHT", "0.3"))  # bônus máximo de uma vaga nova
+    recency_half_life: float = float(os.getenv("RANK_RECENCY_HALF_LIFE", "14"))  # dias até o bônus cair pela metade
+    remote_boost: float = float(os.getenv("RANK_REMOTE_BOOST", "0.1"))
+
+class QuotaConfig(BaseModel):
+    """Distribuição da cota diária da Adzuna no tempo e entre usuários"""
+    reserve: float = float(os.getenv("QUOTA_INTERACTIVE_RESERVE", "0.3"))  # fração só para buscas interativas
+    user_share: float = float(os.getenv("QUOTA_USER_SHARE", "1.0"))  # fração máxima do limite por usuário (1.0 = o limite inteiro, como antes)
+    burst: float = float(os.getenv("QUOTA_BURST", "0.1"))  # fração do dia que o segundo plano pode adiantar
+    country_share: float = float(os.getenv("QUOTA_COUNTRY_SHARE", "1.0"))  # fração máxima do limite por país
+
+class SharedStateConfig(BaseModel):
+    """Estado compartilhado entre os workers do servidor (cota, cache, locks)"""
+    lock_ttl: float = float(os.getenv("SHARED_LOCK_TTL", "120"))  # segundos até um lock abandonado vencer
+    lock_poll: float = float(os.getenv("SHARED_LOCK_POLL", "0.25"))  # segundos entre consultas de quem espera
 
 class DatabaseConfig(BaseModel):
     """Configurações do banco de dados"""
@@ -85,10 +255,47 @@ class Settings(BaseSettings):
     cache: CacheConfig = CacheConfig()
     scraper: ScraperConfig = ScraperConfig()
     db: DatabaseConfig = DatabaseConfig()
-    
+    rate_limit: RateLimitConfig = RateLimitConfig()
+    retry: RetryConfig = RetryConfig()
+    circuit: CircuitBreakerConfig = CircuitBreakerConfig()
+    fixtures: FixtureConfig = FixtureConfig()
+    browser: BrowserConfig = BrowserConfig()
+    webdriver: WebDriverConfig = WebDriverConfig()
+    blocking: BlockingConfig = BlockingConfig()
+    enrichment: EnrichmentConfig = EnrichmentConfig()
+    scheduler: SchedulerConfig = SchedulerConfig()
+    crawl: CrawlQueueConfig = CrawlQueueConfig()
+    shared_state: SharedStateConfig = SharedStateConfig()
+    quota: QuotaConfig = QuotaConfig()
+    query: QueryConfig = QueryConfig()
+    ranking: RankingConfig = RankingConfig()
+
     # Fontes de dados
     default_sources: List[str] = ["adzuna"]
     
+    # Seletores dos sites usados pelo JobScraper
+    SITE_CONFIGS: Dict[str, Dict] = {
+        "LinkedIn": {
+            "source": "linkedin",  # fonte do SourceEngine usada na camada "api"
+            "base_url": "https://www.linkedin.com/jobs/search/?keywords={}&location={}",
+            "geo_ids": {
+                "Estados Unidos": "103644278",
+                "Brasil": "106057199"
+            },
+            "selectors": {
+                "job_cards": "ul.jobs-search__results-list > li",
+                "title": ".base-search-card__title",
+                "company": ".base-search-card__subtitle",
+                "location": ".job-search-card__location",
+                "description": ".base-search-card__metadata",
+                "job_link": "a.base-card__full-link",
+                "salary": ".job-search-card__salary-info",
+                "posted_time": "time",
+                "remote_badge": ".job-search-card__workplace-type"
+            }
+        }
+    }
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
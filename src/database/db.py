@@ -1,22 +1,68 @@
+import json
 import logging
 import sqlite3
 from contextlib import contextmanager
-from typing import List
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import settings
-from ..models.job import Job
+from ..models.job import Job, JobFilters, SavedSearch
+from ..services.salary import PERIODS_PER_YEAR
 
 logger = logging.getLogger(__name__)
 
 
+# Colunas adicionadas depois da primeira versão da tabela (migradas no início)
+MIGRATED_COLUMNS = {
+    "salary_min": "REAL",
+    "salary_max": "REAL",
+    "currency": "TEXT",
+    "period": "TEXT",
+    "skills": "TEXT",  # lista JSON
+    "level": "TEXT",
+    "dedup_key": "TEXT",
+    "duplicate_of": "INTEGER",
+    "enriched_at": "TIMESTAMP",
+}
+
+# Colunas adicionadas à tabela de buscas salvas
+MIGRATED_SAVED_SEARCH_COLUMNS = {
+    "priority": "INTEGER DEFAULT 3",
+    "countries": "TEXT",
+}
+
+# Campos gravados pela fila de enriquecimento
+ENRICHED_FIELDS = (
+    "description", "requirements", "remote", "salary_min", "salary_max", "currency", "period",
+    "skills", "level", "dedup_key", "duplicate_of",
+)
+
+# Ordenações aceitas por ``search_jobs``
+SORT_COLUMNS = {
+    "date": "date_added",
+    "posted": "posted_date",
+    "salary": "salary_max",
+    "salary_min": "salary_min",
+    "relevance": "link.score",  # só nas vagas de uma busca
+}
+
+# Ordenações por salário: valor anual, só dentro de uma moeda
+SALARY_SORTS = ("salary", "salary_min")
+
+# Campos com contagem por valor (facetas) nas respostas paginadas
+FACET_FIELDS = ("source", "remote", "job_type", "company")
+
+
 class Database:
-    def __init__(self):
-        self.db_url = settings.DATABASE_URL.replace("sqlite:///", "")
+    def __init__(self, db_url: Optional[str] = None):
+        self.db_url = (db_url or settings.db.url).replace("sqlite:///", "")
         self._create_tables()
 
     def _create_tables(self):
         """Criar tabelas necessárias no banco de dados"""
         with self.get_connection() as conn:
+            # WAL: leitores não bloqueiam o escritor (vários processos e workers)
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -35,17 +81,106 @@ class Database:
                     remote BOOLEAN,
                     search_id TEXT,
                     version TEXT,
+                    salary_min REAL,
+                    salary_max REAL,
+                    currency TEXT,
+                    period TEXT,
+                    skills TEXT,
+                    level TEXT,
+                    dedup_key TEXT,
+                    duplicate_of INTEGER,
+                    enriched_at TIMESTAMP,
                     UNIQUE(url, source)
                 )
             """
             )
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, column_type in MIGRATED_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+            # Filtros e ordenação por salário rodam no SQL sobre todo o histórico
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_salary ON jobs (currency, period, salary_max, salary_min)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_salary_max ON jobs (salary_max)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_search_id ON jobs (search_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_dedup_key ON jobs (dedup_key, id)")
+            # Vagas de cada busca: uma vaga encontrada por várias buscas pertence a todas
+            linked = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_jobs'"
+            ).fetchone()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_jobs (
+                    search_id TEXT NOT NULL,
+                    job_id INTEGER NOT NULL REFERENCES jobs (id) ON DELETE CASCADE,
+                    score REAL NOT NULL DEFAULT 0,  -- relevância da vaga nessa busca
+                    PRIMARY KEY (search_id, job_id)
+                ) WITHOUT ROWID
+            """
+            )
+            if not linked:
+                # Bancos antigos: cada vaga ligada à última busca que a encontrou
+                conn.execute(
+                    "INSERT OR IGNORE INTO search_jobs (search_id, job_id) "
+                    "SELECT search_id, id FROM jobs WHERE search_id IS NOT NULL"
+                )
+            # Páginas de uma busca por relevância lidas na ordem do índice, sem ordenar as vagas
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_jobs_score ON search_jobs (search_id, score DESC, job_id)"
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS saved_searches (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT,
+                    keywords TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    sources TEXT NOT NULL,
+                    countries TEXT,
+                    remote_only BOOLEAN DEFAULT 0,
+                    interval_minutes INTEGER NOT NULL,
+                    priority INTEGER DEFAULT 3,
+                    enabled BOOLEAN DEFAULT 1,
+                    last_run TIMESTAMP,
+                    next_run TIMESTAMP,
+                    last_search_id TEXT,
+                    last_count INTEGER
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    search_id TEXT,
+                    query_key TEXT NOT NULL,
+                    keywords TEXT,
+                    location TEXT,
+                    sources TEXT,
+                    user_id TEXT,
+                    found INTEGER,
+                    cached BOOLEAN,
+                    background BOOLEAN,
+                    created_at TIMESTAMP
+                )
+            """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_log_created ON search_log (created_at, query_key)")
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(saved_searches)")}
+            for column, column_type in MIGRATED_SAVED_SEARCH_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE saved_searches ADD COLUMN {column} {column_type}")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_saved_searches_next_run ON saved_searches (enabled, next_run)"
+            )
 
     @contextmanager
     def get_connection(self):
         """Context manager para conexão com o banco de dados"""
         conn = None
         try:
-            conn = sqlite3.connect(self.db_url)
+            conn = sqlite3.connect(self.db_url, timeout=30)
             conn.row_factory = sqlite3.Row
             yield conn
             conn.commit()
@@ -59,18 +194,45 @@ class Database:
                 conn.close()
 
     def save_jobs(self, jobs: List[Job], search_id: str, version: str):
-        """Salvar lista de empregos no banco de dados"""
+        """Salvar lista de empregos no banco de dados
+
+        Cada vaga é ligada à busca em ``search_jobs``, com a relevância
+        (``job.score``) para essa busca; sem nota, a ligação nova fica com 0
+        e uma já existente mantém a sua. ``jobs.search_id`` guarda só a
+        última busca que a encontrou.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
             for job in jobs:
                 try:
                     cursor.execute(
                         """
-                        INSERT OR REPLACE INTO jobs 
+                        INSERT INTO jobs
                         (title, company, location, description, url, source, 
                          date_added, posted_date, job_type, salary, requirements, 
-                         remote, search_id, version)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                         remote, search_id, version, salary_min, salary_max,
+                         currency, period)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(url) DO UPDATE SET
+                            title = excluded.title,
+                            company = excluded.company,
+                            location = excluded.location,
+                            posted_date = excluded.posted_date,
+                            job_type = excluded.job_type,
+                            search_id = excluded.search_id,
+                            version = excluded.version,
+                            -- Mantém o id e o que a fila de enriquecimento já gravou
+                            description = CASE
+                                WHEN length(coalesce(excluded.description, '')) > length(coalesce(description, ''))
+                                THEN excluded.description ELSE description END,
+                            salary = coalesce(excluded.salary, salary),
+                            salary_min = coalesce(excluded.salary_min, salary_min),
+                            salary_max = coalesce(excluded.salary_max, salary_max),
+                            currency = coalesce(excluded.currency, currency),
+                            period = coalesce(excluded.period, period),
+                            requirements = coalesce(excluded.requirements, requirements),
+                            remote = excluded.remote OR remote
+                        RETURNING id
                     """,
                         (
                             job.title,
@@ -82,20 +244,321 @@ class Database:
                             job.date_added.isoformat(),
                             job.posted_date,
                             job.job_type,
-                            job.salary,
+                            None if job.salary is None else str(job.salary),
                             job.requirements,
                             job.remote,
                             search_id,
                             version,
+                            job.salary_min,
+                            job.salary_max,
+                            job.currency,
+                            job.period,
                         ),
                     )
+                    job_id = cursor.fetchone()["id"]
+                    if job.score is None:
+                        cursor.execute(
+                            "INSERT OR IGNORE INTO search_jobs (search_id, job_id) VALUES (?, ?)",
+                            (search_id, job_id),
+                        )
+                    else:
+                        cursor.execute(
+                            "INSERT INTO search_jobs (search_id, job_id, score) VALUES (?, ?, ?) "
+                            "ON CONFLICT (search_id, job_id) DO UPDATE SET score = excluded.score",
+                            (search_id, job_id, job.score),
+                        )
                 except sqlite3.Error as e:
                     logger.error(f"Error saving job {job.title}: {str(e)}")
 
+    @staticmethod
+    def _row(row: sqlite3.Row) -> dict:
+        job = dict(row)
+        if job.get("skills"):
+            job["skills"] = json.loads(job["skills"])
+        return job
+
     def get_jobs(self, search_id: str) -> List[dict]:
         """Recuperar empregos por ID de busca"""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM jobs WHERE search_id = ?", (search_id,)
+                "SELECT jobs.*, link.score AS score FROM search_jobs AS link JOIN jobs ON jobs.id = link.job_id "
+                "WHERE link.search_id = ?",
+                (search_id,)
+            )
+            return [self._row(row) for row in cursor.fetchall()]
+
+    def save_enrichment(self, url: str, source: str, fields: Dict[str, Any]):
+        """Gravar os campos enriquecidos de uma vaga e marcar duplicatas
+
+        Com ``dedup_key``, a vaga aponta em ``duplicate_of`` para a primeira
+        vaga gravada com a mesma chave (mesmo título, empresa e local em
+        outra fonte ou URL).
+        """
+        fields = {key: value for key, value in fields.items() if key in ENRICHED_FIELDS}
+        if isinstance(fields.get("skills"), list):
+            fields["skills"] = json.dumps(fields["skills"], ensure_ascii=False)
+        with self.get_connection() as conn:
+            if fields.get("dedup_key"):
+                row = conn.execute(
+                    "SELECT MIN(other.id) AS id FROM jobs AS job JOIN jobs AS other "
+                    "ON other.dedup_key = ? AND other.id < job.id WHERE job.url = ? AND job.source = ?",
+                    (fields["dedup_key"], url, source)
+                ).fetchone()
+                fields["duplicate_of"] = row["id"] if row else None
+            assignments = ", ".join(f"{key} = ?" for key in fields)
+            conn.execute(
+                f"UPDATE jobs SET {assignments}, enriched_at = ? WHERE url = ? AND source = ?",
+                (*fields.values(), datetime.now().isoformat(), url, source)
             )
-            return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _from(filters: Optional[JobFilters]) -> Tuple[str, List[Any]]:
+        """Tabela consultada: as vagas de uma busca (``search_jobs``) ou todo o histórico"""
+        if filters is not None and filters.search_id:
+            return "search_jobs AS link JOIN jobs ON jobs.id = link.job_id AND link.search_id = ?", [filters.search_id]
+        return "jobs", []
+
+    @staticmethod
+    def _where(filters: Optional[JobFilters], exclude: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """Cláusula WHERE dos filtros; ``exclude`` ignora o filtro de um campo
+
+        A faixa salarial seleciona vagas cuja faixa se sobrepõe a
+        [min_salary, max_salary]; vagas sem salário ficam de fora quando há
+        filtro de salário. Compare valores da mesma moeda e período.
+        """
+        filters = filters or JobFilters()
+        conditions, params = [], []
+
+        def add(field: str, condition: str, value: Any):
+            if value is not None and value != "" and field != exclude:
+                conditions.append(condition)
+                params.append(value)
+
+        add("min_salary", "salary_max >= ?", filters.min_salary)
+        add("max_salary", "salary_min <= ?", filters.max_salary)
+        add("currency", "currency = ?", filters.currency and filters.currency.upper())
+        add("period", "period = ?", filters.period)
+        add("remote", "remote = ?", filters.remote)
+        add("source", "lower(source) = ?", filters.source and filters.source.lower())
+        add("job_type", "job_type = ?", filters.job_type)
+        add("company", "company = ?", filters.company)
+        return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+    def search_jobs(
+        self,
+        filters: Optional[JobFilters] = None,
+        sort_by: str = "date",
+        descending: bool = True,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[dict]:
+        """Buscar vagas guardadas filtrando e ordenando no SQL"""
+        order_by = self._order_by(sort_by, descending, filters)
+        with self.get_connection() as conn:
+            return self._select(conn, filters, order_by, limit, offset)
+
+    @staticmethod
+    def _order_by(sort_by: str, descending: bool, filters: Optional[JobFilters] = None) -> str:
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Ordenação inválida: {sort_by}. Opções: {sorted(SORT_COLUMNS)}")
+        if sort_by == "relevance" and not (filters and filters.search_id):
+            raise ValueError("A ordenação por relevância só vale para os resultados de uma busca")
+        if sort_by == "relevance":
+            # Mesma ordem do índice idx_search_jobs_score: o SQLite lê só a página pedida
+            return "link.score DESC, link.job_id" if descending else "link.score, link.job_id DESC"
+        column = SORT_COLUMNS[sort_by]
+        if sort_by in SALARY_SORTS:
+            if not (filters and filters.currency):
+                raise ValueError("A ordenação por salário exige o filtro de moeda (currency): moedas não se comparam")
+            # Valores por hora, mês ou ano comparados pelo total anual
+            factors = " ".join(f"WHEN '{period}' THEN {factor}" for period, factor in PERIODS_PER_YEAR.items())
+            column = f"({column} * CASE period {factors} END)"
+        # Vagas sem o campo ficam sempre no fim
+        return f"{column} IS NULL, {column} {'DESC' if descending else 'ASC'}, id DESC"
+
+    def _select(self, conn, filters, order_by, limit, offset) -> List[dict]:
+        source, joined = self._from(filters)
+        where, params = self._where(filters)
+        columns = "jobs.*, link.score AS score" if joined else "jobs.*"
+        cursor = conn.execute(
+            f"SELECT {columns} FROM {source} {where} ORDER BY {order_by} LIMIT ? OFFSET ?",
+            (*joined, *params, limit, offset)
+        )
+        return [self._row(row) for row in cursor.fetchall()]
+
+    def _facets(self, conn, filters: Optional[JobFilters], facet_limit: int) -> Dict[str, List[Dict]]:
+        """Contagem por valor de cada campo de ``FACET_FIELDS``
+
+        Cada faceta ignora o próprio filtro, para a interface mostrar as
+        outras opções do campo selecionado.
+        """
+        facets = {}
+        source, joined = self._from(filters)
+        for field in FACET_FIELDS:
+            where, params = self._where(filters, exclude=field)
+            rows = conn.execute(
+                f"SELECT {field} AS value, COUNT(*) AS count FROM {source} {where} "
+                f"GROUP BY {field} ORDER BY count DESC, value LIMIT ?",
+                (*joined, *params, facet_limit)
+            ).fetchall()
+            facets[field] = [
+                {"value": bool(row["value"]) if field == "remote" else row["value"], "count": row["count"]}
+                for row in rows
+            ]
+        return facets
+
+    def query_jobs(
+        self,
+        filters: Optional[JobFilters] = None,
+        sort_by: str = "date",
+        descending: bool = True,
+        limit: int = 50,
+        offset: int = 0,
+        facet_limit: int = 20
+    ) -> Dict:
+        """Página de vagas com total filtrado e facetas, numa única conexão"""
+        order_by = self._order_by(sort_by, descending, filters)
+        with self.get_connection() as conn:
+            jobs = self._select(conn, filters, order_by, limit, offset)
+            source, joined = self._from(filters)
+            where, params = self._where(filters)
+            total = conn.execute(f"SELECT COUNT(*) FROM {source} {where}", (*joined, *params)).fetchone()[0]
+            return {
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+                "jobs": jobs,
+                "facets": self._facets(conn, filters, facet_limit),
+            }
+
+    def log_search(
+        self,
+        search_id: str,
+        query_key: str,
+        keywords: str,
+        location: str,
+        sources: List[str],
+        user_id: str,
+        found: int,
+        cached: bool,
+        background: bool
+    ):
+        """Registrar uma busca (chave canônica) para as estatísticas"""
+        with self.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO search_log
+                (search_id, query_key, keywords, location, sources, user_id, found, cached, background, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (search_id, query_key, keywords, location, json.dumps(sources), user_id, found, cached, background,
+                 datetime.now().isoformat())
+            )
+
+    def top_queries(self, days: int = 7, limit: int = 20) -> List[Dict[str, Any]]:
+        """Buscas mais frequentes nos últimos ``days`` dias, agrupadas pela chave canônica"""
+        since = (datetime.now() - timedelta(days=days)).isoformat()
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT query_key, MAX(keywords) AS keywords, MAX(location) AS location,
+                       COUNT(*) AS searches, SUM(cached) AS cache_hits, SUM(background) AS background,
+                       COUNT(DISTINCT user_id) AS users, ROUND(AVG(found), 1) AS avg_found,
+                       MAX(created_at) AS last_search
+                FROM search_log WHERE created_at >= ?
+                GROUP BY query_key ORDER BY searches DESC, last_search DESC LIMIT ?
+            """,
+                (since, limit)
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+    @staticmethod
+    def _saved_search(row: sqlite3.Row) -> SavedSearch:
+        data = dict(row)
+        data["sources"] = json.loads(data["sources"])
+        if data.get("countries"):
+            data["countries"] = json.loads(data["countries"])
+        else:
+            data.pop("countries", None)  # anteriores aos países: usa o padrão
+        return SavedSearch(**data)
+
+    def create_saved_search(self, saved: SavedSearch) -> SavedSearch:
+        """Guardar uma busca salva (a primeira execução fica para o próximo ciclo)"""
+        with self.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO saved_searches
+                (name, keywords, location, sources, countries, remote_only, interval_minutes, priority, enabled,
+                 next_run)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    saved.name,
+                    saved.keywords,
+                    saved.location,
+                    json.dumps([source.lower() for source in saved.sources]),
+                    json.dumps(saved.countries),
+                    saved.remote_only,
+                    saved.interval_minutes,
+                    saved.priority,
+                    saved.enabled,
+                    (saved.next_run or datetime.now()).isoformat(),
+                ),
+            )
+            row = conn.execute("SELECT * FROM saved_searches WHERE id = ?", (cursor.lastrowid,)).fetchone()
+            return self._saved_search(row)
+
+    def list_saved_searches(self) -> List[SavedSearch]:
+        with self.get_connection() as conn:
+            rows = conn.execute("SELECT * FROM saved_searches ORDER BY id").fetchall()
+            return [self._saved_search(row) for row in rows]
+
+    def delete_saved_search(self, saved_id: int) -> bool:
+        with self.get_connection() as conn:
+            return conn.execute("DELETE FROM saved_searches WHERE id = ?", (saved_id,)).rowcount > 0
+
+    def due_saved_searches(self, now: Optional[datetime] = None) -> List[SavedSearch]:
+        """Buscas salvas ativas cujo horário já chegou, das mais atrasadas primeiro"""
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM saved_searches WHERE enabled = 1 AND next_run <= ? ORDER BY next_run",
+                ((now or datetime.now()).isoformat(),)
+            ).fetchall()
+            return [self._saved_search(row) for row in rows]
+
+    def claim_due_saved_searches(self, lease: float) -> List[SavedSearch]:
+        """Reservar as buscas vencidas por ``lease`` segundos (atômico entre processos)
+
+        O ``next_run`` é adiado na mesma instrução que seleciona as buscas, então
+        outro processo não pega as mesmas; ``mark_saved_search_run`` grava o
+        horário definitivo. Se o processo morrer, a busca volta após ``lease``.
+        """
+        now = datetime.now()
+        with self.get_connection() as conn:
+            rows = conn.execute(
+                "UPDATE saved_searches SET next_run = ? WHERE enabled = 1 AND next_run <= ? RETURNING *",
+                ((now + timedelta(seconds=lease)).isoformat(), now.isoformat())
+            ).fetchall()
+            # As de maior prioridade consomem o orçamento da cota primeiro
+            return sorted((self._saved_search(row) for row in rows), key=lambda saved: (-saved.priority, saved.id))
+
+    def mark_saved_search_run(
+        self,
+        saved_id: int,
+        next_run: datetime,
+        search_id: Optional[str] = None,
+        count: Optional[int] = None
+    ):
+        """Registrar uma execução (ou adiamento, sem ``search_id``) da busca salva"""
+        with self.get_connection() as conn:
+            if search_id is None:
+                conn.execute(
+                    "UPDATE saved_searches SET next_run = ? WHERE id = ?",
+                    (next_run.isoformat(), saved_id)
+                )
+            else:
+                conn.execute(
+                    "UPDATE saved_searches SET last_run = ?, next_run = ?, last_search_id = ?, last_count = ? "
+                    "WHERE id = ?",
+                    (datetime.now().isoformat(), next_run.isoformat(), search_id, count, saved_id)
+                )
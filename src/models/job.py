@@ -2,7 +2,15 @@ from datetime import datetime
 import uuid
 from typing import List, Optional, Union, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from ..config import settings
+from ..services.salary import parse_salary
+
+
+def normalize_countries(countries: List[str]) -> List[str]:
+    """Códigos de país da Adzuna em minúsculas, sem repetição, na ordem dada"""
+    return list(dict.fromkeys(country.strip().lower() for country in countries if country.strip()))
 
 
 class Job(BaseModel):
@@ -15,24 +23,90 @@ class Job(BaseModel):
     source: str
     remote: bool = False
     salary: Optional[Union[float, str]] = None
+    # Salário normalizado (preenchido a partir de ``salary`` se ausente)
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+    currency: Optional[str] = None
+    period: Optional[str] = None
     posted_date: Optional[str] = None
     job_type: Optional[str] = None
     requirements: Optional[str] = None
+    # Relevância para a busca que encontrou a vaga (``JobRanker``)
+    score: Optional[float] = None
     date_added: datetime = Field(default_factory=datetime.now)
 
     class Config:
         from_attributes = True
 
+    @model_validator(mode="after")
+    def normalize_salary(self) -> "Job":
+        """Preencher salary_min/max, currency e period a partir de ``salary``"""
+        if self.salary_min is None and self.salary is not None:
+            parsed = parse_salary(self.salary, self.currency, self.period)
+            if parsed:
+                self.salary_min, self.salary_max, self.currency, self.period = parsed
+        elif self.salary_min is not None and self.salary_max is None:
+            self.salary_max = self.salary_min
+        return self
+
 
 class JobSearch(BaseModel):
     """Modelo de busca de vagas"""
     keywords: str
     location: str
     sources: List[str] = ["adzuna", "linkedin"]
+    # Países da Adzuna consultados ao mesmo tempo (o primeiro tem preferência na cota)
+    countries: List[str] = Field(default_factory=lambda: list(settings.api.adzuna_countries))
     remote_only: bool = False
     custom_url: Optional[str] = None
     scraper_version: str = "v1"
     search_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # Preenchidos pela busca: situação de cada fonte ("ok", "failed",
+    # "timeout", "skipped") e se alguma ficou de fora do resultado
+    source_status: Dict[str, str] = Field(default_factory=dict)
+    partial: bool = False
+
+    @field_validator("countries")
+    @classmethod
+    def clean_countries(cls, countries: List[str]) -> List[str]:
+        return normalize_countries(countries)
+
+
+class SavedSearch(BaseModel):
+    """Busca salva, repetida periodicamente pelo agendador"""
+    id: Optional[int] = None
+    name: Optional[str] = None
+    keywords: str
+    location: str
+    sources: List[str] = ["adzuna"]
+    countries: List[str] = Field(default_factory=lambda: list(settings.api.adzuna_countries))
+    remote_only: bool = False
+    interval_minutes: int = 60
+    # 1 a 5: com a cota apertada, as de menor prioridade são adiadas primeiro
+    priority: int = Field(3, ge=1, le=5)
+    enabled: bool = True
+    last_run: Optional[datetime] = None
+    next_run: Optional[datetime] = None
+    last_search_id: Optional[str] = None
+    last_count: Optional[int] = None
+
+    @field_validator("countries")
+    @classmethod
+    def clean_countries(cls, countries: List[str]) -> List[str]:
+        return normalize_countries(countries)
+
+
+class JobFilters(BaseModel):
+    """Filtros aplicados às vagas guardadas (resultados de busca e histórico)"""
+    search_id: Optional[str] = None
+    remote: Optional[bool] = None
+    source: Optional[str] = None
+    job_type: Optional[str] = None
+    company: Optional[str] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    currency: Optional[str] = None
+    period: Optional[str] = None
 
 
 class JobSearchResponse(BaseModel):
@@ -1,113 +1,248 @@
 import aiohttp
-import logging
 import asyncio
-from typing import List, Optional
-from datetime import datetime
+import logging
+import math
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from ..models.job import Job
 from ..config import settings
+from ..services.extraction import JobText, is_remote, requirements_extractor
+from ..services.quota import QuotaExceeded
+from ..services.rate_limiter import HostRateLimiter, rate_limiter as shared_rate_limiter
+from ..services.retry import RetryPolicy, check_status, retry_policy as shared_retry_policy
+from ..services.salary import COUNTRY_CURRENCIES
 
 logger = logging.getLogger(__name__)
 
-class AdzunaScraper:
-    """Scraper para a API do Adzuna"""
-    
-    def __init__(self):
-        self.base_url = "https://api.adzuna.com/v1/api/jobs"
-        self.app_id = settings.api.adzuna_app_id
-        self.api_key = settings.api.adzuna_api_key
-        self.timeout = settings.scraper.timeout
-        self.retry_attempts = settings.scraper.retry_attempts
+
+class QuotaHooks(NamedTuple):
+    """Reserva e devolução de uma requisição na cota diária
+
+    Chamadas numa thread antes de cada página (``acquire`` retorna False se
+    a cota não permite) e quando a página falha (``release``).
+    """
+    acquire: Callable[[], bool]
+    release: Callable[[], None]
+
+
+class AsyncAdzunaClient:
+    """Cliente assíncrono da API do Adzuna
+
+    Uma sessão HTTP por event loop (pool de conexões reaproveitado entre
+    buscas), o ``HostRateLimiter`` do host da API, a ``RetryPolicy`` comum
+    e a paginação: a primeira página informa o total de vagas e as demais
+    (até ``max_pages``) são pedidas ao mesmo tempo. Cada página passa pelos
+    ``QuotaHooks`` recebidos, para a cota contar as requisições de fato.
+    """
+
+    BASE_URL = "https://api.adzuna.com/v1/api/jobs"
+
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        api_key: Optional[str] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        default_app_id, default_api_key, _ = settings.api.get_credentials()
+        self.app_id = app_id or settings.api.adzuna_app_id or default_app_id
+        self.api_key = api_key or settings.api.adzuna_api_key or default_api_key
+        self.timeout = aiohttp.ClientTimeout(total=settings.scraper.timeout)
         self.batch_size = settings.scraper.batch_size
-    
+        self.max_pages = settings.api.adzuna_max_pages
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.retry_policy = retry_policy or shared_retry_policy
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Sessão compartilhada, recriada se o event loop mudar"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            await self._close_stale_session()
+            connector = aiohttp.TCPConnector(limit_per_host=settings.scraper.limit_per_host, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._session_loop = loop
+        return self._session
+
+    async def _close_stale_session(self):
+        """Fechar a sessão de outro event loop antes de abrir a do loop atual"""
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed:
+            return
+        try:
+            if loop is not None and loop.is_running():
+                # O loop antigo segue vivo em outra thread: a sessão fecha nele
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                await session.close()
+        except Exception as e:
+            logger.warning(f"Erro ao fechar a sessão anterior do Adzuna: {e}")
+
+    async def close(self):
+        """Fechar a sessão HTTP"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def _params(self, keywords: str, location: str, remote_only: bool, results_per_page: int,
+                sort_by: Optional[str]) -> Dict:
+        params = {
+            "app_id": self.app_id,
+            "app_key": self.api_key,
+            "what": keywords,
+            "where": location,
+            "results_per_page": min(results_per_page, self.batch_size),
+            "content-type": "application/json"
+        }
+        if sort_by:
+            params["sort_by"] = sort_by
+        if remote_only:
+            params["category"] = "it-jobs"  # Categoria com mais vagas remotas
+            params["title_only"] = "remote"
+        return params
+
+    @staticmethod
+    def parse_results(data: Dict, country: str, remote_only: bool = False) -> List[Job]:
+        """Converter a resposta da API em vagas"""
+        jobs = []
+        for result in data.get("results") or []:
+            try:
+                text = JobText(
+                    result.get("title"),
+                    result.get("location", {}).get("display_name"),
+                    result.get("description")
+                )
+                jobs.append(Job(
+                    title=result.get("title", ""),
+                    company=result.get("company", {}).get("display_name", ""),
+                    location=result.get("location", {}).get("display_name", ""),
+                    description=result.get("description", ""),
+                    url=result.get("redirect_url", ""),
+                    source="Adzuna",
+                    remote=remote_only or is_remote(text),
+                    salary=result.get("salary_min"),
+                    # A Adzuna informa salários anuais na moeda do país
+                    salary_min=result.get("salary_min"),
+                    salary_max=result.get("salary_max"),
+                    currency=COUNTRY_CURRENCIES.get(country),
+                    period="year",
+                    posted_date=result.get("created"),
+                    job_type=result.get("contract_time", ""),
+                    requirements=requirements_extractor.summary(text) or None
+                ))
+            except Exception as e:
+                logger.error(f"Erro ao processar vaga do Adzuna: {str(e)}")
+        return jobs
+
+    async def fetch_page(
+        self,
+        params: Dict,
+        country: str = "us",
+        page: int = 1,
+        quota: Optional[QuotaHooks] = None
+    ) -> Dict:
+        """Uma página da busca (JSON), reservando-a na cota antes de pedir"""
+        if quota is not None and not await asyncio.to_thread(quota.acquire):
+            raise QuotaExceeded("Limite da cota do Adzuna atingido")
+        url = f"{self.BASE_URL}/{country}/search/{page}"
+        session = await self._get_session()
+
+        async def fetch():
+            async with self.rate_limiter.limit(url):
+                async with session.get(url, params=params) as response:
+                    if response.status != 200:
+                        logger.error(f"Erro ao buscar no Adzuna: {response.status} - {await response.text()}")
+                    check_status("Adzuna", response.status, response.headers)
+                    return await response.json(content_type=None)
+
+        try:
+            # Falhas passageiras (429, 5xx, rede) são repetidas com backoff
+            return await self.retry_policy.run("adzuna", fetch)
+        except BaseException:
+            if quota is not None:
+                await asyncio.to_thread(quota.release)
+            raise
+
+    async def search(
+        self,
+        keywords: str,
+        location: str,
+        remote_only: bool = False,
+        country: str = "us",
+        results_per_page: int = 50,
+        max_pages: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        quota: Optional[QuotaHooks] = None
+    ) -> Tuple[List[Job], int]:
+        """Vagas das primeiras ``max_pages`` páginas e o total informado pela API
+
+        Falhas são propagadas. Se a cota acabar depois da primeira página,
+        retorna as páginas já obtidas.
+        """
+        max_pages = max_pages or self.max_pages
+        params = self._params(keywords, location, remote_only, results_per_page, sort_by)
+        data = await self.fetch_page(params, country, 1, quota)
+        jobs = self.parse_results(data, country, remote_only)
+        count = data.get("count") or 0
+
+        pages = min(max_pages, math.ceil(count / params["results_per_page"])) if count else 1
+        if pages > 1:
+            results = await asyncio.gather(
+                *(self.fetch_page(params, country, page, quota) for page in range(2, pages + 1)),
+                return_exceptions=True
+            )
+            for page, result in enumerate(results, 2):
+                if isinstance(result, BaseException):
+                    logger.warning(f"[Adzuna] Página {page} ignorada: {result}")
+                    continue
+                jobs.extend(self.parse_results(result, country, remote_only))
+        return jobs, count
+
     async def search_jobs(
         self,
         keywords: str,
         location: str,
         remote_only: bool = False,
-        page: int = 1,
-        results_per_page: int = 50
+        country: str = "us",
+        results_per_page: int = 50,
+        max_pages: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        quota: Optional[QuotaHooks] = None,
+        raise_errors: bool = False
     ) -> List[Job]:
         """
         Buscar vagas no Adzuna
-        
+
         Args:
             keywords: Palavras-chave para busca
             location: Localização
             remote_only: Se deve buscar apenas vagas remotas
-            page: Página de resultados
+            country: Código do país (ex: "us", "gb", "br")
             results_per_page: Resultados por página
-            
+            max_pages: Páginas a buscar (padrão: ``ADZUNA_MAX_PAGES``)
+            sort_by: Ordenação ("date", "salary", "relevance")
+            quota: Reserva de cada página na cota diária
+            raise_errors: Propagar a falha (após as tentativas) em vez de
+                retornar uma lista vazia
+
         Returns:
             Lista de vagas encontradas
         """
+        logger.info(f"Buscando vagas no Adzuna ({country}): {keywords} em {location}")
         try:
-            logger.info(f"Buscando vagas no Adzuna: {keywords} em {location}")
-            
-            # Construir URL
-            url = f"{self.base_url}/us/search/{page}"
-            
-            # Parâmetros da busca
-            params = {
-                "app_id": self.app_id,
-                "app_key": self.api_key,
-                "what": keywords,
-                "where": location,
-                "results_per_page": min(results_per_page, self.batch_size),
-                "content-type": "application/json"
-            }
-            
-            if remote_only:
-                params["category"] = "it-jobs"  # Categoria com mais vagas remotas
-                params["title_only"] = "remote"
-            
-            # Fazer requisição com timeout e retry
-            for attempt in range(self.retry_attempts):
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, params=params, timeout=self.timeout) as response:
-                            if response.status != 200:
-                                logger.error(
-                                    f"Erro ao buscar no Adzuna: {response.status} - {await response.text()}"
-                                )
-                                continue
-                            
-                            data = await response.json()
-                            
-                            if not data or "results" not in data:
-                                logger.warning("Nenhuma vaga encontrada no Adzuna")
-                                return []
-                            
-                            # Processar resultados
-                            jobs = []
-                            for result in data["results"]:
-                                try:
-                                    job = Job(
-                                        title=result.get("title", ""),
-                                        company=result.get("company", {}).get("display_name", ""),
-                                        location=result.get("location", {}).get("display_name", ""),
-                                        description=result.get("description", ""),
-                                        url=result.get("redirect_url", ""),
-                                        source="Adzuna",
-                                        remote=remote_only,
-                                        salary=result.get("salary_min"),
-                                        posted_date=result.get("created"),
-                                        job_type=result.get("contract_time", ""),
-                                        requirements=result.get("description", "")
-                                    )
-                                    jobs.append(job)
-                                except Exception as e:
-                                    logger.error(f"Erro ao processar vaga do Adzuna: {str(e)}")
-                                    continue
-                            
-                            logger.info(f"[Adzuna] Encontradas {len(jobs)} vagas")
-                            return jobs
-                            
-                except asyncio.TimeoutError:
-                    logger.warning(f"Timeout na tentativa {attempt + 1} de {self.retry_attempts}")
-                    if attempt == self.retry_attempts - 1:
-                        raise
-                    continue
-                    
+            jobs, count = await self.search(
+                keywords, location, remote_only, country, results_per_page, max_pages, sort_by, quota
+            )
         except Exception as e:
             logger.error(f"Erro ao buscar no Adzuna: {str(e)}")
+            if raise_errors:
+                raise
             return []
+
+        if not jobs:
+            logger.warning("Nenhuma vaga encontrada no Adzuna")
+        logger.info(f"[Adzuna] Encontradas {len(jobs)} de {count} vagas")
+        return jobs
@@ -0,0 +1,261 @@
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
+
+from ..models.job import Job
+from .sources import HTMLSource, JSONSource, register_source
+
+
+def _city_state(item: Dict[str, Any]) -> str:
+    return ", ".join(part for part in (item.get("city"), item.get("state")) if part)
+
+
+@register_source
+class VagasSource(HTMLSource):
+    """Vagas.com.br"""
+
+    name = "vagas"
+    label = "Vagas.com.br"
+    base_url = "https://www.vagas.com.br"
+    card_selector = "li.vaga, div.vaga, li.vaga-container"
+    title_selector = "a.link-detalhes-vaga, h2.cargo a, h2.cargo"
+    company_selector = ".emprVaga, .empresa"
+    location_selector = ".local, .localizacao"
+    default_company = "Empresa Confidencial"
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        url = f"{self.base_url}/vagas-de-{quote(keywords.strip().replace(' ', '-'))}"
+        params = {"onde": location}
+        if page > 1:
+            params["pagina"] = page
+        return url, params
+
+
+@register_source
+class InfoJobsSource(HTMLSource):
+    """InfoJobs Brasil"""
+
+    name = "infojobs"
+    label = "InfoJobs"
+    base_url = "https://www.infojobs.com.br"
+    card_selector = "div.vaga"
+    title_selector = "h2.vaga-title"
+    company_selector = "span.company-name"
+    location_selector = "span.location"
+    link_selector = "a.vaga-link"
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        return f"{self.base_url}/empregos.aspx", {"palabra": keywords, "ubicacion": location, "page": page}
+
+
+@register_source
+class CathoSource(HTMLSource):
+    """Catho"""
+
+    name = "catho"
+    label = "Catho"
+    base_url = "https://www.catho.com.br"
+    card_selector = "div.job-card"
+    title_selector = "h2.job-title"
+    company_selector = "div.company-name"
+    location_selector = "div.location"
+    link_selector = "a.job-link"
+    default_company = "Empresa Confidencial"
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        url = f"{self.base_url}/vagas/{quote(keywords)}/{quote(location)}/"
+        return url, ({"page": page} if page > 1 else {})
+
+
+@register_source
+class TrabalhaBrasilSource(JSONSource):
+    """Trabalha Brasil"""
+
+    name = "trabalhabrasil"
+    label = "Trabalha Brasil"
+    results_key = "jobs"
+    page_size = 20
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        url = "https://www.trabalhabrasil.com.br/api/v1.0/job-search"
+        return url, {"q": keywords, "city": location, "page": page, "perPage": self.page_size}
+
+    def map_item(self, item: Dict[str, Any], location: str) -> Optional[Job]:
+        return Job(
+            title=item.get("title") or "",
+            company=item.get("company") or "Empresa não informada",
+            location=_city_state(item) or location,
+            url=f"https://www.trabalhabrasil.com.br/vaga/{item.get('slug')}",
+            source=self.label
+        )
+
+
+@register_source
+class IndeedSource(HTMLSource):
+    """Indeed (EUA)"""
+
+    name = "indeed"
+    label = "Indeed"
+    base_url = "https://www.indeed.com"
+    card_selector = "div.job_seen_beacon"
+    title_selector = "h2.jobTitle, h3.jobTitle, a.jobTitle, .title"
+    company_selector = ".companyName, .company, [data-testid='company-name']"
+    location_selector = ".companyLocation, .location, [data-testid='text-location']"
+    description_selector = ".job-snippet"
+    link_selector = "a[href]"
+    detail_selector = "div.jobsearch-jobDescriptionText, #jobDescriptionText"
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        params = {"q": keywords, "l": location, "filter": "0", "sort": "date", "limit": self.page_size}
+        if page > 1:
+            params["start"] = (page - 1) * self.page_size
+        return f"{self.base_url}/m/jobs", params
+
+    def job_url(self, card, link) -> Optional[str]:
+        job_key = card.get("data-jk")
+        if job_key:
+            return f"{self.base_url}/viewjob?jk={job_key}"
+        return super().job_url(card, link)
+
+
+@register_source
+class IndeedBrasilSource(IndeedSource):
+    """Indeed Brasil"""
+
+    name = "indeed_br"
+    label = "Indeed"
+    base_url = "https://br.indeed.com"
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        params = {"q": keywords, "l": location, "sort": "date", "fromage": 7}
+        if page > 1:
+            params["start"] = (page - 1) * self.page_size
+        return f"{self.base_url}/jobs", params
+
+
+@register_source
+class ProgramaThorSource(JSONSource):
+    """ProgramaThor"""
+
+    name = "programathor"
+    label = "ProgramaThor"
+    results_key = "jobs"
+    headers = {
+        "Accept": "application/json, text/plain, */*",
+        "Origin": "https://programathor.com.br",
+        "Referer": "https://programathor.com.br/"
+    }
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        url = "https://api.programathor.com.br/v1/jobs"
+        return url, {"search": keywords, "city": location, "page": page, "per_page": self.page_size}
+
+    def map_item(self, item: Dict[str, Any], location: str) -> Optional[Job]:
+        return Job(
+            title=item.get("title") or "",
+            company=(item.get("company") or {}).get("name") or "Empresa não informada",
+            location=_city_state(item) or location,
+            url=f"https://programathor.com.br/jobs/{item.get('slug')}",
+            source=self.label,
+            remote=bool(item.get("remote")),
+            salary=item.get("salary_range"),
+            currency="BRL" if item.get("salary_range") else None,  # faixas sem símbolo são em reais
+            requirements=", ".join(item.get("skills") or []) or None
+        )
+
+
+@register_source
+class GupySource(JSONSource):
+    """Gupy"""
+
+    name = "gupy"
+    label = "Gupy"
+    results_key = "data"
+    keyword_order_matters = True  # jobName busca o trecho no título da vaga
+    headers = {
+        "Accept": "application/json, text/plain, */*",
+        "Origin": "https://portal.gupy.io",
+        "Referer": "https://portal.gupy.io/"
+    }
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        url = "https://portal.api.gupy.io/api/v1/jobs"
+        return url, {
+            "jobName": keywords,
+            "city": location,
+            "limit": self.page_size,
+            "offset": (page - 1) * self.page_size
+        }
+
+    def map_item(self, item: Dict[str, Any], location: str) -> Optional[Job]:
+        workplace = (item.get("workplaceType") or "").lower()
+        return Job(
+            title=item.get("name") or "",
+            company=(item.get("company") or {}).get("name") or "Empresa não informada",
+            location=_city_state(item) or location,
+            url=f"https://portal.gupy.io/job/{item.get('id')}",
+            source=self.label,
+            remote=workplace == "remote",
+            description=item.get("description"),
+            posted_date=item.get("publishedDate"),
+            job_type=item.get("type"),
+            requirements=item.get("requirements")
+        )
+
+
+@register_source
+class MonsterSource(HTMLSource):
+    """Monster"""
+
+    name = "monster"
+    label = "Monster"
+    base_url = "https://www.monster.com"
+    card_selector = "section.card-content"
+    title_selector = ".title"
+    company_selector = ".company"
+    location_selector = ".location"
+    link_selector = "a[href]"
+    detail_selector = "div.job-description"
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        return f"{self.base_url}/jobs/search", {"q": keywords, "where": location, "page": page}
+
+
+@register_source
+class GlassdoorSource(HTMLSource):
+    """Glassdoor"""
+
+    name = "glassdoor"
+    label = "Glassdoor"
+    base_url = "https://www.glassdoor.com"
+    card_selector = "li.react-job-listing"
+    title_selector = "a.jobLink"
+    company_selector = "div.employer-name"
+    location_selector = "span.loc"
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        params = {"sc.keyword": keywords, "locT": "", "locId": "", "locKeyword": location}
+        if page > 1:
+            params["p"] = page
+        return f"{self.base_url}/Job/jobs.htm", params
+
+
+@register_source
+class LinkedInGuestSource(HTMLSource):
+    """LinkedIn (endpoint público de vagas)"""
+
+    name = "linkedin"
+    label = "LinkedIn"
+    base_url = "https://www.linkedin.com"
+    page_size = 25
+    card_selector = "div.base-card"
+    title_selector = "h3.base-search-card__title"
+    company_selector = "h4.base-search-card__subtitle"
+    location_selector = "span.job-search-card__location"
+    link_selector = "a.base-card__full-link"
+    date_selector = "time"
+    detail_selector = "div.description__text"
+    strip_query = True
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        url = f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+        return url, {"keywords": keywords, "location": location, "start": (page - 1) * self.page_size}
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Union
+
+import aiohttp
+
+from ..config import settings
+from ..models.job import Job
+from ..services.cache import TTLCache
+from ..services.rate_limiter import HostRateLimiter, rate_limiter as shared_rate_limiter
+from ..services.retry import HTTPStatusError, RetryPolicy, parse_retry_after, retry_policy as shared_retry_policy
+from . import boards  # noqa: F401 - registra as fontes
+from .sources import Source, available_sources, get_source
+
+logger = logging.getLogger(__name__)
+
+
+class SourceHTTPError(HTTPStatusError):
+    """Resposta HTTP de erro de uma fonte (bloqueio, limite, falha do servidor)"""
+
+
+class SourceEngine:
+    """Executa as fontes registradas de forma concorrente
+
+    Todas as fontes compartilham a mesma sessão HTTP (pool de conexões),
+    o mesmo cache de páginas e o mesmo limite de requisições simultâneas.
+    Cada host ainda passa pelo ``HostRateLimiter``, então fontes em hosts
+    diferentes rodam em paralelo sem sobrecarregar nenhum deles. Falhas
+    passageiras (429, 5xx, rede) são repetidas pela ``RetryPolicy``, fora
+    do limite de concorrência enquanto esperam.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        cache: Optional[TTLCache] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        self.max_concurrency = max_concurrency or settings.scraper.max_concurrency
+        self.limit_per_host = limit_per_host or settings.scraper.limit_per_host
+        self.timeout = aiohttp.ClientTimeout(total=settings.scraper.timeout)
+        self.cache = cache if cache is not None else TTLCache()
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.retry_policy = retry_policy or shared_retry_policy
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Sessão compartilhada, recriada se o event loop mudar"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._session_loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+        """Fechar a sessão HTTP"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def fetch_page(self, source: Union[str, Source], keywords: str, location: str, page: int) -> List[Job]:
+        """Baixar e interpretar uma página de resultados (fonte pelo nome ou objeto)
+
+        Falhas são propagadas, depois das novas tentativas da ``retry_policy``.
+        O cache guarda cópias das vagas e cada chamada recebe as suas: quem
+        chama pode alterá-las (ex.: ``job.score``) sem afetar outras buscas.
+        """
+        if isinstance(source, str):
+            source = get_source(source)
+        url, params = source.build_request(keywords, location, page)
+        cache_key = (source.name, url, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+        if settings.cache.enabled:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return [job.model_copy() for job in cached]
+
+        session = await self._get_session()
+
+        async def fetch():
+            async with self.rate_limiter.limit(url), self._semaphore:
+                async with session.get(url, params=params, headers=source.request_headers()) as response:
+                    if response.status != 200:
+                        raise SourceHTTPError(
+                            source.label, response.status, parse_retry_after(response.headers.get("Retry-After"))
+                        )
+                    if source.response_type == "json":
+                        return await response.json(content_type=None)
+                    return await response.text()
+
+        payload = await self.retry_policy.run(source.name, fetch)
+        jobs = source.parse(payload, keywords, location)
+        if settings.cache.enabled:
+            self.cache.set(cache_key, [job.model_copy() for job in jobs])
+        return jobs
+
+    async def fetch_detail(self, source: Source, url: str) -> str:
+        """Baixar a página de detalhes de uma vaga e extrair a descrição completa"""
+        if not source.detail_selector:
+            return ""
+        cache_key = (source.name, "detail", url)
+        if settings.cache.enabled:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        session = await self._get_session()
+
+        async def fetch():
+            async with self.rate_limiter.limit(url), self._semaphore:
+                async with session.get(url, headers=source.request_headers()) as response:
+                    if response.status != 200:
+                        raise SourceHTTPError(
+                            source.label, response.status, parse_retry_after(response.headers.get("Retry-After"))
+                        )
+                    return await response.text()
+
+        try:
+            html = await self.retry_policy.run(source.name, fetch)
+        except SourceHTTPError as e:
+            logger.warning(f"Erro ao buscar detalhes no {source.label}: {e.status}")
+            return ""
+
+        description = source.parse_detail(html)
+        if settings.cache.enabled:
+            self.cache.set(cache_key, description)
+        return description
+
+    async def search_source(
+        self,
+        name: str,
+        keywords: str,
+        location: str,
+        max_results: Optional[int] = None,
+        raise_errors: bool = False
+    ) -> List[Job]:
+        """Buscar vagas em uma fonte, seguindo a paginação
+
+        Erros são registrados e a busca retorna as vagas já obtidas; com
+        ``raise_errors`` um erro antes da primeira vaga é propagado, para o
+        chamador contar a falha (disjuntores, camadas).
+        """
+        try:
+            source = get_source(name)
+        except KeyError as e:
+            logger.error(e.args[0])
+            return []
+        started = time.perf_counter()
+        jobs: List[Job] = []
+        page = 1
+        try:
+            while True:
+                page_jobs = await self.fetch_page(source, keywords, location, page)
+                jobs.extend(page_jobs)
+                if max_results and len(jobs) >= max_results:
+                    jobs = jobs[:max_results]
+                    break
+                if not source.has_next_page(page, page_jobs):
+                    break
+                page += 1
+        except Exception as e:
+            logger.error(f"Erro ao buscar no {source.label}: {str(e)}")
+            if raise_errors and not jobs:
+                raise
+
+        logger.info(
+            f"[{source.label}] Encontradas {len(jobs)} vagas em {time.perf_counter() - started:.2f}s"
+        )
+        return jobs
+
+    async def search(
+        self,
+        keywords: str,
+        location: str,
+        sources: Optional[List[str]] = None,
+        max_results: Optional[int] = None
+    ) -> Dict[str, List[Job]]:
+        """
+        Buscar vagas em várias fontes ao mesmo tempo
+
+        Args:
+            keywords: Palavras-chave para busca
+            location: Localização
+            sources: Nomes das fontes (padrão: todas as registradas)
+            max_results: Máximo de vagas por fonte
+
+        Returns:
+            Dicionário fonte -> lista de vagas
+        """
+        names = [name.lower() for name in (sources or available_sources())]
+        results = await asyncio.gather(
+            *(self.search_source(name, keywords, location, max_results) for name in names)
+        )
+        return dict(zip(names, results))
+
+    def search_sync(
+        self,
+        keywords: str,
+        location: str,
+        sources: Optional[List[str]] = None,
+        max_results: Optional[int] = None
+    ) -> Dict[str, List[Job]]:
+        """Versão bloqueante de ``search`` para as interfaces Tk (rodam em threads)"""
+        async def run():
+            try:
+                return await self.search(keywords, location, sources, max_results)
+            finally:
+                await self.close()
+
+        return asyncio.run(run())
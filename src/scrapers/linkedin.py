@@ -5,6 +5,7 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 from ..models.job import Job
 from ..config import settings
+from ..services.retry import HTTPStatusError, check_status, retry_policy
 
 logger = logging.getLogger(__name__)
 
@@ -49,76 +50,75 @@ class LinkedInScraper:
                 "sortBy": "R"  # Ordenar por relevância
             }
             
-            # Fazer requisição
+            # Fazer requisição (429, 5xx e falhas de rede são repetidos com backoff)
             async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.base_url,
-                    params=params,
-                    headers=self.headers
-                ) as response:
-                    if response.status != 200:
-                        logger.error(
-                            f"Erro ao buscar no LinkedIn: {response.status}"
+                async def fetch():
+                    async with session.get(self.base_url, params=params, headers=self.headers) as response:
+                        check_status("LinkedIn", response.status, response.headers)
+                        return await response.text()
+
+                try:
+                    html = await retry_policy.run("linkedin", fetch)
+                except HTTPStatusError as e:
+                    logger.error(f"Erro ao buscar no LinkedIn: {e.status}")
+                    return []
+
+                soup = BeautifulSoup(html, "html.parser")
+                
+                # Encontrar cards de vagas
+                job_cards = soup.find_all(
+                    "div",
+                    class_="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card"
+                )
+                
+                if not job_cards:
+                    logger.warning("Nenhuma vaga encontrada no LinkedIn")
+                    return []
+                
+                # Processar resultados
+                jobs = []
+                for card in job_cards:
+                    try:
+                        # Extrair dados básicos
+                        title = card.find(
+                            "h3",
+                            class_="base-search-card__title"
+                        )
+                        company = card.find(
+                            "h4",
+                            class_="base-search-card__subtitle"
                         )
-                        return []
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, "html.parser")
-                    
-                    # Encontrar cards de vagas
-                    job_cards = soup.find_all(
-                        "div",
-                        class_="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card"
-                    )
-                    
-                    if not job_cards:
-                        logger.warning("Nenhuma vaga encontrada no LinkedIn")
-                        return []
-                    
-                    # Processar resultados
-                    jobs = []
-                    for card in job_cards:
-                        try:
-                            # Extrair dados básicos
-                            title = card.find(
-                                "h3",
-                                class_="base-search-card__title"
-                            )
-                            company = card.find(
-                                "h4",
-                                class_="base-search-card__subtitle"
-                            )
-                            location = card.find(
-                                "span",
-                                class_="job-search-card__location"
-                            )
-                            link = card.find("a")
-                            
-                            if not all([title, company, location, link]):
-                                continue
-                            
-                            # Criar objeto Job
-                            job = Job(
-                                title=title.text.strip(),
-                                company=company.text.strip(),
-                                location=location.text.strip(),
-                                url=link["href"],
-                                source="LinkedIn",
-                                remote=remote_only,
-                                posted_date=self._extract_date(card),
-                                description=self._extract_description(card)
-                            )
-                            jobs.append(job)
-                            
-                        except Exception as e:
-                            logger.error(
-                                f"Erro ao processar vaga do LinkedIn: {str(e)}"
-                            )
+                        location = card.find(
+                            "span",
+                            class_="job-search-card__location"
+                        )
+                        link = card.find("a")
+                        
+                        if not all([title, company, location, link]):
                             continue
-                    
-                    logger.info(f"[LinkedIn] Encontradas {len(jobs)} vagas")
-                    return jobs
-                    
+                        
+                        # Criar objeto Job
+                        job = Job(
+                            title=title.text.strip(),
+                            company=company.text.strip(),
+                            location=location.text.strip(),
+                            url=link["href"],
+                            source="LinkedIn",
+                            remote=remote_only,
+                            posted_date=self._extract_date(card),
+                            description=self._extract_description(card)
+                        )
+                        jobs.append(job)
+                        
+                    except Exception as e:
+                        logger.error(
+                            f"Erro ao processar vaga do LinkedIn: {str(e)}"
+                        )
+                        continue
+                
+                logger.info(f"[LinkedIn] Encontradas {len(jobs)} vagas")
+                return jobs
+                
         except Exception as e:
             logger.error(f"Erro ao buscar no LinkedIn: {str(e)}")
             return []
@@ -0,0 +1,173 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Type
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from ..models.job import Job
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+    "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+# Registro global de fontes: nome -> classe
+SOURCES: Dict[str, Type["Source"]] = {}
+
+
+def register_source(cls: Type["Source"]) -> Type["Source"]:
+    """Decorator que adiciona uma fonte ao registro"""
+    if not cls.name:
+        raise ValueError(f"Fonte sem nome: {cls.__name__}")
+    SOURCES[cls.name] = cls
+    return cls
+
+
+def get_source(name: str) -> "Source":
+    """Instanciar uma fonte registrada pelo nome"""
+    try:
+        return SOURCES[name.lower()]()
+    except KeyError:
+        raise KeyError(f"Fonte desconhecida: {name}. Opções: {sorted(SOURCES)}")
+
+
+def source_for_label(label: str) -> Optional["Source"]:
+    """Fonte registrada pelo rótulo gravado nas vagas (``Job.source``)"""
+    for cls in SOURCES.values():
+        if cls.label.lower() == (label or "").lower():
+            return cls()
+    return None
+
+
+def available_sources() -> List[str]:
+    """Nomes das fontes registradas"""
+    return sorted(SOURCES)
+
+
+class Source:
+    """Fonte de vagas declarativa
+
+    Cada site define como montar a URL de uma página de resultados, como
+    interpretar a resposta e quando existe uma próxima página. O download,
+    cache, concorrência e limites ficam no ``SourceEngine``.
+    """
+
+    name: str = ""
+    label: str = ""
+    response_type: str = "text"  # text ou json
+    page_size: int = 10
+    max_pages: int = 1
+    headers: Dict[str, str] = {}
+    detail_selector: Optional[str] = None
+    keyword_order_matters: bool = False  # True se a busca compara trechos na ordem digitada
+
+    def build_request(self, keywords: str, location: str, page: int) -> Tuple[str, Dict[str, Any]]:
+        """Retorna (url, params) da página de resultados"""
+        raise NotImplementedError
+
+    def parse(self, payload: Any, keywords: str, location: str) -> List[Job]:
+        """Converter a resposta em vagas"""
+        raise NotImplementedError
+
+    def has_next_page(self, page: int, jobs: List[Job], max_pages: Optional[int] = None) -> bool:
+        """Se deve buscar a próxima página (até ``max_pages``, padrão o da fonte)"""
+        return page < (max_pages or self.max_pages) and len(jobs) >= self.page_size
+
+    def request_headers(self) -> Dict[str, str]:
+        return {**DEFAULT_HEADERS, **self.headers}
+
+    def parse_detail(self, html: str) -> str:
+        """Extrair a descrição completa da página de detalhes da vaga"""
+        if not self.detail_selector or not html:
+            return ""
+        element = BeautifulSoup(html, "lxml").select_one(self.detail_selector)
+        return element.get_text(" ", strip=True) if element else ""
+
+
+class HTMLSource(Source):
+    """Fonte baseada em HTML descrita apenas por seletores CSS"""
+
+    base_url: str = ""
+    card_selector: str = ""
+    title_selector: str = ""
+    company_selector: Optional[str] = None
+    location_selector: Optional[str] = None
+    link_selector: Optional[str] = None  # padrão: o próprio título
+    description_selector: Optional[str] = None
+    salary_selector: Optional[str] = None
+    date_selector: Optional[str] = None
+    default_company: str = "Empresa não informada"
+    strip_query: bool = False
+
+    def _text(self, card, selector: Optional[str]) -> Optional[str]:
+        if not selector:
+            return None
+        element = card.select_one(selector)
+        return element.get_text(strip=True) if element else None
+
+    def job_url(self, card, link) -> Optional[str]:
+        """URL absoluta da vaga"""
+        if link is None or not link.get("href"):
+            return None
+        url = urljoin(self.base_url, link["href"])
+        return url.split("?")[0] if self.strip_query else url
+
+    def parse(self, payload: str, keywords: str, location: str) -> List[Job]:
+        soup = BeautifulSoup(payload, "lxml")
+        jobs = []
+        for card in soup.select(self.card_selector):
+            try:
+                title = self._text(card, self.title_selector)
+                link = card.select_one(self.link_selector or self.title_selector)
+                if link is not None and link.name != "a":
+                    link = link.find("a", href=True) or link.find_parent("a", href=True)
+                url = self.job_url(card, link)
+                if not title or not url:
+                    continue
+
+                posted_date = None
+                if self.date_selector:
+                    date_elem = card.select_one(self.date_selector)
+                    if date_elem:
+                        posted_date = date_elem.get("datetime") or date_elem.get_text(strip=True)
+
+                jobs.append(Job(
+                    title=title,
+                    company=self._text(card, self.company_selector) or self.default_company,
+                    location=self._text(card, self.location_selector) or location,
+                    description=self._text(card, self.description_selector),
+                    url=url,
+                    source=self.label,
+                    salary=self._text(card, self.salary_selector),
+                    posted_date=posted_date
+                ))
+            except Exception as e:
+                logger.error(f"Erro ao processar vaga do {self.label}: {str(e)}")
+                continue
+        return jobs
+
+
+class JSONSource(Source):
+    """Fonte baseada em API JSON"""
+
+    response_type = "json"
+    results_key: str = "results"
+
+    def map_item(self, item: Dict[str, Any], location: str) -> Optional[Job]:
+        """Converter um item da API em vaga"""
+        raise NotImplementedError
+
+    def parse(self, payload: Dict[str, Any], keywords: str, location: str) -> List[Job]:
+        jobs = []
+        for item in (payload or {}).get(self.results_key, []) or []:
+            try:
+                job = self.map_item(item, location)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                logger.error(f"Erro ao processar vaga do {self.label}: {str(e)}")
+                continue
+        return jobs
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+from urllib.parse import quote_plus
+
+from ..config import settings
+from ..models.job import Job
+from ..services.job_scraper import JobScraper
+from .engine import SourceEngine
+
+logger = logging.getLogger(__name__)
+
+# Camadas em ordem de custo
+TIERS = ("api", "static", "browser")
+
+
+class TieredFetcher:
+    """Busca em camadas: API JSON -> HTTP estático -> navegador headless
+
+    Cada site de ``settings.SITE_CONFIGS`` pode ser lido por até três
+    caminhos: a fonte registrada no ``SourceEngine`` (``"source"``), o HTML
+    estático via ``JobScraper.scrape_site`` e a página renderizada num
+    navegador do ``BrowserPool``. A camada mais barata é tentada primeiro e
+    só se escala quando ela falha ou não retorna vagas.
+
+    A última camada que funcionou é lembrada por site (em
+    ``settings.scraper.tier_state_file``), então buscas seguintes começam
+    nela. Depois de ``tier_recheck`` segundos as camadas mais baratas são
+    testadas de novo.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[SourceEngine] = None,
+        job_scraper: Optional[JobScraper] = None,
+        state_file: Optional[str] = None,
+        recheck_after: Optional[int] = None
+    ):
+        self.engine = engine or SourceEngine()
+        self.job_scraper = job_scraper or JobScraper()
+        self.state_file = state_file or settings.scraper.tier_state_file
+        self.recheck_after = recheck_after if recheck_after is not None else settings.scraper.tier_recheck
+        self._browser_pool = None
+        self.load_state()
+
+    def load_state(self):
+        """Carregar a última camada que funcionou por site"""
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r') as f:
+                    self.state = json.load(f)
+            else:
+                self.state = {}
+        except Exception as e:
+            logger.error(f"Erro ao carregar camadas de busca: {e}")
+            self.state = {}
+
+    def save_state(self):
+        """Salvar a última camada que funcionou por site"""
+        try:
+            with open(self.state_file, 'w') as f:
+                json.dump(self.state, f)
+        except Exception as e:
+            logger.error(f"Erro ao salvar camadas de busca: {e}")
+
+    @staticmethod
+    def site_for_source(name: str) -> Optional[str]:
+        """Site com busca em camadas correspondente a uma fonte do SourceEngine"""
+        for site_name, config in settings.SITE_CONFIGS.items():
+            if config.get("source") == name.lower():
+                return site_name
+        return None
+
+    def tiers_for(self, site_name: str) -> List[str]:
+        """Camadas disponíveis para o site, da mais barata à mais cara"""
+        config = settings.SITE_CONFIGS[site_name]
+        return [tier for tier in TIERS if tier != "api" or config.get("source")]
+
+    def last_tier(self, site_name: str) -> Optional[str]:
+        """Última camada que funcionou para o site"""
+        return (self.state.get(site_name) or {}).get("tier")
+
+    def _order(self, site_name: str) -> List[str]:
+        tiers = self.tiers_for(site_name)
+        entry = self.state.get(site_name)
+        if not entry or entry.get("tier") not in tiers or time.time() - entry.get("updated", 0) > self.recheck_after:
+            return tiers
+        start = tiers.index(entry["tier"])
+        return tiers[start:] + tiers[:start]
+
+    async def _fetch_api(self, site_name: str, config: Dict, keywords: str, location: str,
+                         max_results: Optional[int]) -> List[Job]:
+        return await self.engine.search_source(config["source"], keywords, location, max_results,
+                                               raise_errors=True)
+
+    async def _fetch_static(self, site_name: str, config: Dict, keywords: str, location: str,
+                            max_results: Optional[int]) -> List[Job]:
+        jobs = await asyncio.to_thread(
+            self.job_scraper.scrape_site, site_name, config, keywords, location, raise_errors=True
+        )
+        return jobs[:max_results] if max_results else jobs
+
+    def _get_browser_pool(self):
+        # Import tardio: o Playwright só é necessário se esta camada for usada
+        from ..services.browser_pool import BrowserPool
+
+        if self._browser_pool is None:
+            self._browser_pool = BrowserPool(size=1)
+        return self._browser_pool
+
+    async def _render(self, pool, url: str, config: Dict) -> str:
+        timeout = settings.scraper.timeout * 1000
+        async with pool.page(url) as page:
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            await page.wait_for_selector(config["selectors"]["job_cards"], state="attached", timeout=timeout)
+            return await page.content()
+
+    async def _fetch_browser(self, site_name: str, config: Dict, keywords: str, location: str,
+                             max_results: Optional[int]) -> List[Job]:
+        url = config["base_url"].format(quote_plus(keywords), quote_plus(location))
+        pool = self._get_browser_pool()
+        # O navegador fica no loop do pool: buscas em outros event loops (um
+        # asyncio.run por busca) reaproveitam o mesmo Chromium em vez de abrir outro
+        html = await asyncio.wrap_future(pool.submit(self._render(pool, url, config)))
+        jobs = self.job_scraper._extract_jobs_from_html(html, site_name, config)
+        return jobs[:max_results] if max_results else jobs
+
+    async def search(
+        self,
+        site_name: str,
+        keywords: str,
+        location: str,
+        max_results: Optional[int] = None,
+        raise_errors: bool = False
+    ) -> List[Job]:
+        """Buscar vagas no site escalando de camada só quando necessário
+
+        Com ``raise_errors``, se todas as camadas tentadas falharem (em vez
+        de só não encontrarem vagas) o último erro é propagado, para o
+        disjuntor da fonte contar a falha.
+        """
+        config = settings.SITE_CONFIGS[site_name]
+        fetchers = {"api": self._fetch_api, "static": self._fetch_static, "browser": self._fetch_browser}
+        tiers = self._order(site_name)
+        errors = []
+
+        for tier in tiers:
+            started = time.perf_counter()
+            try:
+                jobs = await fetchers[tier](site_name, config, keywords, location, max_results)
+            except Exception as e:
+                logger.warning(f"[{site_name}] Camada {tier} falhou: {str(e)}")
+                errors.append(e)
+                continue
+            if not jobs:
+                logger.info(f"[{site_name}] Camada {tier} não retornou vagas, escalando")
+                continue
+
+            logger.info(
+                f"[{site_name}] Camada {tier}: {len(jobs)} vagas em {time.perf_counter() - started:.2f}s"
+            )
+            if self.last_tier(site_name) != tier or time.time() - self.state[site_name]["updated"] > self.recheck_after:
+                self.state[site_name] = {"tier": tier, "updated": time.time()}
+                self.save_state()
+            return jobs
+
+        logger.error(f"[{site_name}] Nenhuma camada retornou vagas")
+        if raise_errors and len(errors) == len(tiers):
+            raise errors[-1]
+        return []
+
+    async def close(self):
+        """Fechar o navegador (se foi iniciado) e a sessão HTTP"""
+        if self._browser_pool is not None:
+            await asyncio.to_thread(self._browser_pool.shutdown)
+            self._browser_pool = None
+        await self.engine.close()
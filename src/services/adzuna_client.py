@@ -1,95 +1,129 @@
+import asyncio
 import logging
-from typing import List, Optional
-import requests
-from urllib.parse import urljoin
+import threading
+from typing import Any, Callable, Coroutine, List, Optional
 
 from ..models.job import Job
-from ..config import settings
+from ..scrapers.adzuna import AsyncAdzunaClient, QuotaHooks
+from .enrichment import merge_ranked
+from .quota import QuotaExceeded
 
 logger = logging.getLogger(__name__)
 
 class AdzunaClient:
-    """Cliente para a API do Adzuna Jobs"""
-    
-    BASE_URL = "http://api.adzuna.com/v1/api/jobs"
-    
-    def __init__(self, app_id: str, api_key: str):
-        self.app_id = app_id
-        self.api_key = api_key
-        self.session = requests.Session()
-    
+    """Fachada síncrona do ``AsyncAdzunaClient`` (JobService e scripts de teste)
+
+    As chamadas rodam num event loop próprio, numa thread em segundo plano,
+    então o pool de conexões, os limites por host, as novas tentativas e a
+    paginação são os mesmos do serviço assíncrono. Pode ser usada de várias
+    threads ao mesmo tempo.
+    """
+
+    def __init__(self, app_id: Optional[str] = None, api_key: Optional[str] = None):
+        self.client = AsyncAdzunaClient(app_id, api_key)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def run(self, coro: Coroutine) -> Any:
+        """Executar uma corrotina no loop do cliente (para código em threads)"""
+        with self._thread_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="adzuna-client", daemon=True)
+                self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
     def search_jobs(
-        self, 
-        what: str, 
-        where: str, 
+        self,
+        what: str,
+        where: str,
         country: str = "us",
         results_per_page: int = 50,
-        page: int = 1,
+        max_pages: Optional[int] = None,
         sort_by: str = "date",
+        remote_only: bool = False,
+        quota: Optional[QuotaHooks] = None,
+        raise_errors: bool = False
     ) -> List[Job]:
         """
         Buscar vagas usando a API do Adzuna.
-        
+
         Args:
             what: Palavras-chave para busca (ex: "python developer")
             where: Localização (ex: "New York")
             country: Código do país (ex: "us", "gb", "br")
             results_per_page: Número de resultados por página
-            page: Número da página
+            max_pages: Páginas a buscar (padrão: ``ADZUNA_MAX_PAGES``)
             sort_by: Ordenação ("date", "salary", "relevance")
+            remote_only: Se deve buscar apenas vagas remotas
+            quota: Reserva de cada página na cota diária
+            raise_errors: Propagar a falha em vez de retornar uma lista vazia
         """
-        try:
-            # Construir URL
-            url = f"{self.BASE_URL}/{country}/search/{page}"
-            
-            # Parâmetros da busca
-            params = {
-                "app_id": self.app_id,
-                "app_key": self.api_key,
-                "what": what,
-                "where": where,
-                "results_per_page": results_per_page,
-                "sort_by": sort_by,
-                "content-type": "application/json",
-            }
-            
-            # Fazer request
-            logger.info(f"Buscando vagas no Adzuna - keywords: {what}, location: {where}")
-            response = self.session.get(url, params=params)
-            
-            if response.status_code != 200:
-                logger.error(f"Erro na API do Adzuna: Status {response.status_code}")
-                return []
-            
-            # Parse do JSON
-            data = response.json()
-            
-            # Extrair vagas
-            jobs = []
-            for result in data.get("results", []):
-                try:
-                    job = Job(
-                        title=result.get("title", "N/A"),
-                        company=result.get("company", {}).get("display_name", "N/A"),
-                        location=result.get("location", {}).get("display_name", "N/A"),
-                        description=result.get("description", "N/A"),
-                        url=result.get("redirect_url"),
-                        source="Adzuna",
-                        salary=result.get("salary_min"),
-                        posted_date=result.get("created"),
-                        remote=any(
-                            term in result.get("description", "").lower()
-                            for term in ["remote", "home office", "work from home"]
-                        )
+        return self.run(self.client.search_jobs(
+            keywords=what,
+            location=where,
+            remote_only=remote_only,
+            country=country,
+            results_per_page=results_per_page,
+            max_pages=max_pages,
+            sort_by=sort_by,
+            quota=quota,
+            raise_errors=raise_errors
+        ))
+
+    def search_countries(
+        self,
+        what: str,
+        where: str,
+        countries: List[str],
+        quota: Optional[Callable[[str], QuotaHooks]] = None,
+        **kwargs
+    ) -> List[Job]:
+        """Buscar em vários países ao mesmo tempo, intercalando os resultados
+
+        ``quota`` recebe o país e devolve os ``QuotaHooks`` dele. Um país que
+        falha fica de fora; se todos falharem, o erro é propagado (para o
+        disjuntor da fonte contar a falha). Os demais argumentos são os de
+        ``search_jobs``.
+        """
+        async def search():
+            results = await asyncio.gather(
+                *(
+                    self.client.search_jobs(
+                        keywords=what,
+                        location=where,
+                        country=country,
+                        quota=quota(country) if quota else None,
+                        raise_errors=True,
+                        **kwargs
                     )
-                    jobs.append(job)
-                except Exception as e:
-                    logger.error(f"Erro ao processar vaga do Adzuna: {str(e)}")
-                    continue
-            
-            logger.info(f"[OK] Adzuna: Encontradas {len(jobs)} vagas")
-            return jobs
-            
-        except Exception as e:
-            logger.error(f"Erro ao buscar vagas no Adzuna: {str(e)}")
-            return []
+                    for country in countries
+                ),
+                return_exceptions=True
+            )
+            ranked, errors = [], []
+            for country, result in zip(countries, results):
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                    logger.warning(f"[adzuna:{country}] {result}")
+                else:
+                    ranked.append(result)
+            if errors and not ranked:
+                # Uma falha de verdade pesa mais que a falta de cota
+                raise next((e for e in errors if not isinstance(e, QuotaExceeded)), errors[0])
+            return merge_ranked(ranked)
+
+        return self.run(search())
+
+    def close(self):
+        """Fechar a sessão HTTP e parar o loop em segundo plano"""
+        with self._thread_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.client.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
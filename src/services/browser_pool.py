@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from typing import Any, Coroutine, Dict, Optional
+
+from playwright.async_api import Browser, BrowserContext, Error as PlaywrightError
+from playwright.async_api import Page, Playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+from ..config import settings
+from .resource_blocking import ResourceBlocker
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Pool de contextos Playwright sobre um único Chromium de longa duração
+
+    O navegador é iniciado uma vez e mantém ``size`` contextos aquecidos;
+    cada ``page()`` empresta um contexto, abre uma página e devolve o
+    contexto ao final. Contextos são reciclados após ``max_uses`` usos,
+    quando a página trava ou quando o heap JS passa de ``page_memory_mb``.
+    Cada página passa pelo perfil de bloqueio de recursos (``ResourceBlocker``).
+    Se o navegador cair, ele é reiniciado no próximo empréstimo.
+
+    Objetos Playwright pertencem ao event loop que os criou. Código
+    assíncrono usa ``page()`` no próprio loop; as interfaces Tk (threads)
+    usam ``run()`` e quem não controla o loop (``TieredFetcher``) usa
+    ``submit()``: as corrotinas rodam num loop dedicado em segundo plano,
+    mantendo o navegador vivo entre as buscas.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        page_memory_mb: Optional[int] = None,
+        headless: Optional[bool] = None,
+        blocker: Optional[ResourceBlocker] = None
+    ):
+        config = settings.browser
+        self.size = size or config.pool_size
+        self.max_uses = max_uses or config.max_uses
+        self.page_memory_mb = page_memory_mb or config.page_memory_mb
+        self.headless = config.headless if headless is None else headless
+        self.context_options = {"viewport": config.viewport, "user_agent": config.user_agent}
+        self.blocker = blocker or ResourceBlocker()
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._uses: Dict[BrowserContext, int] = {}
+        self._start_lock: Optional[asyncio.Lock] = None
+
+        # Loop em segundo plano usado por ``run``
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+        # Estatísticas
+        self.launches = 0
+        self.recycled = 0
+        self.startup_seconds = 0.0
+
+    async def _launch_browser(self):
+        started = time.perf_counter()
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            # Limita o heap V8 de cada processo de renderização
+            args=[f"--js-flags=--max-old-space-size={self.page_memory_mb}"]
+        )
+        self.launches += 1
+        self.startup_seconds = time.perf_counter() - started
+        logger.info(f"Chromium iniciado em {self.startup_seconds:.2f}s")
+
+    async def _new_context(self) -> BrowserContext:
+        if self._browser is None or not self._browser.is_connected():
+            logger.warning("Navegador indisponível, reiniciando")
+            await self._launch_browser()
+        context = await self._browser.new_context(**self.context_options)
+        self._uses[context] = 0
+        return context
+
+    async def _discard(self, context: BrowserContext):
+        self._uses.pop(context, None)
+        self.recycled += 1
+        try:
+            await context.close()
+        except PlaywrightError:
+            pass
+
+    async def start(self):
+        """Iniciar o navegador e aquecer os contextos (idempotente)"""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            await self._launch_browser()
+            self._idle = asyncio.Queue()
+            for _ in range(self.size):
+                self._idle.put_nowait(await self._new_context())
+
+    async def _over_memory(self, page: Page) -> bool:
+        try:
+            used = await page.evaluate("() => performance.memory ? performance.memory.usedJSHeapSize : 0")
+        except PlaywrightError:
+            return True
+        return used > self.page_memory_mb * 1024 * 1024
+
+    @asynccontextmanager
+    async def page(self, site: Optional[str] = None):
+        """Emprestar uma página de um contexto aquecido
+
+        ``site`` (URL ou host) escolhe as exceções do bloqueio de recursos.
+        """
+        await self.start()
+        context = await self._idle.get()
+        healthy = True
+        crashed = []
+        page = None
+        try:
+            if context is None:
+                context = await self._new_context()
+            page = await context.new_page()
+            page.on("crash", crashed.append)
+            await self.blocker.apply_playwright(page, site)
+            yield page
+        except PlaywrightTimeoutError:
+            raise
+        except PlaywrightError:
+            healthy = False
+            raise
+        finally:
+            if context is not None:
+                if crashed:
+                    logger.error("Página travou, contexto será reciclado")
+                    healthy = False
+                if page is not None:
+                    healthy = healthy and not page.is_closed() and not await self._over_memory(page)
+                    try:
+                        await page.close()
+                    except PlaywrightError:
+                        healthy = False
+                self._uses[context] = self._uses.get(context, 0) + 1
+                if not healthy or self._uses[context] >= self.max_uses:
+                    await self._discard(context)
+                    context = None  # recriado no próximo empréstimo
+            self._idle.put_nowait(context)
+
+    async def close(self):
+        """Fechar contextos, navegador e Playwright"""
+        if self._idle is not None:
+            while not self._idle.empty():
+                context = self._idle.get_nowait()
+                if context is not None:
+                    await self._discard(context)
+            self._idle = None
+        self._start_lock = None
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except PlaywrightError:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Agendar uma corrotina no loop do pool, sem esperar o resultado
+
+        Código assíncrono de outro loop aguarda com ``asyncio.wrap_future``.
+        """
+        with self._thread_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="browser-pool", daemon=True
+                )
+                self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine) -> Any:
+        """Executar uma corrotina no loop do pool (para código em threads)"""
+        return self.submit(coro).result()
+
+    def shutdown(self):
+        """Fechar o pool e parar o loop em segundo plano"""
+        with self._thread_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,128 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from ..config import settings
+from ..models.job import JobSearch
+from ..scrapers import boards  # noqa: F401 - registra as fontes
+from ..scrapers.sources import SOURCES
+from .extraction import fold
+
+# Palavra de uma busca: preserva símbolos de tecnologias ("c++", "c#", ".net", "node.js")
+_QUERY_TOKEN = re.compile(r"[a-z0-9.+#]+(?:-[a-z0-9.+#]+)*")
+# Separadores entre cidade e estado/país ("Campinas, SP", "Recife - PE", "Austin/TX")
+_LOCATION_PARTS = re.compile(r"\s*[,/]\s*|\s+[-–—]\s+")
+
+
+class CanonicalQuery(NamedTuple):
+    """Forma canônica de uma busca
+
+    ``keywords`` e ``location`` são o texto digitado (só com os espaços
+    limpos) e é isso que as fontes recebem: cada uma entende o local à sua
+    maneira. ``canonical_location`` (o nome pela tabela de apelidos) e
+    ``key`` servem só para identificar a busca no cache, na coalescência de
+    buscas iguais, no crawl e nas estatísticas, iguais para todas as grafias
+    equivalentes.
+    """
+    keywords: str
+    location: str
+    canonical_location: str
+    sources: tuple
+    remote_only: bool
+    countries: tuple
+    key: str
+
+    @property
+    def digest(self) -> str:
+        """Resumo curto e estável da chave (ids de crawl, logs)"""
+        return hashlib.sha1(self.key.encode("utf-8")).hexdigest()[:16]
+
+
+def query_tokens(text: str) -> List[str]:
+    """Palavras normalizadas (minúsculas, sem acentos) de um texto de busca"""
+    return [token.rstrip(".") or token for token in _QUERY_TOKEN.findall(fold(text))]
+
+
+def order_matters(sources: Iterable[str]) -> bool:
+    """Se alguma fonte considera a ordem das palavras (ex.: busca por trecho do título)"""
+    return any(getattr(SOURCES.get(source), "keyword_order_matters", False) for source in sources)
+
+
+class QueryCanonicalizer:
+    """Normaliza palavras-chave e locais para uma chave estável
+
+    - espaços e maiúsculas/minúsculas são ignorados;
+    - acentos são ignorados na chave ("São Paulo" = "Sao Paulo");
+    - a ordem das palavras é ignorada quando nenhuma fonte a considera
+      ("python developer" = "developer python");
+    - locais passam pela tabela de apelidos (``settings.query.location_aliases``,
+      "Sao Paulo, SP" = "sp" = "São Paulo"); fora dela, a sigla do estado/país
+      continua na chave ("Portland, OR" != "Portland, ME"), com qualquer
+      separador ("Recife - PE" = "Recife/PE" = "Recife, PE");
+    - os países só entram na chave quando a Adzuna está entre as fontes, em
+      qualquer ordem ("br,us" = "us,br").
+    """
+
+    def __init__(self, location_aliases: Optional[Dict[str, List[str]]] = None):
+        aliases = location_aliases if location_aliases is not None else settings.query.location_aliases
+        self._aliases: Dict[str, str] = {}
+        for name, variants in aliases.items():
+            for variant in [name, *variants]:
+                self._aliases[" ".join(query_tokens(variant))] = name
+        self.location = lru_cache(maxsize=4096)(self._location)
+
+    def _location(self, location: str) -> str:
+        """Nome canônico de um local (o próprio texto, limpo, se desconhecido)"""
+        text = " ".join(location.split())
+        alias = self._aliases.get(" ".join(query_tokens(text)))
+        if alias is not None:
+            return alias
+        # "Recife - PE" -> "Recife, PE": a sigla fica, só o separador muda
+        parts = ", ".join(part for part in _LOCATION_PARTS.split(text) if part)
+        return self._aliases.get(" ".join(query_tokens(parts)), parts)
+
+    def canonicalize(
+        self,
+        keywords: str,
+        location: str,
+        sources: Iterable[str] = (),
+        remote_only: bool = False,
+        countries: Iterable[str] = ()
+    ) -> CanonicalQuery:
+        sources = tuple(sorted({source.lower() for source in sources}))
+        countries = tuple(sorted({country.lower() for country in countries})) if "adzuna" in sources else ()
+        tokens = query_tokens(keywords)
+        if not order_matters(sources):
+            tokens = sorted(tokens)
+        location = " ".join(location.split())
+        canonical_location = self.location(location)
+        parts = [
+            " ".join(tokens),
+            " ".join(query_tokens(canonical_location)),
+            ",".join(sources),
+            "remote" if remote_only else "any",
+        ]
+        if countries:
+            parts.append(",".join(countries))
+        return CanonicalQuery(
+            " ".join(keywords.split()), location, canonical_location, sources, remote_only, countries, "|".join(parts)
+        )
+
+
+canonicalizer = QueryCanonicalizer()
+
+
+def canonical_query(
+    search: Union[JobSearch, str],
+    location: Optional[str] = None,
+    sources: Iterable[str] = (),
+    remote_only: bool = False,
+    countries: Iterable[str] = ()
+) -> CanonicalQuery:
+    """Forma canônica de um ``JobSearch`` (ou de palavras-chave e local)"""
+    if isinstance(search, JobSearch):
+        return canonicalizer.canonicalize(
+            search.keywords, search.location, search.sources, search.remote_only, search.countries
+        )
+    return canonicalizer.canonicalize(search, location or "", sources, remote_only, countries)
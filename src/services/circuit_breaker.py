@@ -0,0 +1,133 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Estados do disjuntor
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitBreaker:
+    """Disjuntor de uma fonte de vagas
+
+    Depois de ``failure_threshold`` falhas seguidas o disjuntor abre e a
+    fonte é pulada na hora, sem gastar o prazo da busca. Passados
+    ``reset_timeout`` segundos ele fica meio-aberto: até ``half_open_probes``
+    chamadas de teste passam; um sucesso fecha o disjuntor e uma falha o
+    abre de novo. Seguro para threads (``JobService``) e para o event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        half_open_probes: Optional[int] = None
+    ):
+        config = settings.circuit
+        self.name = name
+        self.failure_threshold = failure_threshold or config.failure_threshold
+        self.reset_timeout = reset_timeout or config.reset_timeout
+        self.half_open_probes = half_open_probes or config.half_open_probes
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self.successes = 0
+        self.total_failures = 0
+        self.rejected = 0
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """Se a chamada pode seguir (no meio-aberto, conta como teste)"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def release_probe(self):
+        """Devolver uma chamada liberada por ``allow`` que não chegou a ser feita"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"[{self.name}] Disjuntor fechado")
+            self._state = CLOSED
+            self._failures = 0
+            self._probes = 0
+            self.successes += 1
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self.total_failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        f"[{self.name}] Disjuntor aberto após {self._failures} falhas; "
+                        f"pulando a fonte por {self.reset_timeout:.0f}s"
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            state = self._current_state()
+            retry_in = self.reset_timeout - (time.monotonic() - self._opened_at) if state == OPEN else 0.0
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "successes": self.successes,
+                "failures": self.total_failures,
+                "rejected": self.rejected,
+                "retry_in": round(max(retry_in, 0.0), 1),
+            }
+
+
+class CircuitBreakerRegistry:
+    """Um disjuntor por fonte, criado no primeiro uso"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        name = name.lower()
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name)
+            return breaker
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in sorted(breakers.items())}
+
+
+# Disjuntores compartilhados por todos os serviços do processo
+breakers = CircuitBreakerRegistry()
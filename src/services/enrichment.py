@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from itertools import zip_longest
+from typing import Dict, Iterable, List, Optional
+
+from ..config import settings
+from ..database.db import Database
+from ..models.job import Job
+from ..scrapers.engine import SourceEngine
+from ..scrapers.sources import source_for_label
+from .extraction import JobText, SkillExtractor, is_remote, requirements_extractor
+from .salary import find_salary
+
+logger = logging.getLogger(__name__)
+
+
+def dedup_key(job: Job) -> str:
+    """Chave de duplicata: título, empresa e local normalizados"""
+    return "|".join(" ".join(JobText(value).tokens) for value in (job.title, job.company, job.location))
+
+
+def merge_ranked(ranked: Iterable[List[Job]]) -> List[Job]:
+    """Intercalar listas já ordenadas pela fonte, sem vagas repetidas
+
+    As listas (ex.: uma por país da Adzuna, cada uma na ordem da API) são
+    percorridas em rodízio, então o topo do resultado tem o melhor de cada
+    uma; a mesma vaga presente em várias listas (``dedup_key``) aparece
+    uma vez, na primeira posição em que surgiu.
+    """
+    seen = set()
+    merged = []
+    for jobs in zip_longest(*ranked):
+        for job in jobs:
+            if job is None:
+                continue
+            key = dedup_key(job)
+            if key not in seen:
+                seen.add(key)
+                merged.append(job)
+    return merged
+
+
+class EnrichmentQueue:
+    """Fila assíncrona que completa as vagas depois da resposta da busca
+
+    ``submit`` só enfileira; os workers buscam a descrição completa quando
+    a da listagem é curta (``SourceEngine.fetch_detail``), extraem
+    habilidades, senioridade, requisitos, remoto e salário sobre um único
+    ``JobText``, calculam a chave de duplicata e gravam tudo na tabela
+    ``jobs``. Com a fila cheia, novas vagas são descartadas (e contadas)
+    para a busca nunca esperar pelo enriquecimento.
+    """
+
+    def __init__(
+        self,
+        db: Optional[Database] = None,
+        engine: Optional[SourceEngine] = None,
+        extractor: Optional[SkillExtractor] = None,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        fetch_details: Optional[bool] = None
+    ):
+        config = settings.enrichment
+        self.db = db or Database()
+        self._owns_engine = engine is None
+        self.engine = engine or SourceEngine()
+        self.extractor = extractor or SkillExtractor(config.skills, config.levels)
+        self.workers = workers or config.workers
+        self.queue_size = queue_size or config.queue_size
+        self.fetch_details = config.fetch_details if fetch_details is None else fetch_details
+        self.min_description = config.min_description
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks = []
+        self._completed = deque(maxlen=1000)  # instantes de conclusão, para a vazão recente
+        self.started_at: Optional[float] = None
+        self.submitted = 0
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.details_fetched = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self):
+        """Iniciar os workers no event loop atual"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self.workers)]
+        self.started_at = time.monotonic()
+        logger.info(f"Fila de enriquecimento iniciada com {self.workers} workers")
+
+    async def stop(self, drain_timeout: float = 5.0):
+        """Parar os workers (esperando até ``drain_timeout`` pela fila esvaziar)"""
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Fila de enriquecimento parada com {self._queue.qsize()} vagas pendentes")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._owns_engine:
+            await self.engine.close()
+
+    def submit(self, jobs: Iterable[Job]) -> int:
+        """Enfileirar vagas sem bloquear; retorna quantas entraram na fila"""
+        if not self.running:
+            return 0
+        accepted = 0
+        for job in jobs:
+            try:
+                self._queue.put_nowait(job)
+                accepted += 1
+            except asyncio.QueueFull:
+                self.dropped += 1
+        self.submitted += accepted
+        return accepted
+
+    async def _worker(self, index: int):
+        while True:
+            job = await self._queue.get()
+            started = time.perf_counter()
+            try:
+                fields = await self.enrich(job)
+                await asyncio.to_thread(self.db.save_enrichment, job.url, job.source, fields)
+                self.processed += 1
+                self._completed.append(time.monotonic())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Erro ao enriquecer vaga {job.url}: {str(e)}")
+            finally:
+                self.busy_seconds += time.perf_counter() - started
+                self._queue.task_done()
+
+    async def enrich(self, job: Job) -> Dict:
+        """Campos enriquecidos de uma vaga"""
+        fields: Dict = {}
+        description = job.description or ""
+        if self.fetch_details and len(description) < self.min_description:
+            source = source_for_label(job.source)
+            if source is not None and source.detail_selector:
+                detail = await self.engine.fetch_detail(source, job.url)
+                if len(detail) > len(description):
+                    description = fields["description"] = detail
+                    self.details_fetched += 1
+
+        # O texto é normalizado uma vez para todos os classificadores (em thread,
+        # para descrições longas não travarem o event loop)
+        def classify() -> Dict:
+            text = JobText(job.title, job.location, description)
+            found = self.extractor.extract(text)
+            result = {
+                "skills": found["skills"],
+                "level": found["level"],
+                "remote": job.remote or is_remote(text),
+                "requirements": requirements_extractor.summary(text) or job.requirements,
+                "dedup_key": dedup_key(job),
+            }
+            if job.salary_min is None:
+                salary = find_salary(description)
+                if salary:
+                    result.update(
+                        salary_min=salary.min, salary_max=salary.max,
+                        currency=salary.currency, period=salary.period
+                    )
+            return result
+
+        fields.update(await asyncio.to_thread(classify))
+        return fields
+
+    def metrics(self) -> Dict:
+        """Profundidade da fila, contadores e vazão"""
+        now = time.monotonic()
+        uptime = now - self.started_at if self.started_at else 0.0
+        recent = sum(1 for finished in self._completed if now - finished <= 60)
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_size": self.queue_size,
+            "submitted": self.submitted,
+            "processed": self.processed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "details_fetched": self.details_fetched,
+            "throughput_per_second": round(self.processed / uptime, 2) if uptime else 0.0,
+            "throughput_last_minute": recent,
+            "avg_job_ms": round(self.busy_seconds / max(1, self.processed + self.failed) * 1000, 1),
+        }
@@ -0,0 +1,443 @@
+import re
+import unicodedata
+from functools import cached_property, lru_cache
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+
+def fold(text: str) -> str:
+    """Minúsculas e sem acentos ("Segurança" -> "seguranca")
+
+    Caracteres sem equivalente ASCII são descartados, então as posições
+    se referem ao texto normalizado.
+    """
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+
+
+# Limite de palavra no texto normalizado (só ASCII)
+_WORD = "a-z0-9_"
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Palavras de um texto normalizado com ``fold``"""
+    return _TOKEN.findall(text)
+
+
+@lru_cache(maxsize=4096)
+def _phrase_key(phrase: str) -> Tuple[int, str]:
+    """(número de palavras, n-grama) de uma frase buscada"""
+    tokens = tokenize(fold(phrase))
+    return len(tokens), " ".join(tokens)
+
+
+class NormalizedText:
+    """Formas normalizadas de um texto, calculadas uma vez sob demanda
+
+    Guarda o original, ``lower`` (mesmas posições do original, usado pelo
+    extrator de requisitos), ``folded`` (sem acentos, usado pelo autômato de
+    habilidades e senioridade), ``tokens`` e os n-gramas de tokens. Cada
+    forma só é calculada no primeiro acesso e reaproveitada por todos os
+    classificadores.
+    """
+
+    def __init__(self, text: Optional[str] = None):
+        self.text = text or ""
+        self._ngrams: Dict[int, FrozenSet[str]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def folded(self) -> str:
+        return fold(self.text)
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        return tuple(tokenize(self.folded))
+
+    def ngrams(self, n: int) -> FrozenSet[str]:
+        """N-gramas de tokens unidos por espaço ("home office")"""
+        if n not in self._ngrams:
+            tokens = self.tokens
+            self._ngrams[n] = frozenset(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return self._ngrams[n]
+
+    def contains(self, phrase: str) -> bool:
+        """Se a frase aparece como sequência de palavras inteiras"""
+        size, key = _phrase_key(phrase)
+        return size > 0 and key in self.ngrams(size)
+
+    def contains_any(self, phrases: Iterable[str]) -> bool:
+        return any(self.contains(phrase) for phrase in phrases)
+
+
+class JobText(NormalizedText):
+    """Texto normalizado de uma vaga (título, local e descrição)
+
+    É o estágio de normalização do pipeline: construído uma vez por vaga e
+    passado aos classificadores (remoto, senioridade, habilidades,
+    requisitos), que não repetem ``lower``, concatenação ou remoção de
+    acentos. Cada campo fica disponível separado; o texto completo junta os
+    campos por quebra de linha e os n-gramas não atravessam campos.
+    """
+
+    FIELDS = ("title", "location", "description")
+
+    def __init__(self, title: Optional[str] = None, location: Optional[str] = None,
+                 description: Optional[str] = None):
+        self.title = NormalizedText(title)
+        self.location = NormalizedText(location)
+        self.description = NormalizedText(description)
+        super().__init__("\n".join(self._field(name).text for name in self.FIELDS))
+
+    @classmethod
+    def from_job(cls, job) -> "JobText":
+        """Normalizar um ``Job`` (ou qualquer objeto com os mesmos campos)"""
+        return cls(job.title, job.location, job.description)
+
+    def _field(self, name: str) -> NormalizedText:
+        return getattr(self, name)
+
+    @cached_property
+    def lower(self) -> str:
+        return "\n".join(self._field(name).lower for name in self.FIELDS)
+
+    @cached_property
+    def folded(self) -> str:
+        return "\n".join(self._field(name).folded for name in self.FIELDS)
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        return tuple(token for name in self.FIELDS for token in self._field(name).tokens)
+
+    def ngrams(self, n: int) -> FrozenSet[str]:
+        if n not in self._ngrams:
+            self._ngrams[n] = frozenset().union(*(self._field(name).ngrams(n) for name in self.FIELDS))
+        return self._ngrams[n]
+
+
+TextInput = Union[str, NormalizedText, None]
+
+
+# Termos de trabalho remoto, em palavras inteiras ("remote" não casa em "remotely")
+REMOTE_TERMS = [
+    "remote", "remotely", "remoto", "remota", "trabalho remoto", "home office",
+    "work from home", "wfh",
+]
+HYBRID_TERMS = ["hibrido", "hibrida", "hybrid"]
+
+
+@lru_cache(maxsize=32)
+def _term_matcher(terms: Tuple[str, ...]) -> "TermMatcher":
+    return TermMatcher({term: term for term in terms})
+
+
+def is_remote(text: TextInput, terms: Iterable[str] = REMOTE_TERMS) -> bool:
+    """Classificador de vaga remota sobre o texto normalizado"""
+    return _term_matcher(tuple(terms)).contains(text)
+
+
+class Match(NamedTuple):
+    """Ocorrência de um termo no texto (posições no texto normalizado)"""
+    start: int
+    end: int
+    term: str
+    value: str
+
+
+class TermMatcher:
+    """Encontra muitos termos numa única passada pelo texto
+
+    Os termos são normalizados com ``fold`` e compilados numa trie; a trie
+    vira uma única expressão regular fatorada por prefixo (um autômato que
+    o motor ``re`` percorre em C), então o custo por descrição não cresce
+    com o número de termos. Só contam ocorrências em limite de palavra:
+    "java" não casa dentro de "javascript", mas "security+" e "5+ years"
+    casam normalmente.
+
+    A busca retoma a cada início de palavra, então termos sobrepostos são
+    todos reportados ("penetration testing" e "testing tools" em
+    "penetration testing tools"), assim como os contidos em outro termo
+    ("security" dentro de "network security"). Em cada posição o autômato
+    casa o termo mais longo; os que são prefixo dele vêm de ``_prefixes``.
+    """
+
+    def __init__(self, terms: Optional[Dict[str, str]] = None):
+        self._values: Dict[str, List[str]] = {}  # termo normalizado -> valores
+        self._pattern = None
+        self._prefixes: Dict[str, List[str]] = {}
+        for term, value in (terms or {}).items():
+            self.add(term, value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, term: str, value: Optional[str] = None):
+        """Adicionar um termo; ``value`` é o que a busca retorna (padrão: o termo)"""
+        key = fold(term.strip())
+        if not key:
+            return
+        values = self._values.setdefault(key, [])
+        value = value if value is not None else term
+        if value not in values:
+            values.append(value)
+        self._pattern = None
+
+    @staticmethod
+    def _trie_pattern(node: Dict) -> str:
+        branches = [re.escape(char) + TermMatcher._trie_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Fim de termo: o restante é opcional (a busca gulosa prefere o mais longo)
+        return f"(?:{body})?" if "" in node else body
+
+    def build(self):
+        """Compilar o autômato (feito automaticamente na primeira busca)"""
+        trie: Dict = {}
+        for key in self._values:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[""] = True
+        body = self._trie_pattern(trie) if trie else "(?!)"
+        self._pattern = re.compile(f"(?<![{_WORD}])(?:{body})(?![{_WORD}])")
+
+        # Termos que são prefixo de outro termo, terminando em limite de palavra
+        self._prefixes = {}
+        for key in self._values:
+            prefixes = []
+            node = trie
+            for end, char in enumerate(key[:-1]):
+                node = node[char]
+                if "" in node and not self._is_word(key[end + 1]):
+                    prefixes.append(key[:end + 1])
+            if prefixes:
+                self._prefixes[key] = prefixes
+
+    @staticmethod
+    def _is_word(char: str) -> bool:
+        return char.isalnum() or char == "_"
+
+    def find(self, text: TextInput, folded: bool = False) -> List[Match]:
+        """Todas as ocorrências em limite de palavra, na ordem do texto
+
+        ``folded=True`` indica que o texto já passou por ``fold``; um
+        ``NormalizedText`` fornece a forma normalizada já calculada.
+        """
+        if self._pattern is None:
+            self.build()
+        if isinstance(text, NormalizedText):
+            text = text.folded
+        elif not folded:
+            text = fold(text or "")
+        matches = []
+        found = self._pattern.search(text)
+        while found is not None:
+            key, start = found.group(), found.start()
+            for value in self._values[key]:
+                matches.append(Match(start, found.end(), key, value))
+            for inner in self._prefixes.get(key, ()):
+                for value in self._values[inner]:
+                    matches.append(Match(start, start + len(inner), inner, value))
+            # Recomeça logo depois do início: acha os termos que começam dentro deste
+            found = self._pattern.search(text, start + 1)
+        return matches
+
+    def contains(self, text: TextInput, folded: bool = False) -> bool:
+        """Se algum termo aparece no texto (para na primeira ocorrência)"""
+        if self._pattern is None:
+            self.build()
+        if isinstance(text, NormalizedText):
+            text = text.folded
+        elif not folded:
+            text = fold(text or "")
+        return self._pattern.search(text) is not None
+
+    def values(self, text: TextInput, folded: bool = False) -> List[str]:
+        """Valores encontrados, sem repetição, na ordem em que aparecem"""
+        return list(dict.fromkeys(match.value for match in self.find(text, folded)))
+
+
+class SkillExtractor:
+    """Extrai habilidades e senioridade de uma descrição numa única passada
+
+    Habilidades, sinônimos de taxonomias do usuário e termos de senioridade
+    vão para o mesmo autômato. ``skills`` mantém a ordem da lista de
+    habilidades; ``level`` segue a prioridade de ``levels`` (o primeiro nível
+    com algum termo no texto vence), como a detecção original dos scripts.
+    """
+
+    LEVEL_PREFIX = "level:"
+
+    def __init__(
+        self,
+        skills: Iterable[str] = (),
+        levels: Optional[Dict[str, List[str]]] = None,
+        taxonomies: Optional[Dict[str, List[str]]] = None
+    ):
+        self.matcher = TermMatcher()
+        self._skill_order: Dict[str, int] = {}
+        self._canonical: Dict[str, str] = {}  # habilidade normalizada -> nome registrado
+        self._level_order: Dict[str, int] = {}
+        for skill in skills:
+            self.add_skill(skill)
+        for level, terms in (levels or {}).items():
+            self.add_level(level, terms)
+        if taxonomies:
+            self.add_taxonomy(taxonomies)
+
+    def add_skill(self, skill: str, aliases: Iterable[str] = ()):
+        """Registrar uma habilidade e seus sinônimos"""
+        skill = self._canonical.setdefault(fold(skill.strip()), skill)
+        self._skill_order.setdefault(skill, len(self._skill_order))
+        for term in (skill, *aliases):
+            self.matcher.add(term, skill)
+
+    def add_taxonomy(self, taxonomy: Dict[str, List[str]]):
+        """Registrar uma taxonomia: habilidade canônica -> sinônimos"""
+        for skill, aliases in taxonomy.items():
+            self.add_skill(skill, aliases)
+
+    def add_level(self, level: str, terms: Iterable[str]):
+        """Registrar os termos de um nível de senioridade"""
+        self._level_order.setdefault(level, len(self._level_order))
+        for term in terms:
+            self.matcher.add(term, self.LEVEL_PREFIX + level)
+
+    def extract(self, text: TextInput, folded: bool = False) -> Dict:
+        """Habilidades e nível de um texto: {"skills": [...], "level": str | None}"""
+        skills, levels = set(), set()
+        for match in self.matcher.find(text, folded):
+            if match.value.startswith(self.LEVEL_PREFIX):
+                levels.add(match.value[len(self.LEVEL_PREFIX):])
+            else:
+                skills.add(match.value)
+        return {
+            "skills": sorted(skills, key=self._skill_order.__getitem__),
+            "level": min(levels, key=self._level_order.__getitem__) if levels else None
+        }
+
+    def extract_batch(self, texts: Iterable[TextInput]) -> List[Dict]:
+        """Extrair de várias descrições reaproveitando o mesmo autômato"""
+        return [self.extract(text) for text in texts]
+
+    def extract_skills(self, text: TextInput) -> List[str]:
+        return self.extract(text)["skills"]
+
+    def detect_level(self, text: TextInput) -> Optional[str]:
+        return self.extract(text)["level"]
+
+
+class RequirementSpan(NamedTuple):
+    """Trecho de requisitos encontrado numa descrição (posições no texto original)"""
+    kind: str  # required, preferred ou experience
+    label: str
+    start: int
+    end: int
+    text: str
+
+
+class RequirementsExtractor:
+    """Extrai seções de requisitos (português e inglês) numa única passada
+
+    Um único padrão compilado reconhece os cabeçalhos de seção
+    ("Requisitos:", "Qualifications", "Diferenciais:", "Nice to have"...) e
+    as menções a experiência. Cada cabeçalho de requisitos abre um trecho
+    que vai até o próximo cabeçalho (inclusive de seções que não são
+    requisitos, como "Benefícios") ou até uma linha em branco; menções a
+    experiência fora dessas seções valem até o fim da linha.
+    """
+
+    SECTIONS = {
+        "required": [
+            r"requisitos(?:\s+obrigat[oó]rios)?", r"requirements", r"required\s+qualifications",
+            r"qualifica[cç][oõ]es", r"qualifications", r"necess[aá]rio", r"perfil",
+            r"o\s+que\s+(?:buscamos|procuramos)", r"what\s+we(?:'|’)?re\s+looking\s+for",
+            r"must[\s-]have", r"you\s+have",
+        ],
+        "preferred": [
+            r"diferenciais", r"desej[aá]ve(?:l|is)", r"nice[\s-]to[\s-]have",
+            r"preferred\s+qualifications", r"bonus\s+points",
+        ],
+        "other": [
+            r"benef[ií]cios", r"benefits", r"responsabilidades", r"responsibilities",
+            r"atividades", r"sobre\s+(?:a\s+empresa|n[oó]s|a\s+vaga)", r"about\s+(?:us|the\s+role)",
+            r"o\s+que\s+oferecemos", r"what\s+we\s+offer",
+        ],
+    }
+
+    EXPERIENCE = [r"experi[eê]ncia", r"experience"]
+
+    def __init__(self):
+        headers = "|".join(
+            f"(?P<{kind}>{'|'.join(patterns)})" for kind, patterns in self.SECTIONS.items()
+        )
+        experience = "|".join(self.EXPERIENCE)
+        # Todos os termos começam por uma letra literal; a classe inicial
+        # descarta rápido as posições que não podem iniciar um cabeçalho
+        first_letters = "".join(sorted({
+            pattern[0] for patterns in (*self.SECTIONS.values(), self.EXPERIENCE) for pattern in patterns
+        }))
+        body = rf"\b(?=[{first_letters}])(?:(?:{headers})\s*(?::|\n)|(?P<experience>{experience})\b)"
+        # O texto é convertido para minúsculas uma vez; IGNORECASE fica como
+        # alternativa para os raros textos em que lower() muda o tamanho
+        self.pattern = re.compile(body)
+        self.pattern_ignorecase = re.compile(
+            body.replace(f"[{first_letters}]", f"[{first_letters}{first_letters.upper()}]"), re.IGNORECASE
+        )
+        self._blank_line = re.compile(r"\n[ \t]*\n")
+
+    def extract(self, description: TextInput) -> List[RequirementSpan]:
+        """Trechos de requisitos, na ordem do texto"""
+        if isinstance(description, JobText):
+            description = description.description
+        if not description:
+            return []
+        if isinstance(description, NormalizedText):
+            lowered, description = description.lower, description.text
+        else:
+            lowered = description.lower()
+        if len(lowered) == len(description):
+            found = self.pattern.finditer(lowered)
+        else:
+            found = self.pattern_ignorecase.finditer(description)
+        headers = [(match.lastgroup, match) for match in found]
+        spans = []
+        section_end = 0
+        for index, (kind, match) in enumerate(headers):
+            if match.start() < section_end:
+                continue
+            if kind == "experience":
+                end = description.find("\n", match.start())
+                start, end = match.start(), len(description) if end == -1 else end
+            elif kind == "other":
+                continue
+            else:
+                start = match.end()
+                # Até o próximo cabeçalho de seção ou uma linha em branco
+                limit = next(
+                    (other.start() for other_kind, other in headers[index + 1:] if other_kind != "experience"),
+                    len(description)
+                )
+                body_start = len(description[start:limit]) - len(description[start:limit].lstrip())
+                blank = self._blank_line.search(description, start + body_start, limit)
+                end = blank.start() if blank else limit
+                section_end = end
+            text = description[start:end].strip()
+            if text:
+                label = description[match.start():match.end()].strip(" :\n")
+                spans.append(RequirementSpan(kind, label, start, end, text))
+        return spans
+
+    def summary(self, description: TextInput) -> str:
+        """Trechos unidos por " | " (formato da coluna ``requirements``)"""
+        return " | ".join(span.text for span in self.extract(description))
+
+
+# Instância compartilhada (o padrão é compilado uma única vez)
+requirements_extractor = RequirementsExtractor()
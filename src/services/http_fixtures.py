@@ -0,0 +1,282 @@
+import base64
+import hashlib
+import json
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+import requests
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+MODES = ("live", "record", "replay")
+
+
+class FixtureNotFound(Exception):
+    """Requisição sem fixture gravada no modo replay"""
+
+
+class FixtureStore:
+    """Armazena respostas HTTP gravadas em fixtures versionadas
+
+    Cada resposta fica em ``<diretório>/<versão>/<host>/<hash>.json``. A chave
+    é calculada a partir do método, da URL e dos parâmetros ordenados, sem os
+    parâmetros sensíveis (chaves de API), para que as fixtures possam ser
+    versionadas no repositório.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        version: Optional[str] = None,
+        redact_params: Optional[Iterable[str]] = None
+    ):
+        self.root = Path(directory or settings.fixtures.directory) / (version or settings.fixtures.version)
+        self.redact_params = set(redact_params or settings.fixtures.redact_params)
+        self._memory: Dict[str, Dict] = {}
+
+    def canonical_url(self, method: str, url: str, params: Optional[Iterable[Tuple[str, str]]] = None) -> str:
+        """Montar a URL canônica (parâmetros ordenados e sem credenciais)"""
+        parts = urlsplit(str(url))
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        if params:
+            query.extend((str(k), str(v)) for k, v in params)
+        query = sorted((k, v) for k, v in query if k not in self.redact_params)
+        return f"{method.upper()} " + urlunsplit(
+            (parts.scheme, parts.netloc.lower(), parts.path or "/", urlencode(query), "")
+        )
+
+    def _path(self, key: str) -> Path:
+        host = urlsplit(key.split(" ", 1)[1]).netloc or "local"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.root / host / f"{digest}.json"
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Carregar fixture (com cache em memória)"""
+        if key in self._memory:
+            return self._memory[key]
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            fixture = json.load(f)
+        self._memory[key] = fixture
+        return fixture
+
+    def save(self, key: str, status: int, headers: Dict[str, str], body: bytes, url: str):
+        """Gravar resposta em disco"""
+        try:
+            text, encoding = body.decode("utf-8"), "text"
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(body).decode("ascii"), "base64"
+        fixture = {
+            "request": key,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "response": {
+                "status": status,
+                "url": self.canonical_url("GET", url).split(" ", 1)[1],
+                "headers": {
+                    k: v for k, v in headers.items()
+                    if k.lower() not in ("set-cookie", "content-encoding", "transfer-encoding", "content-length")
+                },
+                "encoding": encoding,
+                "body": text
+            }
+        }
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False, indent=2)
+        self._memory[key] = fixture
+        logger.info(f"[FIXTURE] Gravada {key}")
+
+    @staticmethod
+    def body_of(fixture: Dict) -> bytes:
+        """Corpo da resposta em bytes"""
+        response = fixture["response"]
+        if response.get("encoding") == "base64":
+            return base64.b64decode(response["body"])
+        return response["body"].encode("utf-8")
+
+
+class TransportStats:
+    """Tempo gasto no transporte HTTP (rede ou leitura de fixture)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+    def add(self, elapsed: float):
+        self.calls += 1
+        self.seconds += elapsed
+
+    def reset(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+
+class _ReplayResponse:
+    """Resposta mínima compatível com aiohttp.ClientResponse"""
+
+    def __init__(self, method: str, url: str, status: int, headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.url = URL(url)
+        self.status = status
+        self.reason = "OK" if status < 400 else "Replay"
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or "utf-8", errors)
+
+    async def json(self, *, encoding: Optional[str] = None, loads=json.loads, content_type: Optional[str] = None):
+        return loads(self._body.decode(encoding or "utf-8"))
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                None, (), status=self.status, message=self.reason, headers=self.headers
+            )
+
+    def release(self):
+        pass
+
+    async def wait_for_close(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class HTTPFixtures:
+    """Transporte de gravação/reprodução para requests e aiohttp
+
+    No modo ``record`` as requisições vão para a rede e as respostas são
+    gravadas no ``FixtureStore``. No modo ``replay`` nenhuma requisição sai da
+    máquina: as respostas vêm das fixtures e uma requisição sem fixture gera
+    ``FixtureNotFound``.
+    """
+
+    def __init__(self, mode: str = "replay", store: Optional[FixtureStore] = None):
+        if mode not in MODES:
+            raise ValueError(f"Modo inválido: {mode}. Opções: {list(MODES)}")
+        self.mode = mode
+        self.store = store or FixtureStore()
+        self.stats = TransportStats()
+        self.missing: List[str] = []
+        self._originals: Dict[str, object] = {}
+
+    def install(self):
+        """Substituir o transporte de requests e aiohttp"""
+        if self.mode == "live" or self._originals:
+            return
+        self._originals["requests"] = requests.Session.send
+        self._originals["aiohttp"] = aiohttp.ClientSession._request
+        requests.Session.send = self._requests_send()
+        aiohttp.ClientSession._request = self._aiohttp_request()
+        logger.info(f"Transporte HTTP em modo {self.mode} ({self.store.root})")
+
+    def uninstall(self):
+        """Restaurar o transporte original"""
+        if not self._originals:
+            return
+        requests.Session.send = self._originals.pop("requests")
+        aiohttp.ClientSession._request = self._originals.pop("aiohttp")
+
+    def _miss(self, key: str):
+        self.missing.append(key)
+        raise FixtureNotFound(f"Fixture não encontrada para {key} em {self.store.root}")
+
+    def _requests_send(self):
+        harness = self
+        original = self._originals["requests"]
+
+        def send(session, request, **kwargs):
+            key = harness.store.canonical_url(request.method, request.url)
+            started = time.perf_counter()
+            try:
+                if harness.mode == "record":
+                    response = original(session, request, **kwargs)
+                    harness.store.save(
+                        key, response.status_code, dict(response.headers), response.content, response.url
+                    )
+                    return response
+
+                fixture = harness.store.load(key)
+                if fixture is None:
+                    harness._miss(key)
+                response = requests.Response()
+                response.status_code = fixture["response"]["status"]
+                response.headers = requests.structures.CaseInsensitiveDict(fixture["response"]["headers"])
+                response._content = harness.store.body_of(fixture)
+                response.url = request.url
+                response.encoding = "utf-8"
+                response.request = request
+                return response
+            finally:
+                harness.stats.add(time.perf_counter() - started)
+
+        return send
+
+    def _aiohttp_request(self):
+        harness = self
+        original = self._originals["aiohttp"]
+
+        async def _request(session, method, str_or_url, *, params=None, **kwargs):
+            items = list(params.items()) if hasattr(params, "items") else list(params or [])
+            key = harness.store.canonical_url(method, str(str_or_url), items)
+            started = time.perf_counter()
+            try:
+                if harness.mode == "record":
+                    response = await original(session, method, str_or_url, params=params, **kwargs)
+                    body = await response.read()
+                    harness.store.save(key, response.status, dict(response.headers), body, str(response.url))
+                    return response
+
+                fixture = harness.store.load(key)
+                if fixture is None:
+                    harness._miss(key)
+                return _ReplayResponse(
+                    method,
+                    fixture["response"]["url"],
+                    fixture["response"]["status"],
+                    fixture["response"]["headers"],
+                    harness.store.body_of(fixture)
+                )
+            finally:
+                harness.stats.add(time.perf_counter() - started)
+
+        return _request
+
+
+@contextmanager
+def http_fixtures(mode: Optional[str] = None, store: Optional[FixtureStore] = None):
+    """Context manager que ativa o transporte de fixtures
+
+    Exemplo:
+        with http_fixtures("replay") as harness:
+            jobs = scraper.scrape_site(...)
+    """
+    harness = HTTPFixtures(mode or settings.fixtures.mode, store)
+    harness.install()
+    try:
+        yield harness
+    finally:
+        harness.uninstall()
@@ -8,6 +8,7 @@ from fake_useragent import UserAgent
 
 from ..models.job import Job
 from ..config import settings
+from .retry import HTTPStatusError, check_status, retry_policy
 
 logger = logging.getLogger(__name__)
 
@@ -117,8 +118,20 @@ class JobScraper:
             logger.error(f"Erro ao extrair vagas do HTML: {str(e)}")
             return []
     
-    def scrape_site(self, site_name: str, site_config: dict, keywords: str, location: str) -> List[Job]:
-        """Fazer scraping de um site específico"""
+    def scrape_site(
+        self,
+        site_name: str,
+        site_config: dict,
+        keywords: str,
+        location: str,
+        raise_errors: bool = False
+    ) -> List[Job]:
+        """Fazer scraping de um site específico
+
+        Com ``raise_errors`` uma falha ao acessar o site é propagada em vez
+        de virar uma lista vazia (para a busca em camadas e o disjuntor
+        distinguirem falha de "nenhuma vaga").
+        """
         logger.info(f"Iniciando scraping de {site_name} - keywords: {keywords}, location: {location}")
         
         try:
@@ -132,20 +145,29 @@ class JobScraper:
             if site_name == 'LinkedIn':
                 url = self._add_linkedin_params(url)
             
-            # Acessar URL com requests
+            # Acessar URL com requests (429, 5xx e falhas de rede são repetidos com backoff)
             logger.info(f"Acessando URL: {url}")
-            response = self.session.get(url)
-            
-            # Verificar status
-            if response.status_code != 200:
-                logger.error(f"Erro ao acessar {site_name}: Status {response.status_code}")
+
+            def fetch():
+                response = self.session.get(url, timeout=settings.scraper.timeout)
+                check_status(site_name, response.status_code, response.headers)
+                return response.text
+
+            try:
+                html = retry_policy.run_sync(site_name, fetch)
+            except HTTPStatusError as e:
+                logger.error(f"Erro ao acessar {site_name}: Status {e.status}")
+                if raise_errors:
+                    raise
                 return []
             
             # Extrair vagas do HTML
-            jobs = self._extract_jobs_from_html(response.text, site_name, site_config)
+            jobs = self._extract_jobs_from_html(html, site_name, site_config)
             
             return jobs
             
         except Exception as e:
             logger.error(f"Erro ao processar {site_name}: {str(e)}")
+            if raise_errors:
+                raise
             return []
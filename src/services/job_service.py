@@ -1,12 +1,17 @@
 import logging
 import time
 from typing import List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 
+from ..config import settings
 from ..models.job import Job
 from .job_scraper import JobScraper
 from .adzuna_client import AdzunaClient
-from .api_manager import APIUsageManager
+from ..scrapers.adzuna import QuotaHooks
+from .circuit_breaker import breakers
+from .quota import QuotaBudget, QuotaExceeded
+from .ranking import ranker
+from .shared_state import SharedState
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +21,16 @@ class JobService:
     def __init__(self, adzuna_app_id: str, adzuna_api_key: str):
         self.job_scraper = JobScraper()
         self.adzuna_client = AdzunaClient(adzuna_app_id, adzuna_api_key)
-        self.api_manager = APIUsageManager()
+        # Mesma cota (e mesmo orçamento) do serviço assíncrono
+        self.quota = QuotaBudget(SharedState())
         
         # Configurações
-        self.ADZUNA_DAILY_LIMIT = 100  # Ajuste conforme seu plano
+        self.ADZUNA_DAILY_LIMIT = self.quota.daily_limit
         self.MAX_WORKERS = 2  # Número de threads para busca paralela
+        self.deadline = settings.scraper.search_deadline  # prazo da busca inteira, em segundos
+        self.countries = settings.api.adzuna_countries or ["us"]  # países da Adzuna, buscados ao mesmo tempo
+        # Situação de cada fonte na última busca ("ok", "failed", "timeout", "skipped")
+        self.last_search_status = {}
     
     def search_jobs(
         self,
@@ -37,14 +47,16 @@ class JobService:
             location: Local desejado
             user_id: ID do usuário para controle de uso da API
             prefer_adzuna: Se True, tenta Adzuna primeiro se disponível
+
+        Fontes que não responderem em ``self.deadline`` segundos ficam de fora
+        (resultado parcial); a situação de cada fonte fica em
+        ``self.last_search_status``. As vagas voltam ordenadas por relevância.
         """
         jobs = []
         errors = []
         
         # Verificar disponibilidade do Adzuna
-        can_use_adzuna = self.api_manager.can_use_api(
-            "adzuna", user_id, self.ADZUNA_DAILY_LIMIT
-        )
+        can_use_adzuna = self.quota.allows(user_id)
         
         # Definir ordem das fontes
         sources = []
@@ -53,28 +65,43 @@ class JobService:
         else:
             sources = ["linkedin", "adzuna"]
         
-        # Buscar em paralelo
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            future_to_source = {
-                executor.submit(
-                    self._search_source,
-                    source,
-                    keywords,
-                    location,
-                    user_id
-                ): source
-                for source in sources
-            }
-            
-            for future in as_completed(future_to_source):
+        # Buscar em paralelo, até o prazo; fontes com o disjuntor aberto são puladas
+        status = {}
+        future_to_source = {}
+        executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        for source in sources:
+            if not breakers.get(source).allow():
+                status[source] = "skipped"
+                logger.info(f"[{source.upper()}] Disjuntor aberto, fonte pulada")
+                continue
+            future = executor.submit(self._search_source, source, keywords, location, user_id)
+            future_to_source[future] = source
+
+        try:
+            for future in as_completed(future_to_source, timeout=self.deadline):
                 source = future_to_source[future]
                 try:
                     source_jobs = future.result()
                     if source_jobs:
                         jobs.extend(source_jobs)
+                    breakers.get(source).record_success()
+                    status[source] = "ok"
                 except Exception as e:
+                    breakers.get(source).record_failure()
+                    status[source] = "failed"
                     errors.append(f"Erro em {source}: {str(e)}")
                     logger.error(f"Erro ao buscar em {source}: {str(e)}")
+        except FuturesTimeoutError:
+            for future, source in future_to_source.items():
+                if source not in status:
+                    breakers.get(source).record_failure()
+                    status[source] = "timeout"
+                    errors.append(f"{source} não respondeu em {self.deadline:.0f}s")
+        finally:
+            # Não espera as threads atrasadas: o resultado sai com o que chegou
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.last_search_status = status
         
         # Log de resultados
         for source in sources:
@@ -86,7 +113,8 @@ class JobService:
             for error in errors:
                 logger.warning(f"  - {error}")
         
-        return jobs
+        # Mais relevantes primeiro (BM25, recência e remoto)
+        return ranker.rank(jobs, keywords)
     
     def _search_source(
         self,
@@ -98,26 +126,27 @@ class JobService:
         """Buscar vagas em uma fonte específica"""
         try:
             if source == "adzuna":
-                # Verificar limite diário
-                if not self.api_manager.can_use_api(
-                    "adzuna", user_id, self.ADZUNA_DAILY_LIMIT
-                ):
+                # Cada página é reservada no orçamento diário (e devolvida se falhar)
+                def quota(country: str) -> QuotaHooks:
+                    return QuotaHooks(
+                        lambda: self.quota.acquire(user_id, country=country),
+                        lambda: self.quota.release(user_id, country)
+                    )
+
+                try:
+                    if len(self.countries) > 1:
+                        return self.adzuna_client.search_countries(keywords, location, self.countries, quota)
+                    return self.adzuna_client.search_jobs(
+                        what=keywords,
+                        where=location,
+                        country=self.countries[0],
+                        quota=quota(self.countries[0]),
+                        raise_errors=True
+                    )
+                except QuotaExceeded:
                     logger.warning("Limite diário do Adzuna atingido")
                     return []
                 
-                # Buscar no Adzuna
-                jobs = self.adzuna_client.search_jobs(
-                    what=keywords,
-                    where=location,
-                    country="us"
-                )
-                
-                # Registrar uso
-                if jobs:
-                    self.api_manager.record_api_use("adzuna", user_id)
-                
-                return jobs
-                
             elif source == "linkedin":
                 # Buscar no LinkedIn
                 return self.job_scraper.scrape_site(
@@ -132,16 +161,18 @@ class JobService:
                 return []
                 
         except Exception as e:
+            # Propagado para search_jobs contar a falha no disjuntor da fonte
             logger.error(f"Erro ao buscar em {source}: {str(e)}")
-            return []
+            raise
     
     def get_api_usage_info(self, user_id: str) -> dict:
         """Obter informações de uso da API"""
+        budget = self.quota.snapshot()
+        used = budget["users"].get(user_id, 0)
         return {
             "adzuna": {
-                "remaining_calls": self.api_manager.get_remaining_calls(
-                    "adzuna", user_id, self.ADZUNA_DAILY_LIMIT
-                ),
-                "daily_limit": self.ADZUNA_DAILY_LIMIT
+                "remaining_calls": max(0, min(self.quota.user_limit - used, budget["remaining"])),
+                "daily_limit": self.ADZUNA_DAILY_LIMIT,
+                "projected_exhaustion": budget["projected_exhaustion"]
             }
         }
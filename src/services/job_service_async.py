@@ -1,12 +1,18 @@
 import asyncio
-import json
 import logging
-from datetime import datetime, date
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple
 from ..models.job import Job, JobSearch
-from ..scrapers.adzuna import AdzunaScraper
+from ..scrapers.adzuna import AsyncAdzunaClient, QuotaHooks
+from ..scrapers.engine import SourceEngine
+from ..scrapers.tiered import TieredFetcher
 from ..config import settings, is_termux
-import os
+from ..database.db import Database
+from .canonical import canonical_query
+from .circuit_breaker import OPEN, breakers
+from .enrichment import EnrichmentQueue, merge_ranked
+from .quota import DEFAULT_PRIORITY, QuotaBudget, QuotaExceeded
+from .ranking import ranker
+from .shared_state import SharedCache, SharedState, SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -14,85 +20,312 @@ class AsyncJobService:
     def __init__(self):
         """Inicializa o serviço de busca de empregos"""
         app_id, api_key, daily_limit = settings.api.get_credentials()
-        self.scraper = AdzunaScraper(app_id, api_key)
-        self.daily_limit = daily_limit
-        self.usage_file = settings.api.api_usage_file
-        self.load_usage()
-
-    def load_usage(self):
-        """Carrega informações de uso da API"""
-        try:
-            if os.path.exists(self.usage_file):
-                with open(self.usage_file, 'r') as f:
-                    self.usage = json.load(f)
-            else:
-                self.usage = {}
-        except Exception as e:
-            logger.error(f"Erro ao carregar uso da API: {e}")
-            self.usage = {}
-
-    def save_usage(self):
-        """Salva informações de uso da API"""
-        try:
-            with open(self.usage_file, 'w') as f:
-                json.dump(self.usage, f)
-        except Exception as e:
-            logger.error(f"Erro ao salvar uso da API: {e}")
+        self.adzuna = AsyncAdzunaClient(app_id, api_key)
+        self.engine = SourceEngine()
+        self.tiered = TieredFetcher(self.engine)
+        self.db = Database()
+        # Iniciada pelo lifespan do FastAPI (main.py)
+        self.enrichment = EnrichmentQueue(self.db, self.engine)
+        # Cota, cache de resultados e buscas em andamento compartilhados entre
+        # os processos do servidor (uvicorn/gunicorn com vários workers)
+        self.state = SharedState(self.db)
+        self.state.import_usage_file(settings.api.api_usage_file)
+        # Resultados recentes por busca: (search_id, vagas), aquecidos pelo agendador
+        self.results = SharedCache(self.state, "results")
+        self.singleflight = SingleFlight(self.state)
+        # Cota diária distribuída ao longo do dia, entre usuários e prioridades
+        self.quota = QuotaBudget(self.state, daily_limit)
 
     def get_user_usage(self, user_id: str) -> Dict:
         """Obtém informações de uso para um usuário"""
-        today = date.today().isoformat()
-        if user_id not in self.usage:
-            self.usage[user_id] = {"total": 0, "daily": {}}
-        if today not in self.usage[user_id]["daily"]:
-            self.usage[user_id]["daily"] = {today: 0}
+        usage = self.state.usage(user_id)
+        budget = self.quota.snapshot()
         return {
-            "today": self.usage[user_id]["daily"][today],
-            "total": self.usage[user_id]["total"],
-            "limit": self.daily_limit,
-            "remaining": self.daily_limit - self.usage[user_id]["daily"][today]
+            "today": usage["today"],
+            "total": usage["total"],
+            "limit": self.quota.user_limit,
+            "remaining": max(0, min(self.quota.user_limit - usage["today"], budget["remaining"]))
         }
 
-    def update_usage(self, user_id: str):
+    def update_usage(self, user_id: str, amount: int = 1):
         """Atualiza contagem de uso para um usuário"""
-        today = date.today().isoformat()
-        if user_id not in self.usage:
-            self.usage[user_id] = {"total": 0, "daily": {}}
-        if today not in self.usage[user_id]["daily"]:
-            self.usage[user_id]["daily"] = {today: 0}
-        
-        self.usage[user_id]["daily"][today] += 1
-        self.usage[user_id]["total"] += 1
-        self.save_usage()
-
-    def can_make_request(self, user_id: str) -> bool:
-        """Verifica se o usuário pode fazer mais requisições"""
-        usage = self.get_user_usage(user_id)
-        return usage["remaining"] > 0
-
-    async def search_jobs(self, search: JobSearch, user_id: str) -> List[Job]:
+        self.state.add_usage(user_id, amount)
+
+    def can_make_request(self, user_id: str, background: bool = False, priority: int = DEFAULT_PRIORITY) -> bool:
+        """Verifica se o orçamento permite mais uma requisição agora"""
+        return self.quota.allows(user_id, background, priority)
+
+    @staticmethod
+    def result_key(search: JobSearch) -> str:
+        """Chave do cache de resultados de uma busca (igual para grafias equivalentes)"""
+        return canonical_query(search).key
+
+    async def search_jobs(
+        self,
+        search: JobSearch,
+        user_id: str,
+        use_cache: bool = True,
+        background: bool = False,
+        priority: int = DEFAULT_PRIORITY
+    ) -> List[Job]:
         """
         Busca vagas de emprego usando os parâmetros fornecidos
+
+        O Adzuna e as demais fontes registradas no ``SourceEngine`` são
+        consultados ao mesmo tempo. Apenas o Adzuna consome a cota diária.
+        Uma busca igual feita há pouco (inclusive pelo agendador de buscas
+        salvas) é servida do cache, sem consumir cota; nesse caso
+        ``search.search_id`` passa a ser o da busca original. Uma busca igual
+        ainda em andamento, em qualquer worker, é aguardada em vez de repetida.
+        Buscas em segundo plano (``background``) seguem o ritmo do orçamento
+        da cota, conforme a ``priority``. Se alguma fonte falhar, estourar o
+        prazo ou estiver com o disjuntor aberto, ``search.partial`` fica True.
         """
-        if not self.can_make_request(user_id):
-            raise Exception(
-                f"Limite diário excedido. Limite: {self.daily_limit}"
+        query = canonical_query(search)
+        # As fontes recebem o texto digitado; a forma canônica é só a chave
+        search.keywords, search.location = query.keywords, query.location
+        key = query.key
+        from_cache = False
+        if not (use_cache and settings.cache.enabled):
+            result = await self._run_search(search, user_id, key, background, priority)
+        else:
+            result = await asyncio.to_thread(self.cached_results, key)
+            if result is None:
+                # Buscas iguais simultâneas (neste ou em outro processo) esperam a primeira
+                result = await self.singleflight.run(
+                    key,
+                    lambda: self._run_search(search, user_id, key, background, priority),
+                    lambda: self.cached_results(key)
+                )
+            else:
+                from_cache = True
+                logger.info(f"Busca servida do cache: {search.keywords} em {search.location}")
+        search.search_id, jobs, status = result
+        jobs = list(jobs)
+        search.source_status = dict(status)
+        search.partial = any(state != "ok" for state in status.values())
+
+        await self._log_search(search, query, user_id, len(jobs), from_cache, background)
+        return jobs
+
+    async def _run_search(
+        self,
+        search: JobSearch,
+        user_id: str,
+        key: tuple,
+        background: bool = False,
+        priority: int = DEFAULT_PRIORITY
+    ) -> Tuple[str, List[Job], Dict[str, str]]:
+        """Executar a busca nas fontes, guardar e publicar no cache
+
+        Cada fonte passa pelo seu disjuntor (``breakers``): fontes com falhas
+        seguidas são puladas na hora. A busca inteira tem o prazo
+        ``settings.scraper.search_deadline``; as fontes que não terminarem a
+        tempo são canceladas e o resultado sai com as demais. Um resultado
+        parcial fica no cache só por ``settings.cache.partial_ttl``. As vagas
+        juntadas recebem a nota de relevância (``ranker``) antes de gravar.
+        """
+        sources = list(dict.fromkeys(source.lower() for source in search.sources))
+        # Com o disjuntor aberto a Adzuna será pulada: não há cota a conferir
+        use_adzuna = "adzuna" in sources and breakers.get("adzuna").state != OPEN
+
+        # Cada página da Adzuna é reservada na hora do pedido (atômico entre
+        # workers); aqui só se recusa logo a busca que a cota já não comporta
+        if use_adzuna and not await asyncio.to_thread(self.quota.allows, user_id, background, priority):
+            raise QuotaExceeded(
+                f"Limite diário excedido. Limite: {self.quota.user_limit} por usuário, "
+                f"{self.quota.daily_limit} no total"
                 + (" (Modo Termux)" if is_termux() else "")
             )
 
+        def quota(country: str) -> QuotaHooks:
+            return QuotaHooks(
+                lambda: self.quota.acquire(user_id, background, priority, country),
+                lambda: self.quota.release(user_id, country)
+            )
+
+        status: Dict[str, str] = {}
+        results = await self._search_sources(self._source_calls(search, sources, status, quota), status)
+
+        if status and "ok" not in status.values():
+            logger.error(f"Erro ao buscar vagas: nenhuma fonte respondeu ({status})")
+
+        jobs = [job for jobs in results.values() for job in jobs]
+        # A nota vai com cada vaga para search_jobs; as páginas são ordenadas no SQL
+        await asyncio.to_thread(ranker.score, jobs, search.keywords)
+        await self._save_jobs(jobs, search)
+        if settings.cache.enabled:
+            partial = any(state != "ok" for state in status.values())
+            ttl = settings.cache.partial_ttl if partial else None
+            await asyncio.to_thread(self.cache_results, key, search.search_id, jobs, ttl, status)
+        # Detalhes, habilidades, nível e duplicatas chegam depois, pela fila
+        if settings.enrichment.enabled:
+            self.enrichment.submit(jobs)
+        return search.search_id, jobs, status
+
+    def _source_calls(
+        self,
+        search: JobSearch,
+        sources: List[str],
+        status: Dict[str, str],
+        quota: Optional[Callable[[str], QuotaHooks]] = None
+    ) -> Dict[str, Awaitable[List[Job]]]:
+        """Uma chamada por fonte, propagando as falhas para o disjuntor
+
+        Fontes com busca em camadas (``SITE_CONFIGS``) passam pelo
+        ``TieredFetcher``, que recorre ao HTML estático ou ao navegador
+        quando a API não retorna vagas.
+        """
+        calls = {}
+        for source in sources:
+            if source == "adzuna":
+                calls[source] = self._search_adzuna(search, status, quota)
+            elif TieredFetcher.site_for_source(source):
+                calls[source] = self.tiered.search(
+                    TieredFetcher.site_for_source(source), search.keywords, search.location, raise_errors=True
+                )
+            else:
+                calls[source] = self.engine.search_source(
+                    source, search.keywords, search.location, raise_errors=True
+                )
+        return calls
+
+    async def _search_adzuna(
+        self,
+        search: JobSearch,
+        status: Dict[str, str],
+        quota: Optional[Callable[[str], QuotaHooks]] = None
+    ) -> List[Job]:
+        """Buscar na Adzuna em todos os países da busca ao mesmo tempo
+
+        Cada país reserva as próprias páginas na cota (com o teto por país).
+        Um país sem cota ou com falha fica de fora, marcado em ``status``
+        como ``adzuna:<país>``, sem derrubar os demais; só se todos falharem
+        o erro chega ao disjuntor. O resultado é o ``merge_ranked`` das
+        listas de cada país.
+        """
+        countries = search.countries or settings.api.adzuna_countries
+        results = await asyncio.gather(
+            *(
+                self.adzuna.search_jobs(
+                    keywords=search.keywords,
+                    location=search.location,
+                    remote_only=search.remote_only,
+                    country=country,
+                    quota=quota(country) if quota else None,
+                    raise_errors=True
+                )
+                for country in countries
+            ),
+            return_exceptions=True
+        )
+
+        ranked, errors = [], []
+        for country, result in zip(countries, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                if len(countries) > 1:
+                    status[f"adzuna:{country}"] = "skipped" if isinstance(result, QuotaExceeded) else "failed"
+                    logger.warning(f"[adzuna:{country}] {result}")
+            else:
+                ranked.append(result)
+        if errors and not ranked:
+            # Uma falha de verdade pesa mais que a falta de cota
+            raise next((e for e in errors if not isinstance(e, QuotaExceeded)), errors[0])
+        return merge_ranked(ranked)
+
+    async def _search_sources(
+        self,
+        calls: Dict[str, Awaitable[List[Job]]],
+        status: Dict[str, str],
+        deadline: Optional[float] = None
+    ) -> Dict[str, List[Job]]:
+        """Rodar as fontes ao mesmo tempo até o prazo; as atrasadas são canceladas"""
+        deadline = deadline if deadline is not None else settings.scraper.search_deadline
+        tasks = {
+            source: asyncio.create_task(self._guarded(source, call, status))
+            for source, call in calls.items()
+        }
+        if not tasks:
+            return {}
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            late = [source for source, task in tasks.items() if task in pending]
+            logger.warning(f"Prazo de {deadline:.0f}s esgotado; resultado parcial sem: {', '.join(late)}")
+        return {source: task.result() for source, task in tasks.items() if task in done}
+
+    @staticmethod
+    async def _guarded(source: str, call: Awaitable[List[Job]], status: Dict[str, str]) -> List[Job]:
+        """Chamar a fonte pelo seu disjuntor, registrando o desfecho em ``status``"""
+        breaker = breakers.get(source)
+        if not breaker.allow():
+            call.close()
+            status[source] = "skipped"
+            logger.info(f"[{source}] Disjuntor aberto, fonte pulada")
+            return []
         try:
-            jobs = await self.scraper.search_jobs(
-                keywords=search.keywords,
-                location=search.location,
-                remote_only=search.remote_only
+            jobs = await call
+        except asyncio.CancelledError:
+            breaker.record_failure()
+            status[source] = "timeout"
+            raise
+        except QuotaExceeded as e:
+            # Sem cota a fonte nem foi consultada: não conta como falha dela
+            breaker.release_probe()
+            status[source] = "skipped"
+            logger.warning(f"[{source}] {e}")
+            return []
+        except Exception as e:
+            breaker.record_failure()
+            status[source] = "failed"
+            logger.warning(f"[{source}] Falha na busca: {e}")
+            return []
+        breaker.record_success()
+        status[source] = "ok"
+        return jobs
+
+    def cached_results(self, key: tuple) -> Optional[Tuple[str, List[Job], Dict[str, str]]]:
+        """(search_id, vagas, situação das fontes) de uma busca recente, de qualquer processo"""
+        cached = self.results.get(key)
+        if cached is None:
+            return None
+        return cached["search_id"], [Job(**job) for job in cached["jobs"]], cached.get("sources", {})
+
+    def cache_results(self, key: tuple, search_id: str, jobs: List[Job], ttl: Optional[int] = None,
+                      status: Optional[Dict[str, str]] = None):
+        """Publicar o resultado de uma busca para todos os processos"""
+        self.results.set(
+            key,
+            {
+                "search_id": search_id,
+                "jobs": [job.model_dump(mode="json") for job in jobs],
+                "sources": status or {},
+            },
+            ttl=ttl
+        )
+
+    async def _save_jobs(self, jobs: List[Job], search: JobSearch):
+        """Guardar as vagas no histórico (falhas no banco não derrubam a busca)"""
+        if not jobs:
+            return
+        try:
+            await asyncio.to_thread(self.db.save_jobs, jobs, search.search_id, search.scraper_version)
+        except Exception as e:
+            logger.error(f"Erro ao salvar vagas no banco: {e}")
+
+    async def _log_search(self, search: JobSearch, query, user_id: str, found: int, from_cache: bool,
+                          background: bool):
+        """Registrar a busca para as estatísticas por chave canônica"""
+        try:
+            await asyncio.to_thread(
+                self.db.log_search, search.search_id, query.key, query.keywords, query.canonical_location,
+                list(query.sources), user_id, found, from_cache, background
             )
-            
-            self.update_usage(user_id)
-            
-            return jobs
         except Exception as e:
-            logger.error(f"Erro ao buscar vagas: {e}")
-            raise
+            logger.error(f"Erro ao registrar busca: {e}")
 
     def get_api_usage_info(self, user_id: str) -> Dict:
         """Retorna informações de uso da API"""
@@ -0,0 +1,163 @@
+import logging
+import math
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from ..config import settings
+from .shared_state import SharedState
+
+logger = logging.getLogger(__name__)
+
+# Prioridades das buscas em segundo plano (buscas salvas)
+MIN_PRIORITY, DEFAULT_PRIORITY, MAX_PRIORITY = 1, 3, 5
+
+
+class QuotaExceeded(Exception):
+    """O orçamento da cota não permite mais requisições agora"""
+
+
+def priority_factor(priority: int) -> float:
+    """Fração do orçamento em segundo plano liberada para uma prioridade
+
+    Prioridade 5 pode usar todo o orçamento do momento; prioridade 1 para
+    em 60% dele, deixando o restante para as buscas mais importantes.
+    """
+    priority = min(max(priority, MIN_PRIORITY), MAX_PRIORITY)
+    return 0.5 + 0.1 * priority
+
+
+class QuotaBudget:
+    """Orçamento diário de requisições à Adzuna, distribuído no tempo e entre usuários
+
+    A cota da chave é uma só para todos os usuários. Cada requisição é
+    reservada no ``SharedState`` (atômico entre processos) com dois tetos:
+
+    - interativas: o usuário não passa de ``user_share`` do limite diário e
+      o total não passa do limite; a fração ``reserve`` fica sempre livre
+      para elas;
+    - em segundo plano (buscas salvas): o total segue um ritmo linear ao
+      longo do dia sobre ``1 - reserve`` do limite, com ``burst`` de folga,
+      reduzido pelo ``priority_factor`` da busca. Assim o agendador não
+      esgota a cota no começo da manhã e adia as buscas de menor prioridade
+      primeiro quando o orçamento aperta.
+
+    Requisições com ``country`` também contam no teto do país
+    (``country_share`` do limite), para um mercado não consumir a cota de
+    todos nas buscas em vários países.
+    """
+
+    def __init__(
+        self,
+        state: SharedState,
+        daily_limit: Optional[int] = None,
+        reserve: Optional[float] = None,
+        user_share: Optional[float] = None,
+        burst: Optional[float] = None,
+        country_share: Optional[float] = None
+    ):
+        config = settings.quota
+        self.state = state
+        self.daily_limit = daily_limit if daily_limit is not None else settings.api.get_credentials()[2]
+        self.reserve = config.reserve if reserve is None else reserve
+        self.user_share = config.user_share if user_share is None else user_share
+        self.burst = config.burst if burst is None else burst
+        self.country_share = config.country_share if country_share is None else country_share
+
+    @staticmethod
+    def day_fraction(now: Optional[datetime] = None) -> float:
+        """Fração do dia já passada (0 à meia-noite, 1 no fim do dia)"""
+        now = now or datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return (now - midnight).total_seconds() / 86400
+
+    @property
+    def user_limit(self) -> int:
+        """Requisições interativas por usuário por dia"""
+        return max(1, math.ceil(self.daily_limit * self.user_share))
+
+    def background_allowance(self, priority: int = DEFAULT_PRIORITY, now: Optional[datetime] = None) -> int:
+        """Total de requisições do dia que o segundo plano pode ter usado até agora"""
+        paced = self.daily_limit * (1 - self.reserve) * min(1.0, self.day_fraction(now) + self.burst)
+        return math.floor(paced * priority_factor(priority))
+
+    def allows(self, user_id: str, background: bool = False, priority: int = DEFAULT_PRIORITY) -> bool:
+        """Consulta sem reservar (a reserva definitiva é ``acquire``)"""
+        used = self.state.usage_by_user()
+        total = sum(used.values())
+        if background:
+            return total < self.background_allowance(priority)
+        return total < self.daily_limit and used.get(user_id, 0) < self.user_limit
+
+    @property
+    def country_limit(self) -> int:
+        """Requisições por país por dia"""
+        return max(1, math.ceil(self.daily_limit * self.country_share))
+
+    def acquire(
+        self,
+        user_id: str,
+        background: bool = False,
+        priority: int = DEFAULT_PRIORITY,
+        country: Optional[str] = None
+    ) -> bool:
+        """Reservar uma requisição; False se o orçamento não permite agora"""
+        if country and not self.state.acquire_country_usage(country, self.country_limit):
+            return False
+        if background:
+            acquired = self.state.acquire_usage(user_id, sys.maxsize, self.background_allowance(priority))
+        else:
+            acquired = self.state.acquire_usage(user_id, self.user_limit, self.daily_limit)
+        if country and not acquired:
+            self.state.add_country_usage(country, -1)
+        return acquired
+
+    def release(self, user_id: str, country: Optional[str] = None):
+        """Devolver uma requisição reservada que não chegou a ser feita"""
+        self.state.add_usage(user_id, -1)
+        if country:
+            self.state.add_country_usage(country, -1)
+
+    def next_slot(self, priority: int = DEFAULT_PRIORITY, now: Optional[datetime] = None) -> datetime:
+        """Quando o ritmo libera a próxima requisição em segundo plano"""
+        now = now or datetime.now()
+        used = sum(self.state.usage_by_user().values())
+        share = self.daily_limit * (1 - self.reserve) * priority_factor(priority)
+        fraction = (used + 1) / share - self.burst if share > 0 else 2.0
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if fraction > 1:
+            return midnight + timedelta(days=1)
+        return max(now, midnight + timedelta(seconds=fraction * 86400))
+
+    def snapshot(self, now: Optional[datetime] = None) -> Dict:
+        """Uso, folga interativa, ritmo e projeção de esgotamento da cota de hoje"""
+        now = now or datetime.now()
+        users = self.state.usage_by_user()
+        used = sum(users.values())
+        fraction = self.day_fraction(now)
+        elapsed_hours = fraction * 24
+        rate = used / elapsed_hours if elapsed_hours > 0 else 0.0
+        remaining = max(self.daily_limit - used, 0)
+
+        projected = None
+        if remaining == 0:
+            projected = now
+        elif rate > 0:
+            exhaustion = now + timedelta(hours=remaining / rate)
+            if exhaustion.date() == now.date():
+                projected = exhaustion
+
+        return {
+            "daily_limit": self.daily_limit,
+            "used": used,
+            "remaining": remaining,
+            "interactive_reserve": math.ceil(self.daily_limit * self.reserve),
+            "user_limit": self.user_limit,
+            "background_available": max(self.background_allowance(MAX_PRIORITY, now) - used, 0),
+            "pace": round(self.daily_limit * fraction, 1),
+            "rate_per_hour": round(rate, 2),
+            "projected_exhaustion": projected.isoformat(timespec="minutes") if projected else None,
+            "users": users,
+            "country_limit": self.country_limit,
+            "countries": self.state.usage_by_country(),
+        }
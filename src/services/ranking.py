@@ -0,0 +1,115 @@
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from ..config import settings
+from ..models.job import Job
+from .extraction import JobText, fold, tokenize
+
+
+def posted_at(job: Job) -> datetime:
+    """Data de publicação da vaga (ISO das APIs) ou, sem ela, a data em que foi encontrada"""
+    if job.posted_date:
+        try:
+            return datetime.fromisoformat(job.posted_date.strip().replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return job.date_added
+
+
+class JobRanker:
+    """Ordena as vagas de uma busca pela relevância para as palavras-chave
+
+    A nota de texto é o BM25 das palavras buscadas no título e na descrição
+    (cada campo com seu peso), com as estatísticas (IDF e tamanho médio)
+    calculadas sobre as próprias vagas da busca, já juntadas de todas as
+    fontes. Ela é dividida pela maior nota do conjunto, ficando entre 0 e 1,
+    e somada ao bônus de recência (``recency_weight`` para uma vaga de hoje,
+    caindo pela metade a cada ``recency_half_life`` dias) e ao bônus de vaga
+    remota. O serviço assíncrono só calcula as notas: elas ficam na ligação
+    busca-vaga e a API lê cada página na ordem do índice (busca, nota,
+    vaga), sem ordenar o conjunto nem na memória nem no SQL.
+    """
+
+    FIELDS = ("title", "description")
+
+    def __init__(
+        self,
+        k1: Optional[float] = None,
+        b: Optional[float] = None,
+        title_weight: Optional[float] = None,
+        description_weight: Optional[float] = None,
+        recency_weight: Optional[float] = None,
+        recency_half_life: Optional[float] = None,
+        remote_boost: Optional[float] = None
+    ):
+        config = settings.ranking
+        self.k1 = k1 if k1 is not None else config.k1
+        self.b = b if b is not None else config.b
+        self.weights = {
+            "title": title_weight if title_weight is not None else config.title_weight,
+            "description": description_weight if description_weight is not None else config.description_weight,
+        }
+        self.recency_weight = recency_weight if recency_weight is not None else config.recency_weight
+        self.recency_half_life = recency_half_life or config.recency_half_life
+        self.remote_boost = remote_boost if remote_boost is not None else config.remote_boost
+
+    def _bm25(self, terms: Sequence[str], fields: List[Dict[str, Counter]]) -> List[float]:
+        """Nota BM25 ponderada por campo de cada vaga"""
+        count = len(fields)
+        scores = [0.0] * count
+        for field, weight in self.weights.items():
+            if not weight:
+                continue
+            lengths = [sum(counts[field].values()) for counts in fields]
+            average = sum(lengths) / count or 1.0
+            for term in terms:
+                frequency = sum(1 for counts in fields if counts[field][term])
+                if not frequency:
+                    continue
+                idf = math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+                for index, counts in enumerate(fields):
+                    tf = counts[field][term]
+                    if tf:
+                        norm = self.k1 * (1 - self.b + self.b * lengths[index] / average)
+                        scores[index] += weight * idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    def _recency(self, job: Job, now: datetime) -> float:
+        published = posted_at(job)
+        if published.tzinfo is not None:
+            # Datas com fuso (APIs) viram hora local, como ``date_added``
+            published = published.astimezone().replace(tzinfo=None)
+        age = max((now - published).total_seconds() / 86400, 0.0)
+        return self.recency_weight * 0.5 ** (age / self.recency_half_life)
+
+    def score(self, jobs: List[Job], keywords: str, now: Optional[datetime] = None) -> List[float]:
+        """Preencher ``job.score`` de cada vaga e devolver as notas"""
+        if not jobs:
+            return []
+        now = now or datetime.now()
+        terms = list(dict.fromkeys(tokenize(fold(keywords))))
+        fields = []
+        for job in jobs:
+            text = JobText(job.title, None, job.description)
+            fields.append({field: Counter(getattr(text, field).tokens) for field in self.FIELDS})
+        text_scores = self._bm25(terms, fields)
+        best = max(text_scores) or 1.0
+
+        scores = []
+        for job, text_score in zip(jobs, text_scores):
+            score = text_score / best + self._recency(job, now) + (self.remote_boost if job.remote else 0.0)
+            job.score = round(score, 6)
+            scores.append(job.score)
+        return scores
+
+    def rank(self, jobs: List[Job], keywords: str) -> List[Job]:
+        """As vagas da mais para a menos relevante (empates na ordem das fontes)"""
+        scores = self.score(jobs, keywords)
+        order = sorted(range(len(jobs)), key=lambda index: -scores[index])
+        return [jobs[index] for index in order]
+
+
+# Ordenação padrão das buscas (configurável por RANK_*)
+ranker = JobRanker()
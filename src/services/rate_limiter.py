@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from ..config import settings
+
+
+class TokenBucket:
+    """Token bucket com reserva de tokens
+
+    Cada chamada a ``reserve`` consome um token e retorna quanto tempo o
+    chamador deve esperar. Chamadas simultâneas recebem esperas escalonadas,
+    então a taxa é respeitada sem laços de tentativa.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reservar um token e retornar a espera necessária em segundos"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """Agendador de cortesia com um token bucket por host
+
+    Requisições para hosts diferentes não esperam umas pelas outras; cada
+    host respeita sua própria taxa, rajada e concorrência máxima. Funciona
+    tanto em código assíncrono (``limit``) quanto em threads (``limit_sync``).
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        hosts: Optional[Dict[str, Dict]] = None
+    ):
+        config = settings.rate_limit
+        self.rate = rate or config.rate
+        self.burst = burst or config.burst
+        self.concurrency = concurrency or config.concurrency
+        self.hosts = hosts if hosts is not None else config.hosts
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._thread_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Host de uma URL (ou o próprio valor, se já for um host)"""
+        netloc = urlsplit(url).netloc if "://" in url else url
+        return netloc.lower().split("@")[-1].split(":")[0]
+
+    def _limits(self, host: str) -> Dict:
+        override = self.hosts.get(host, {})
+        return {
+            "rate": override.get("rate", self.rate),
+            "burst": override.get("burst", self.burst),
+            "concurrency": override.get("concurrency", self.concurrency),
+        }
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                limits = self._limits(host)
+                bucket = self._buckets[host] = TokenBucket(limits["rate"], limits["burst"])
+            return bucket
+
+    def _thread_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._thread_slots.get(host)
+            if slot is None:
+                slot = self._thread_slots[host] = threading.BoundedSemaphore(self._limits(host)["concurrency"])
+            return slot
+
+    def _async_slot(self, host: str) -> asyncio.Semaphore:
+        # Semáforos asyncio pertencem a um event loop; um conjunto por loop
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_slots.setdefault(loop, {})
+            slot = slots.get(host)
+            if slot is None:
+                slot = slots[host] = asyncio.Semaphore(self._limits(host)["concurrency"])
+            return slot
+
+    @asynccontextmanager
+    async def limit(self, url: str):
+        """Aguardar vaga e token do host (código assíncrono)"""
+        host = self.host_of(url)
+        async with self._async_slot(host):
+            delay = self._bucket(host).reserve()
+            if delay:
+                await asyncio.sleep(delay)
+            yield
+
+    @contextmanager
+    def limit_sync(self, url: str):
+        """Aguardar vaga e token do host (código em threads)"""
+        host = self.host_of(url)
+        with self._thread_slot(host):
+            delay = self._bucket(host).reserve()
+            if delay:
+                time.sleep(delay)
+            yield
+
+
+# Instância compartilhada por todos os scrapers do processo
+rate_limiter = HostRateLimiter()
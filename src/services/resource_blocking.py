@@ -0,0 +1,105 @@
+import logging
+from fnmatch import fnmatch
+from typing import Dict, List, Optional
+
+from ..config import settings
+from .rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Padrões de URL por tipo de recurso, para o CDP (que não filtra por tipo)
+TYPE_PATTERNS: Dict[str, List[str]] = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.avif*"],
+    "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*", "*.ogg*"],
+    "stylesheet": ["*.css*"],
+}
+
+# Bytes transferidos e tempo de carregamento da página atual
+PAGE_METRICS_JS = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const bytes = resources.reduce((total, r) => total + (r.transferSize || 0), nav ? nav.transferSize : 0);
+    return {
+        bytes: bytes,
+        requests: resources.length + 1,
+        load_ms: nav ? (nav.loadEventEnd || nav.duration) : 0,
+        dom_ms: nav ? nav.domContentLoadedEventEnd : 0
+    };
+}"""
+
+
+class ResourceBlocker:
+    """Perfil de bloqueio de recursos que os scrapers não usam
+
+    Imagens, fontes, mídia, folhas de estilo e scripts de rastreamento são
+    bloqueados; ``allow`` libera, por host do site, tipos de recurso ou
+    padrões de URL necessários para os cards aparecerem. O mesmo perfil é
+    aplicado no Playwright (interceptação de requisições) e no Selenium
+    (``Network.setBlockedURLs`` via CDP).
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        resource_types: Optional[List[str]] = None,
+        trackers: Optional[List[str]] = None,
+        allow: Optional[Dict[str, List[str]]] = None
+    ):
+        config = settings.blocking
+        self.enabled = config.enabled if enabled is None else enabled
+        self.resource_types = resource_types if resource_types is not None else config.resource_types
+        self.trackers = trackers if trackers is not None else config.trackers
+        self.allow = allow if allow is not None else config.allow
+
+    def allowed_for(self, site: Optional[str]) -> List[str]:
+        """Exceções configuradas para o site (URL ou host)"""
+        if not site:
+            return []
+        return self.allow.get(HostRateLimiter.host_of(site), [])
+
+    def should_block(self, resource_type: str, url: str, allowed: List[str]) -> bool:
+        """Se uma requisição deve ser abortada"""
+        if not self.enabled:
+            return False
+        if any(fnmatch(url, pattern) for pattern in allowed if pattern not in TYPE_PATTERNS):
+            return False
+        if resource_type in self.resource_types and resource_type not in allowed:
+            return True
+        return any(fnmatch(url, pattern) for pattern in self.trackers)
+
+    def blocked_url_patterns(self, site: Optional[str] = None) -> List[str]:
+        """Padrões de URL equivalentes ao perfil, para o CDP"""
+        if not self.enabled:
+            return []
+        allowed = self.allowed_for(site)
+        patterns = [
+            pattern
+            for resource_type in self.resource_types if resource_type not in allowed
+            for pattern in TYPE_PATTERNS.get(resource_type, [])
+        ]
+        return patterns + list(self.trackers)
+
+    async def apply_playwright(self, page, site: Optional[str] = None):
+        """Interceptar as requisições de uma página Playwright"""
+        if not self.enabled:
+            return
+        allowed = self.allowed_for(site)
+
+        async def handle(route):
+            request = route.request
+            if self.should_block(request.resource_type, request.url, allowed):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await page.route("**/*", handle)
+
+    def apply_cdp(self, driver, site: Optional[str] = None):
+        """Bloquear URLs num WebDriver Chrome via CDP (lista vazia desativa)"""
+        patterns = self.blocked_url_patterns(site)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            logger.warning(f"Não foi possível aplicar o bloqueio de recursos: {str(e)}")
@@ -0,0 +1,227 @@
+import asyncio
+import email.utils
+import logging
+import random
+import statistics
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+import aiohttp
+import requests
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Falhas de rede/transporte que valem uma nova tentativa
+RETRYABLE_EXCEPTIONS = (
+    asyncio.TimeoutError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+class HTTPStatusError(Exception):
+    """Resposta HTTP de erro, com o ``Retry-After`` (em segundos) enviado pelo servidor"""
+
+    def __init__(self, source: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"{source}: HTTP {status}")
+        self.source = source
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Segundos pedidos pelo cabeçalho ``Retry-After`` (número ou data HTTP)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def check_status(source: str, status: int, headers) -> None:
+    """Levantar ``HTTPStatusError`` se a resposta (aiohttp ou requests) não for 200"""
+    if status != 200:
+        raise HTTPStatusError(source, status, parse_retry_after(headers.get("Retry-After")))
+
+
+class SourceMetrics:
+    """Tentativas, novas tentativas e latência das requisições de uma fonte"""
+
+    def __init__(self, window: int = 500):
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def attempt(self, latency: float, error: Optional[Exception] = None):
+        with self._lock:
+            self.attempts += 1
+            self._latencies.append(latency)
+            if error is not None:
+                self.last_error = str(error)
+
+    def finish(self, attempts: int, ok: bool):
+        with self._lock:
+            self.requests += 1
+            self.retries += attempts - 1
+            if not ok:
+                self.failures += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else None
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "failures": self.failures,
+                "latency_p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+                "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "last_error": self.last_error,
+            }
+
+
+class RetryMetrics:
+    """Métricas por fonte, criadas no primeiro uso"""
+
+    def __init__(self):
+        self._sources: Dict[str, SourceMetrics] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> SourceMetrics:
+        name = name.lower()
+        with self._lock:
+            metrics = self._sources.get(name)
+            if metrics is None:
+                metrics = self._sources[name] = SourceMetrics()
+            return metrics
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            sources = dict(self._sources)
+        return {name: metrics.snapshot() for name, metrics in sorted(sources.items())}
+
+
+# Métricas compartilhadas por todos os clientes HTTP do processo
+retry_metrics = RetryMetrics()
+
+
+class RetryPolicy:
+    """Política de novas tentativas comum a todos os clientes HTTP das fontes
+
+    Só falhas passageiras são repetidas: os status de ``statuses`` (429,
+    5xx, ...) e as exceções de rede de ``RETRYABLE_EXCEPTIONS``. A espera
+    cresce exponencialmente a partir de ``base_delay`` (até ``max_delay``)
+    com jitter completo, para clientes simultâneos não voltarem juntos; um
+    ``Retry-After`` do servidor é respeitado como espera mínima. Cada
+    requisição tem no máximo ``attempts`` tentativas e ``budget`` segundos
+    no total: se a próxima espera passar do orçamento, desiste na hora.
+    """
+
+    def __init__(
+        self,
+        attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        budget: Optional[float] = None,
+        statuses: Optional[Iterable[int]] = None
+    ):
+        config = settings.retry
+        self.attempts = max(1, attempts or config.attempts)
+        self.base_delay = base_delay if base_delay is not None else config.base_delay
+        self.max_delay = max_delay if max_delay is not None else config.max_delay
+        self.budget = budget if budget is not None else config.budget
+        self.statuses = frozenset(statuses if statuses is not None else config.statuses)
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, HTTPStatusError):
+            return error.status in self.statuses
+        return isinstance(error, RETRYABLE_EXCEPTIONS)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Espera antes da tentativa ``attempt + 1`` (0 = depois da primeira)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _next_delay(self, attempt: int, error: Exception, started: float) -> Optional[float]:
+        """Espera até a próxima tentativa, ou None para desistir"""
+        if attempt + 1 >= self.attempts or not self.is_retryable(error):
+            return None
+        delay = self.backoff(attempt, getattr(error, "retry_after", None))
+        if time.monotonic() - started + delay > self.budget:
+            return None
+        return delay
+
+    async def run(self, name: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Executar ``call`` (uma tentativa por chamada) repetindo as falhas passageiras"""
+        metrics = retry_metrics.get(name)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt_started = time.perf_counter()
+            try:
+                result = await call()
+            except Exception as e:
+                metrics.attempt(time.perf_counter() - attempt_started, e)
+                delay = self._next_delay(attempt, e, started)
+                if delay is None:
+                    metrics.finish(attempt + 1, ok=False)
+                    raise
+                attempt += 1
+                logger.warning(f"[{name}] {e}; tentativa {attempt + 1} de {self.attempts} em {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            metrics.attempt(time.perf_counter() - attempt_started)
+            metrics.finish(attempt + 1, ok=True)
+            return result
+
+    def run_sync(self, name: str, call: Callable[[], T]) -> T:
+        """Versão bloqueante de ``run`` para os clientes com requests"""
+        metrics = retry_metrics.get(name)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt_started = time.perf_counter()
+            try:
+                result = call()
+            except Exception as e:
+                metrics.attempt(time.perf_counter() - attempt_started, e)
+                delay = self._next_delay(attempt, e, started)
+                if delay is None:
+                    metrics.finish(attempt + 1, ok=False)
+                    raise
+                attempt += 1
+                logger.warning(f"[{name}] {e}; tentativa {attempt + 1} de {self.attempts} em {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            metrics.attempt(time.perf_counter() - attempt_started)
+            metrics.finish(attempt + 1, ok=True)
+            return result
+
+
+# Política padrão dos clientes HTTP (configurável por RETRY_*)
+retry_policy = RetryPolicy()
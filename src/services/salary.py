@@ -0,0 +1,181 @@
+import re
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from .extraction import fold
+
+# Período de cada valor salarial
+PERIODS = ("hour", "day", "week", "month", "year")
+
+# Quantas vezes cada período cabe num ano (40 horas e 5 dias por semana)
+PERIODS_PER_YEAR = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+
+# Moeda usada pela Adzuna em cada país (os valores vêm como números)
+COUNTRY_CURRENCIES = {
+    "br": "BRL", "us": "USD", "ca": "CAD", "gb": "GBP", "au": "AUD", "in": "INR",
+    "de": "EUR", "fr": "EUR", "es": "EUR", "it": "EUR", "nl": "EUR", "at": "EUR", "be": "EUR",
+}
+
+# Símbolos e nomes de moeda; R$ e US$ vêm antes de $
+_CURRENCY_PATTERNS = [
+    ("BRL", r"r\$|\bbrl\b|\breais\b"),
+    ("USD", r"us\$|\busd\b|\bd[oó]lar(?:es)?\b|\bdollars?\b|\$"),
+    ("EUR", r"€|\beur\b|\beuros?\b"),
+    ("GBP", r"£|\bgbp\b"),
+]
+_CURRENCY = re.compile("|".join(f"(?P<{code}>{pattern})" for code, pattern in _CURRENCY_PATTERNS), re.IGNORECASE)
+
+# Texto normalizado com ``fold`` (sem acentos)
+_PERIOD_PATTERNS = [
+    ("hour", r"\bhoras?\b|\bhour(?:ly)?\b|\bhrs?\b|/\s*h\b|\bp/?h\b"),
+    ("day", r"\bdias?\b|\bdiari[ao]\b|\bday\b|\bdaily\b|/\s*d\b"),
+    ("week", r"\bsemana(?:l)?\b|\bweek(?:ly)?\b|/\s*w(?:k)?\b"),
+    ("month", r"\bmes\b|\bmensa(?:l|is)\b|\bmonth(?:ly)?\b|/\s*m(?:o|es)?\b|\bp\.?m\.?\b"),
+    ("year", r"\bano\b|\banua(?:l|is)\b|\byear(?:ly)?\b|\bannual(?:ly)?\b|\bannum\b|\byr\b|/\s*(?:a|y)\b|\bp\.?a\.?\b"),
+]
+_PERIOD = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in _PERIOD_PATTERNS))
+
+# Palavras que indicam que o número é um salário (texto normalizado com ``fold``)
+_SALARY_KEYWORD = re.compile(
+    r"\b(?:salario|salarial|salary|remuneracao|remuneration|compensation|pay|wages?|bolsa|ordenado)\b"
+)
+
+# Número com separadores de milhar/decimal e sufixo opcional ("5.000,00", "120k", "5 mil")
+_AMOUNT = re.compile(
+    r"(?P<number>\d{1,3}(?:[.,\s]\d{3})+(?:[.,]\d{1,2})?|\d+(?:[.,]\d+)?)\s*(?P<suffix>k\b|mil\b)?",
+    re.IGNORECASE
+)
+# O que pode separar os dois valores de uma faixa
+_RANGE_GAP = re.compile(rf"^\s*(?:-|–|—|a|ate|até|to|and|e)\s*(?:{_CURRENCY.pattern})?\s*$", re.IGNORECASE)
+
+
+class Salary(NamedTuple):
+    """Salário normalizado (``min == max`` quando há um único valor)"""
+    min: float
+    max: float
+    currency: Optional[str]
+    period: Optional[str]
+
+
+def _parse_number(number: str) -> float:
+    """Interpretar "5.000,50", "120,000", "7,5" ou "12.50" """
+    number = re.sub(r"\s", "", number)
+    if "." in number and "," in number:
+        # O último separador é o decimal
+        decimal = "." if number.rfind(".") > number.rfind(",") else ","
+        thousands = "," if decimal == "." else "."
+        return float(number.replace(thousands, "").replace(decimal, "."))
+    for separator in ".,":
+        if separator in number:
+            parts = number.split(separator)
+            if len(parts) > 2 or len(parts[-1]) == 3:
+                return float(number.replace(separator, ""))  # separador de milhar
+            return float(number.replace(separator, "."))
+    return float(number)
+
+
+def _amounts(text: str) -> List[Tuple[float, int, int, Optional[str]]]:
+    """(valor, início, fim, sufixo) de cada número do texto"""
+    amounts = []
+    for match in _AMOUNT.finditer(text):
+        suffix = (match.group("suffix") or "").lower() or None
+        amounts.append((_parse_number(match.group("number")), match.start(), match.end(), suffix))
+    return amounts
+
+
+_MULTIPLIERS = {"k": 1_000, "mil": 1_000}
+
+
+def infer_period(value: float, currency: Optional[str]) -> Optional[str]:
+    """Período provável quando o texto não informa
+
+    No Brasil os salários costumam ser anunciados por mês; nas demais moedas,
+    por ano. Valores muito baixos são tratados como por hora.
+    """
+    if value < 200:
+        return "hour"
+    if currency == "BRL" and value < 50_000:
+        return "month"
+    return "year"
+
+
+def parse_salary(
+    value: Union[float, int, str, None],
+    currency: Optional[str] = None,
+    period: Optional[str] = None
+) -> Optional[Salary]:
+    """Normalizar um salário numérico ou textual
+
+    Aceita faixas ("R$ 5.000 - 7.000", "$120k-150k", "de 5 a 7 mil"),
+    sufixos "k"/"mil", separadores brasileiros e americanos e o período
+    ("/mês", "per year", "por hora"). ``currency`` e ``period`` são os
+    padrões quando o texto não informa (ex.: moeda do país da Adzuna).
+    Um texto só é salário se tiver moeda (no texto ou em ``currency``) ou
+    uma palavra como "salário"/"salary": números soltos ("5 anos de
+    experiência", "2.000") retornam None, assim como textos sem valor.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        if value <= 0:
+            return None
+        value = float(value)
+        return Salary(value, value, currency, period or infer_period(value, currency))
+
+    text = str(value).strip()
+    if not text:
+        return None
+
+    found = _CURRENCY.search(text)
+    if found:
+        currency = found.lastgroup
+    elif currency is None and not _SALARY_KEYWORD.search(fold(text)):
+        return None
+
+    amounts = _amounts(text)
+    if not amounts:
+        return None
+    values = [amounts[0]]
+    if len(amounts) > 1 and _RANGE_GAP.match(text[amounts[0][2]:amounts[1][1]]):
+        values.append(amounts[1])
+
+    # "120-150k": o sufixo do último valor vale para a faixa toda
+    last_suffix = values[-1][3]
+    numbers = [
+        number * _MULTIPLIERS.get(suffix or last_suffix, 1)
+        for number, _, _, suffix in values
+    ]
+    low, high = min(numbers), max(numbers)
+    if high <= 0:
+        return None
+
+    found = _PERIOD.search(fold(text))
+    if found:
+        period = found.lastgroup
+    return Salary(low, high, currency, period or infer_period(high, currency))
+
+
+# Valor precedido de moeda num texto livre, com faixa e período opcionais
+_ANY_CURRENCY = "|".join(pattern for _, pattern in _CURRENCY_PATTERNS)
+_NUMBER = r"\d{1,3}(?:[.,]\d{3})+(?:[.,]\d{1,2})?\s*(?:k\b|mil\b)?|\d+(?:[.,]\d+)?\s*(?:k\b|mil\b)?"
+_SALARY_IN_TEXT = re.compile(
+    rf"(?:{_ANY_CURRENCY})\s*(?:{_NUMBER})"
+    rf"(?:\s*(?:-|–|—|a|até|to)\s*(?:{_ANY_CURRENCY})?\s*(?:{_NUMBER}))?"
+    r"(?:\s*(?:/|por|per|an?|ao)\s*\w+)?",
+    re.IGNORECASE
+)
+
+
+def find_salary(
+    text: Optional[str],
+    currency: Optional[str] = None,
+    period: Optional[str] = None
+) -> Optional[Salary]:
+    """Primeiro salário com moeda explícita numa descrição ("R$ 5.000/mês")
+
+    Números soltos (anos de experiência, datas) são ignorados: só vale um
+    valor precedido de símbolo ou código de moeda.
+    """
+    if not text:
+        return None
+    found = _SALARY_IN_TEXT.search(text)
+    return parse_salary(found.group(), currency, period) if found else None
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ..config import settings
+from ..models.job import JobSearch, SavedSearch
+
+logger = logging.getLogger(__name__)
+
+
+class SavedSearchScheduler:
+    """Repete as buscas salvas em segundo plano para aquecer os resultados
+
+    A cada ``tick`` segundos as buscas salvas vencidas são executadas pelo
+    ``AsyncJobService`` (no máximo ``concurrency`` ao mesmo tempo), o que
+    grava as vagas na tabela ``jobs``, alimenta a fila de enriquecimento e
+    preenche o cache de resultados, de onde as buscas interativas iguais
+    são servidas. O próximo horário recebe um desvio aleatório de até
+    ``jitter`` do intervalo, para as buscas não dispararem juntas.
+
+    As buscas salvas usam a cota diária da Adzuna em nome do usuário
+    ``settings.scheduler.user_id``, no ritmo do ``QuotaBudget``: quando o
+    orçamento em segundo plano aperta, as de menor prioridade perdem a
+    Adzuna primeiro e, se não sobrar fonte, são adiadas até o ritmo
+    liberar a próxima requisição. As vencidas rodam da maior prioridade
+    para a menor.
+    """
+
+    def __init__(self, service, tick: Optional[int] = None, jitter: Optional[float] = None,
+                 concurrency: Optional[int] = None):
+        config = settings.scheduler
+        self.service = service
+        self.db = service.db
+        self.tick = tick or config.tick
+        self.jitter = config.jitter if jitter is None else jitter
+        self.concurrency = concurrency or config.concurrency
+        self.user_id = config.user_id
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.runs = 0
+        self.deferred = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Agendador de buscas salvas iniciado (a cada {self.tick}s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def next_run(self, saved: SavedSearch) -> datetime:
+        """Próximo horário: intervalo com desvio aleatório de ±jitter"""
+        interval = max(saved.interval_minutes * 60, settings.scheduler.min_interval)
+        return datetime.now() + timedelta(seconds=interval * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def _loop(self):
+        # Espera inicial aleatória: vários processos não verificam ao mesmo tempo
+        await asyncio.sleep(random.uniform(0, self.tick * self.jitter))
+        while True:
+            try:
+                await self.run_due()
+            except Exception as e:
+                logger.error(f"Erro no agendador de buscas salvas: {e}")
+            await asyncio.sleep(self.tick * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    async def run_due(self):
+        """Executar todas as buscas salvas vencidas"""
+        # Com vários workers, cada busca vencida é reservada por um só processo
+        due = await asyncio.to_thread(self.db.claim_due_saved_searches, settings.shared_state.lock_ttl)
+        if due:
+            await asyncio.gather(*(self.run_saved(saved) for saved in due))
+
+    async def run_saved(self, saved: SavedSearch):
+        """Executar uma busca salva e agendar a próxima"""
+        async with self._semaphore:
+            sources = list(saved.sources)
+            next_run = self.next_run(saved)
+            if "adzuna" in sources and not await asyncio.to_thread(
+                self.service.can_make_request, self.user_id, True, saved.priority
+            ):
+                sources.remove("adzuna")
+                if not sources:
+                    # Só a Adzuna: espera o ritmo da cota liberar a próxima requisição
+                    next_run = min(next_run, await asyncio.to_thread(self.service.quota.next_slot, saved.priority))
+                    logger.info(f"Busca salva {saved.id}: orçamento da Adzuna apertado, adiada para {next_run:%H:%M}")
+                else:
+                    logger.info(f"Busca salva {saved.id}: orçamento da Adzuna apertado, usando só as outras fontes")
+            if not sources:
+                self.deferred += 1
+                await asyncio.to_thread(self.db.mark_saved_search_run, saved.id, next_run)
+                return
+
+            search = JobSearch(
+                keywords=saved.keywords,
+                location=saved.location,
+                sources=sources,
+                countries=saved.countries,
+                remote_only=saved.remote_only
+            )
+            try:
+                jobs = await self.service.search_jobs(
+                    search, self.user_id, use_cache=False, background=True, priority=saved.priority
+                )
+            except Exception as e:
+                logger.error(f"Erro na busca salva {saved.id}: {e}")
+                self.deferred += 1
+                await asyncio.to_thread(self.db.mark_saved_search_run, saved.id, next_run)
+                return
+
+            # O cache precisa durar até a próxima execução; um resultado parcial
+            # fica com o prazo curto já gravado pela busca
+            if not search.partial:
+                ttl = (next_run - datetime.now()).total_seconds() + self.tick * 2
+                await asyncio.to_thread(
+                    self.service.cache_results,
+                    self.service.result_key(search),
+                    search.search_id,
+                    jobs,
+                    max(settings.cache.ttl, int(ttl)),
+                    search.source_status
+                )
+            self.runs += 1
+            await asyncio.to_thread(self.db.mark_saved_search_run, saved.id, next_run, search.search_id, len(jobs))
+            logger.info(f"Busca salva {saved.id} ({saved.keywords} em {saved.location}): {len(jobs)} vagas")
@@ -0,0 +1,383 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import sys
+import time
+import uuid
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from ..config import settings
+from ..database.db import Database
+
+logger = logging.getLogger(__name__)
+
+
+def _owner() -> str:
+    """Identificador do processo dono de um lock"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class SharedState:
+    """Contadores de uso, cache de resultados e locks compartilhados entre processos
+
+    Com o uvicorn/gunicorn em vários workers, cada processo tem sua própria
+    memória; guardar esse estado no SQLite do projeto (em modo WAL) faz os N
+    processos se comportarem como um só serviço: a cota diária é contada uma
+    vez, um resultado calculado por um worker serve a todos e uma busca igual
+    em andamento não é repetida em outro processo.
+    """
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or Database()
+        self._create_tables()
+
+    def _create_tables(self):
+        with self.db.get_connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS api_usage (
+                    user_id TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, day)
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS api_usage_country (
+                    country TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (country, day)
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS shared_cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_shared_cache_expires ON shared_cache (namespace, expires_at)"
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS shared_locks (
+                    name TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """
+            )
+
+    # Uso da API ---------------------------------------------------------
+
+    def usage(self, user_id: str) -> Dict[str, int]:
+        """Requisições de hoje e o total do usuário"""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(CASE WHEN day = ? THEN count END), 0) AS today, "
+                "COALESCE(SUM(count), 0) AS total FROM api_usage WHERE user_id = ?",
+                (date.today().isoformat(), user_id)
+            ).fetchone()
+            return {"today": row["today"], "total": row["total"]}
+
+    def usage_by_user(self) -> Dict[str, int]:
+        """Requisições de hoje de cada usuário"""
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT user_id, count FROM api_usage WHERE day = ? AND count > 0", (date.today().isoformat(),)
+            ).fetchall()
+            return {row["user_id"]: row["count"] for row in rows}
+
+    def acquire_usage(self, user_id: str, limit: int, total_limit: Optional[int] = None) -> bool:
+        """Reservar uma requisição da cota de hoje (atômico entre processos)
+
+        ``limit`` é o teto do usuário e ``total_limit`` o teto somado de todos
+        os usuários (a cota de uma chave de API é compartilhada).
+        """
+        if limit <= 0 or (total_limit is not None and total_limit <= 0):
+            return False
+        today = date.today().isoformat()
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                """
+                INSERT INTO api_usage (user_id, day, count)
+                SELECT ?, ?, 1 WHERE (SELECT COALESCE(SUM(count), 0) FROM api_usage WHERE day = ?) < ?
+                ON CONFLICT (user_id, day) DO UPDATE SET count = count + 1 WHERE count < ?
+                RETURNING count
+            """,
+                (user_id, today, today, sys.maxsize if total_limit is None else total_limit, limit)
+            ).fetchone()
+            return row is not None
+
+    def add_usage(self, user_id: str, amount: int = 1):
+        """Somar (ou devolver, com ``amount`` negativo) requisições de hoje"""
+        with self.db.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO api_usage (user_id, day, count) VALUES (?, ?, MAX(?, 0))
+                ON CONFLICT (user_id, day) DO UPDATE SET count = MAX(count + ?, 0)
+            """,
+                (user_id, date.today().isoformat(), amount, amount)
+            )
+
+    def usage_by_country(self) -> Dict[str, int]:
+        """Requisições de hoje em cada país"""
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT country, count FROM api_usage_country WHERE day = ? AND count > 0",
+                (date.today().isoformat(),)
+            ).fetchall()
+            return {row["country"]: row["count"] for row in rows}
+
+    def acquire_country_usage(self, country: str, limit: int) -> bool:
+        """Reservar uma requisição do teto diário de um país (atômico entre processos)"""
+        if limit <= 0:
+            return False
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                """
+                INSERT INTO api_usage_country (country, day, count) VALUES (?, ?, 1)
+                ON CONFLICT (country, day) DO UPDATE SET count = count + 1 WHERE count < ?
+                RETURNING count
+            """,
+                (country, date.today().isoformat(), limit)
+            ).fetchone()
+            return row is not None
+
+    def add_country_usage(self, country: str, amount: int = 1):
+        """Somar (ou devolver, com ``amount`` negativo) requisições de hoje de um país"""
+        with self.db.get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO api_usage_country (country, day, count) VALUES (?, ?, MAX(?, 0))
+                ON CONFLICT (country, day) DO UPDATE SET count = MAX(count + ?, 0)
+            """,
+                (country, date.today().isoformat(), amount, amount)
+            )
+
+    def import_usage_file(self, path: str):
+        """Importar o antigo ``api_usage.json`` uma única vez (idempotente)"""
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'r') as f:
+                usage = json.load(f)
+        except Exception as e:
+            logger.error(f"Erro ao importar uso da API de {path}: {e}")
+            return
+        rows = []
+        for user_id, data in usage.items():
+            daily = data.get("daily", {})
+            rows.extend((user_id, day, count) for day, count in daily.items())
+            # O total anterior ao controle diário fica numa linha à parte
+            rows.append((user_id, "imported", max(data.get("total", 0) - sum(daily.values()), 0)))
+        with self.db.get_connection() as conn:
+            conn.executemany("INSERT OR IGNORE INTO api_usage (user_id, day, count) VALUES (?, ?, ?)", rows)
+
+    # Locks ----------------------------------------------------------------
+
+    def acquire_lock(self, name: str, owner: str, ttl: float) -> bool:
+        """Pegar o lock ``name`` (ou tomar um lock vencido)"""
+        now = time.time()
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                """
+                INSERT INTO shared_locks (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE shared_locks.expires_at < ?
+            """,
+                (name, owner, now + ttl, now)
+            ).rowcount > 0
+
+    def release_lock(self, name: str, owner: str):
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM shared_locks WHERE name = ? AND owner = ?", (name, owner))
+
+    def lock_held(self, name: str) -> bool:
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                "SELECT 1 FROM shared_locks WHERE name = ? AND expires_at >= ?", (name, time.time())
+            ).fetchone() is not None
+
+
+class SharedCache:
+    """Cache com expiração no SQLite, com a mesma interface do ``TTLCache``
+
+    Chaves e valores precisam ser serializáveis em JSON. A expiração usa o
+    relógio do sistema (comum a todos os processos); entradas vencidas e o
+    excesso sobre ``max_size`` são removidos a cada ``purge_every`` gravações.
+    """
+
+    def __init__(
+        self,
+        state: SharedState,
+        namespace: str,
+        ttl: Optional[int] = None,
+        max_size: Optional[int] = None,
+        purge_every: int = 100
+    ):
+        self.state = state
+        self.db = state.db
+        self.namespace = namespace
+        self.ttl = ttl if ttl is not None else settings.cache.ttl
+        self.max_size = max_size if max_size is not None else settings.cache.max_size
+        self.purge_every = purge_every
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, ensure_ascii=False, separators=(",", ":"))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Obter valor do cache (None se ausente ou expirado)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM shared_cache WHERE namespace = ? AND key = ? AND expires_at >= ?",
+                (self.namespace, self._key(key), time.time())
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row["value"])
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None):
+        """Guardar valor no cache"""
+        expires_at = time.time() + (ttl if ttl is not None else self.ttl)
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO shared_cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (self.namespace, self._key(key), json.dumps(value, ensure_ascii=False), expires_at)
+            )
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            self.purge()
+
+    def delete(self, key: Hashable):
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "DELETE FROM shared_cache WHERE namespace = ? AND key = ?", (self.namespace, self._key(key))
+            )
+
+    def purge(self):
+        """Remover entradas vencidas e as que passam de ``max_size``"""
+        with self.db.get_connection() as conn:
+            conn.execute(
+                "DELETE FROM shared_cache WHERE namespace = ? AND expires_at < ?", (self.namespace, time.time())
+            )
+            conn.execute(
+                """
+                DELETE FROM shared_cache WHERE namespace = ? AND key IN (
+                    SELECT key FROM shared_cache WHERE namespace = ?
+                    ORDER BY expires_at DESC LIMIT -1 OFFSET ?
+                )
+            """,
+                (self.namespace, self.namespace, self.max_size)
+            )
+
+    def clear(self):
+        """Limpar o cache"""
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM shared_cache WHERE namespace = ?", (self.namespace,))
+
+    def __len__(self) -> int:
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM shared_cache WHERE namespace = ? AND expires_at >= ?",
+                (self.namespace, time.time())
+            ).fetchone()[0]
+
+
+class SingleFlight:
+    """Garante uma única execução por chave entre tarefas e processos
+
+    No mesmo processo, quem chega com uma chave em andamento aguarda o
+    mesmo ``Future``. Entre processos, só quem pega o lock compartilhado
+    executa; os demais consultam ``lookup`` (tipicamente o ``SharedCache``)
+    a cada ``poll`` segundos até o resultado aparecer. Se o dono do lock
+    morrer, o lock vence em ``ttl`` segundos e outro processo assume; depois
+    de ``ttl`` esperando, o processo executa por conta própria.
+    """
+
+    def __init__(self, state: SharedState, ttl: Optional[float] = None, poll: Optional[float] = None):
+        config = settings.shared_state
+        self.state = state
+        self.ttl = ttl or config.lock_ttl
+        self.poll = poll or config.lock_poll
+        self.owner = _owner()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def run(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        lookup: Callable[[], Optional[Any]]
+    ) -> Any:
+        """Resultado de ``fetch`` para ``key``, executado uma única vez
+
+        ``lookup`` é síncrono (roda em thread) e deve retornar o resultado já
+        publicado por outro processo, ou None.
+        """
+        name = SharedCache._key(key)
+        inflight = self._inflight.get(name)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[name] = future
+        try:
+            result = await self._run_shared(name, fetch, lookup)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # evita o aviso quando ninguém mais aguarda
+            raise
+        finally:
+            del self._inflight[name]
+
+    async def _run_shared(self, name: str, fetch, lookup) -> Any:
+        lock = f"singleflight:{name}"
+        deadline = time.monotonic() + self.ttl
+        while True:
+            if await asyncio.to_thread(self.state.acquire_lock, lock, self.owner, self.ttl):
+                try:
+                    # Outro processo pode ter terminado entre a consulta e o lock
+                    result = await asyncio.to_thread(lookup)
+                    if result is not None:
+                        self.coalesced += 1
+                        return result
+                    self.executed += 1
+                    return await fetch()
+                finally:
+                    await asyncio.to_thread(self.state.release_lock, lock, self.owner)
+
+            await asyncio.sleep(self.poll)
+            result = await asyncio.to_thread(lookup)
+            if result is not None:
+                self.coalesced += 1
+                return result
+            if time.monotonic() > deadline:
+                logger.warning(f"Lock {lock} não liberado em {self.ttl}s; executando sem ele")
+                self.executed += 1
+                return await fetch()
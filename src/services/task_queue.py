@@ -0,0 +1,290 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import date
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from ..config import settings
+from ..database.db import Database
+from ..scrapers.engine import SourceEngine
+from ..scrapers.sources import get_source
+from .canonical import canonical_query
+
+logger = logging.getLogger(__name__)
+
+# Estados de uma tarefa
+PENDING, LEASED, DONE, FAILED = "pending", "leased", "done", "failed"
+
+
+class CrawlTask(NamedTuple):
+    """Unidade de trabalho: uma página de resultados de uma fonte"""
+    id: int
+    crawl_id: str
+    source: str
+    keywords: str
+    location: str
+    page: int
+    attempts: int
+    max_attempts: int
+
+
+class TaskQueue:
+    """Fila de tarefas de crawl persistida no SQLite do projeto
+
+    Cada tarefa é uma página (fonte, palavras-chave, local, página). Um
+    worker pega tarefas com ``lease``: elas ficam reservadas por
+    ``visibility_timeout`` segundos e voltam para a fila se o worker morrer
+    sem confirmar. ``ack`` conclui; ``nack`` devolve com espera crescente
+    até ``max_attempts`` tentativas, quando a tarefa é marcada como falha.
+
+    Enfileirar é idempotente (a mesma página do mesmo crawl só existe uma
+    vez), então um crawl interrompido é retomado de onde parou só rodando
+    os workers de novo. Vários processos podem consumir a mesma fila.
+    """
+
+    def __init__(
+        self,
+        db: Optional[Database] = None,
+        visibility_timeout: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay: Optional[int] = None
+    ):
+        config = settings.crawl
+        self.db = db or Database()
+        self.visibility_timeout = visibility_timeout or config.visibility_timeout
+        self.max_attempts = max_attempts or config.max_attempts
+        self.retry_delay = config.retry_delay if retry_delay is None else retry_delay
+        self._create_table()
+
+    def _create_table(self):
+        with self.db.get_connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS crawl_tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    crawl_id TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    keywords TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    query_key TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    result_count INTEGER,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    UNIQUE(crawl_id, source, keywords, location, page)
+                )
+            """
+            )
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(crawl_tasks)")}
+            if "query_key" not in existing:
+                conn.execute("ALTER TABLE crawl_tasks ADD COLUMN query_key TEXT")
+            # Grafias equivalentes da mesma busca não geram tarefas repetidas
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_tasks_query ON crawl_tasks (crawl_id, query_key, page)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_crawl_tasks_ready ON crawl_tasks (status, available_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_crawl_tasks_lease ON crawl_tasks (status, lease_expires)"
+            )
+
+    def enqueue(
+        self,
+        sources: Iterable[str],
+        keywords: str,
+        location: str,
+        pages: Iterable[int] = (1,),
+        crawl_id: Optional[str] = None
+    ) -> str:
+        """Enfileirar páginas de uma busca; retorna o ``crawl_id``
+
+        As fontes recebem as palavras-chave e o local como digitados; a
+        forma canônica só dá a chave de cada página. Sem ``crawl_id``, o id
+        é derivado da busca canônica e do dia: enfileirar
+        de novo a mesma busca (em qualquer grafia) no mesmo dia não repete
+        páginas, e o crawl continua de onde parou.
+        """
+        sources = [source.lower() for source in sources]
+        pages = list(pages)
+        if crawl_id is None:
+            crawl_id = f"{date.today():%Y%m%d}-{canonical_query(keywords, location, sources).digest}"
+        now = time.time()
+        rows = []
+        for source in sources:
+            # Uma chave por fonte: a ordem das palavras só conta nas fontes que a consideram
+            query = canonical_query(keywords, location, [source])
+            rows.extend(
+                (crawl_id, source, query.keywords, query.location, page, query.key, self.max_attempts, now, now, now)
+                for page in pages
+            )
+        with self.db.get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO crawl_tasks
+                (crawl_id, source, keywords, location, page, query_key, max_attempts, available_at, created_at,
+                 updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows
+            )
+        return crawl_id
+
+    def lease(self, owner: str, limit: int = 1) -> List[CrawlTask]:
+        """Reservar até ``limit`` tarefas prontas (ou com reserva vencida)"""
+        now = time.time()
+        with self.db.get_connection() as conn:
+            # Reservas vencidas que já esgotaram as tentativas viram falha
+            conn.execute(
+                f"""
+                UPDATE crawl_tasks SET status = '{FAILED}', error = 'reserva expirada', updated_at = ?
+                WHERE status = '{LEASED}' AND lease_expires <= ? AND attempts >= max_attempts
+            """,
+                (now, now)
+            )
+            rows = conn.execute(
+                f"""
+                UPDATE crawl_tasks
+                SET status = '{LEASED}', lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ?
+                WHERE id IN (
+                    SELECT id FROM crawl_tasks
+                    WHERE (status = '{PENDING}' AND available_at <= ?)
+                       OR (status = '{LEASED}' AND lease_expires <= ?)
+                    ORDER BY page, id
+                    LIMIT ?
+                )
+                RETURNING id, crawl_id, source, keywords, location, page, attempts, max_attempts
+            """,
+                (owner, now + self.visibility_timeout, now, now, now, limit)
+            ).fetchall()
+            return [CrawlTask(*row) for row in rows]
+
+    def extend(self, task: CrawlTask, owner: str) -> bool:
+        """Renovar a reserva de uma tarefa longa"""
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                f"UPDATE crawl_tasks SET lease_expires = ?, updated_at = ? "
+                f"WHERE id = ? AND lease_owner = ? AND status = '{LEASED}'",
+                (time.time() + self.visibility_timeout, time.time(), task.id, owner)
+            ).rowcount > 0
+
+    def ack(self, task: CrawlTask, owner: str, result_count: int = 0) -> bool:
+        """Concluir uma tarefa (ignorado se a reserva passou para outro worker)"""
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                f"UPDATE crawl_tasks SET status = '{DONE}', result_count = ?, error = NULL, updated_at = ? "
+                f"WHERE id = ? AND lease_owner = ? AND status = '{LEASED}'",
+                (result_count, time.time(), task.id, owner)
+            ).rowcount > 0
+
+    def nack(self, task: CrawlTask, owner: str, error: str) -> bool:
+        """Devolver uma tarefa que falhou, com espera exponencial até o limite de tentativas"""
+        now = time.time()
+        status = FAILED if task.attempts >= task.max_attempts else PENDING
+        delay = self.retry_delay * 2 ** (task.attempts - 1)
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                f"UPDATE crawl_tasks SET status = ?, available_at = ?, error = ?, lease_owner = NULL, "
+                f"lease_expires = NULL, updated_at = ? WHERE id = ? AND lease_owner = ? AND status = '{LEASED}'",
+                (status, now + delay, error[:500], now, task.id, owner)
+            ).rowcount > 0
+
+    def stats(self, crawl_id: Optional[str] = None) -> Dict[str, int]:
+        """Quantidade de tarefas por estado"""
+        where, params = ("WHERE crawl_id = ?", (crawl_id,)) if crawl_id else ("", ())
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT status, COUNT(*) AS total FROM crawl_tasks {where} GROUP BY status", params
+            ).fetchall()
+        counts = {status: 0 for status in (PENDING, LEASED, DONE, FAILED)}
+        counts.update({row["status"]: row["total"] for row in rows})
+        return counts
+
+    def retry_failed(self, crawl_id: Optional[str] = None) -> int:
+        """Devolver tarefas que falharam para a fila, zerando as tentativas"""
+        where, params = ("AND crawl_id = ?", (crawl_id,)) if crawl_id else ("", ())
+        with self.db.get_connection() as conn:
+            return conn.execute(
+                f"UPDATE crawl_tasks SET status = '{PENDING}', attempts = 0, available_at = ?, updated_at = ? "
+                f"WHERE status = '{FAILED}' {where}",
+                (time.time(), time.time(), *params)
+            ).rowcount
+
+
+class CrawlWorker:
+    """Consome a ``TaskQueue`` com ``concurrency`` tarefas simultâneas
+
+    Cada tarefa baixa uma página pelo ``SourceEngine`` (cache, limites por
+    host), grava as vagas na tabela ``jobs`` com o ``crawl_id`` como
+    ``search_id`` e, se a fonte indicar próxima página (até
+    ``max_pages``), enfileira a continuação antes de confirmar.
+    """
+
+    def __init__(
+        self,
+        queue: Optional[TaskQueue] = None,
+        engine: Optional[SourceEngine] = None,
+        concurrency: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        poll_interval: Optional[float] = None
+    ):
+        config = settings.crawl
+        self.queue = queue or TaskQueue()
+        self.db = self.queue.db
+        self.engine = engine or SourceEngine()
+        self.concurrency = concurrency or config.concurrency
+        self.max_pages = max_pages or config.max_pages
+        self.poll_interval = poll_interval or config.poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.processed = 0
+        self.failed = 0
+
+    async def run(self, stop_when_empty: bool = True):
+        """Processar tarefas até a fila esvaziar (ou para sempre)"""
+        try:
+            await asyncio.gather(*(self._loop(stop_when_empty) for _ in range(self.concurrency)))
+        finally:
+            await self.engine.close()
+
+    async def _loop(self, stop_when_empty: bool):
+        while True:
+            tasks = await asyncio.to_thread(self.queue.lease, self.owner, 1)
+            if not tasks:
+                if stop_when_empty and not await asyncio.to_thread(self._has_open_tasks):
+                    return
+                await asyncio.sleep(self.poll_interval)
+                continue
+            await self.process(tasks[0])
+
+    def _has_open_tasks(self) -> bool:
+        stats = self.queue.stats()
+        return stats[PENDING] + stats[LEASED] > 0
+
+    async def process(self, task: CrawlTask):
+        """Executar uma tarefa e confirmar (ou devolver) na fila"""
+        try:
+            source = get_source(task.source)
+            jobs = await self.engine.fetch_page(source, task.keywords, task.location, task.page)
+            await asyncio.to_thread(self.db.save_jobs, jobs, task.crawl_id, "crawl")
+            # O crawl vai além das páginas de uma busca interativa
+            if source.has_next_page(task.page, jobs, max(source.max_pages, self.max_pages)):
+                await asyncio.to_thread(
+                    self.queue.enqueue, [task.source], task.keywords, task.location, [task.page + 1], task.crawl_id
+                )
+            await asyncio.to_thread(self.queue.ack, task, self.owner, len(jobs))
+            self.processed += 1
+            logger.info(f"[crawl] {task.source} p{task.page} '{task.keywords}': {len(jobs)} vagas")
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"[crawl] Tarefa {task.id} ({task.source} p{task.page}) falhou: {str(e)}")
+            await asyncio.to_thread(self.queue.nack, task, self.owner, str(e))
@@ -1,29 +1,98 @@
 import logging
-import random
+import statistics
+import threading
 import time
-from typing import Optional
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Optional
 from fake_useragent import UserAgent
 import undetected_chromedriver as uc
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium_stealth import stealth
 
 from ..config import settings
+from .resource_blocking import ResourceBlocker
 
 logger = logging.getLogger(__name__)
 
+
+class PooledDriver:
+    """WebDriver do pool com idade e número de usos"""
+
+    def __init__(self, driver: uc.Chrome):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.uses = 0
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+
 class WebDriverManager:
-    def __init__(self):
+    """Cria WebDrivers não detectáveis e mantém um pool de drivers aquecidos
+
+    ``driver()`` empresta um driver do pool e o devolve ao final, limpo de
+    cookies. Drivers que falham na verificação de saúde, passam de
+    ``max_age`` segundos ou de ``max_uses`` usos são encerrados e
+    substituídos. Nunca existem mais de ``max_browsers`` navegadores abertos;
+    quem pede além disso espera um driver ser devolvido.
+    """
+
+    LATENCY_WINDOW = 500
+
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        max_browsers: Optional[int] = None,
+        max_age: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        blocker: Optional[ResourceBlocker] = None
+    ):
+        config = settings.webdriver
         self.user_agent = UserAgent()
-    
+        self.max_browsers = max_browsers or config.max_browsers
+        self.pool_size = pool_size or config.pool_size
+        if self.pool_size > self.max_browsers:
+            # O limite de navegadores é rígido: o pool aquecido cabe dentro dele
+            logger.warning(
+                f"Pool de {self.pool_size} WebDrivers maior que o limite de {self.max_browsers} "
+                f"navegadores; usando {self.max_browsers}"
+            )
+            self.pool_size = self.max_browsers
+        self.max_age = max_age or config.max_age
+        self.max_uses = max_uses or config.max_uses
+        self.ready_timeout = config.ready_timeout
+        self.blocker = blocker or ResourceBlocker()
+
+        self._idle: List[PooledDriver] = []
+        self._open = 0  # drivers vivos (ociosos + emprestados)
+        self._condition = threading.Condition()
+
+        # Latências em segundos (as últimas ``LATENCY_WINDOW`` de cada tipo)
+        self.startup_times: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self.scrape_times: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self.recycled = 0
+
+    def _wait_ready(self, driver: uc.Chrome):
+        """Aguardar o navegador responder e o documento atual terminar de carregar"""
+        WebDriverWait(driver, self.ready_timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+
     def get_webdriver(self) -> uc.Chrome:
+        """Criar um driver novo (fora do pool; quem chama deve encerrá-lo)"""
+        started = time.perf_counter()
         try:
             # Usar undetected-chromedriver como base
             options = uc.ChromeOptions()
-            
+
             # User agent aleatório
             user_agent = self.user_agent.random
             options.add_argument(f'--user-agent={user_agent}')
             logger.info(f"Usando User-Agent: {user_agent}")
-            
+
             # Configurações básicas
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-gpu')
@@ -32,10 +101,10 @@ class WebDriverManager:
             options.add_argument('--disable-popup-blocking')
             options.add_argument('--disable-notifications')
             options.add_argument('--disable-infobars')
-            
+
             # Criar driver não detectável
             driver = uc.Chrome(options=options, use_subprocess=True)
-            
+
             # Aplicar técnicas de stealth
             stealth(driver,
                 languages=["pt-BR", "pt", "en-US", "en"],
@@ -45,23 +114,163 @@ class WebDriverManager:
                 renderer="Intel Iris OpenGL Engine",
                 fix_hairline=True,
             )
-            
+
             # Configurar tamanho da janela
             driver.set_window_size(1920, 1080)
-            
+
             # Limpar cookies e cache
             driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
             driver.execute_cdp_cmd('Network.clearBrowserCache', {})
-            
-            # Aguardar um pouco para garantir que tudo foi carregado
-            time.sleep(2)
-            
+
+            # Aguardar o navegador ficar pronto
+            self._wait_ready(driver)
+
             # Configurar timeouts
-            driver.set_page_load_timeout(settings.TIMEOUT)
-            driver.implicitly_wait(settings.TIMEOUT)
-            
+            driver.set_page_load_timeout(settings.scraper.timeout)
+            driver.implicitly_wait(settings.scraper.timeout)
+
+            elapsed = time.perf_counter() - started
+            self.startup_times.append(elapsed)
+            logger.info(f"WebDriver pronto em {elapsed:.2f}s")
             return driver
-            
+
         except Exception as e:
             logger.error(f"Erro ao criar WebDriver: {str(e)}")
             raise
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """Verificar se o driver ainda responde e está dentro dos limites"""
+        if pooled.age > self.max_age or pooled.uses >= self.max_uses:
+            return False
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"Erro ao encerrar WebDriver: {str(e)}")
+        with self._condition:
+            self._open -= 1
+            self.recycled += 1
+            self._condition.notify()
+
+    def warm(self, count: Optional[int] = None):
+        """Iniciar drivers até o pool ter ``count`` ociosos (padrão: pool_size)"""
+        target = min(count or self.pool_size, self.max_browsers)
+        while True:
+            with self._condition:
+                if len(self._idle) >= target or self._open >= self.max_browsers:
+                    return
+                self._open += 1
+            try:
+                pooled = PooledDriver(self.get_webdriver())
+            except Exception:
+                with self._condition:
+                    self._open -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """Emprestar um driver saudável, criando um se houver vaga"""
+        deadline = time.monotonic() + (timeout or settings.webdriver.checkout_timeout)
+        while True:
+            with self._condition:
+                while not self._idle and self._open >= self.max_browsers:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError("Nenhum WebDriver disponível no pool")
+                    self._condition.wait(remaining)
+                if self._idle:
+                    pooled = self._idle.pop()
+                else:
+                    self._open += 1
+                    pooled = None
+
+            if pooled is None:
+                try:
+                    return PooledDriver(self.get_webdriver())
+                except Exception:
+                    with self._condition:
+                        self._open -= 1
+                        self._condition.notify()
+                    raise
+
+            if self._is_healthy(pooled):
+                return pooled
+            logger.info("WebDriver expirado ou sem resposta, reciclando")
+            self._quit(pooled)
+
+    def release(self, pooled: PooledDriver, broken: bool = False):
+        """Devolver um driver ao pool (ou encerrá-lo se estiver quebrado)"""
+        pooled.uses += 1
+        if not broken:
+            try:
+                pooled.driver.delete_all_cookies()
+                pooled.driver.get("about:blank")
+            except WebDriverException:
+                broken = True
+        if broken or not self._is_healthy(pooled):
+            self._quit(pooled)
+            return
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    @contextmanager
+    def driver(self, site: Optional[str] = None):
+        """Usar um driver do pool::
+
+            with manager.driver(url) as driver:
+                driver.get(url)
+
+        ``site`` (URL ou host) escolhe as exceções do bloqueio de recursos.
+        """
+        pooled = self.checkout()
+        started = time.perf_counter()
+        broken = False
+        try:
+            # Dentro do try: se falhar, o driver volta ao pool (ou é encerrado)
+            self.blocker.apply_cdp(pooled.driver, site)
+            yield pooled.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.scrape_times.append(elapsed)
+            logger.info(f"Scraping com WebDriver levou {elapsed:.2f}s (uso {pooled.uses + 1})")
+            self.release(pooled, broken)
+
+    def stats(self) -> Dict:
+        """Latências de inicialização e de scraping, e estado do pool"""
+        def summary(values: Deque[float]) -> Dict:
+            if not values:
+                return {"count": 0, "avg": 0.0, "p50": 0.0, "max": 0.0}
+            return {
+                "count": len(values),
+                "avg": round(statistics.mean(values), 3),
+                "p50": round(statistics.median(values), 3),
+                "max": round(max(values), 3)
+            }
+
+        with self._condition:
+            return {
+                "startup": summary(self.startup_times),
+                "scrape": summary(self.scrape_times),
+                "open": self._open,
+                "idle": len(self._idle),
+                "recycled": self.recycled
+            }
+
+    def close(self):
+        """Encerrar todos os drivers ociosos"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
@@ -79,11 +79,28 @@ document.addEventListener('DOMContentLoaded', () => {
 
 // Global State
 let jobs = [];
+let currentSearchId = null;
+let resultsTotal = 0;
 let filters = {
     remoteOnly: false,
-    sortBy: 'date' // 'date' or 'salary'
+    sortBy: 'relevance' // 'relevance', 'date' or 'salary'
 };
 
+// Filtros, ordenação e paginação rodam no servidor; só a página visível vem na resposta
+function resultParams(remoteOnly, sortBy, offset = 0, limit = 20) {
+    const params = new URLSearchParams({ sort_by: sortBy, limit, offset });
+    if (remoteOnly) params.set('remote', 'true');
+    return params;
+}
+
+async function fetchResults(searchId, params) {
+    const response = await fetch(`/api/jobs/results/${encodeURIComponent(searchId)}?${params}`);
+    if (!response.ok) {
+        throw new Error('Erro ao carregar resultados');
+    }
+    return response.json();
+}
+
 // DOM Elements
 const searchForm = document.getElementById('searchForm');
 const loadingIndicator = document.getElementById('loadingIndicator');
@@ -118,28 +135,22 @@ async function handleSearch(e) {
     showLoading(true);
     
     try {
-        const response = await fetch(
-            '/api/jobs/search?user_id=test_user',
-            {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({
-                    keywords,
-                    location,
-                    sources: ["adzuna", "linkedin"],
-                    remote_only: filters.remoteOnly
-                })
-            }
-        );
+        const params = resultParams(filters.remoteOnly, filters.sortBy);
+        params.set('keywords', keywords);
+        params.set('location', location);
+        params.set('user_id', 'test_user');
+        params.append('sources', 'adzuna');
+        params.append('sources', 'linkedin');
+        const response = await fetch(`/api/jobs/search?${params}`, { method: 'POST' });
         
         if (!response.ok) {
             throw new Error('Erro ao buscar vagas');
         }
         
         const data = await response.json();
+        currentSearchId = data.search_id;
         jobs = data.jobs || [];
+        resultsTotal = data.total || 0;
         
         if (jobs.length > 0) {
             renderJobs();
@@ -160,13 +171,7 @@ function renderJobs() {
     jobsList.innerHTML = '';
     const template = document.getElementById('jobCardTemplate');
     
-    const filteredJobs = jobs.filter(job => 
-        !filters.remoteOnly || job.remote
-    );
-    
-    const sortedJobs = sortJobsList(filteredJobs);
-    
-    sortedJobs.forEach(job => {
+    jobs.forEach(job => {
         const clone = template.content.cloneNode(true);
         
         // Set badge
@@ -191,10 +196,10 @@ function renderJobs() {
         
         // Set salary if available
         const salaryInfo = clone.querySelector('.salary-info');
-        if (job.salary) {
+        if (job.salary_min) {
             salaryInfo.style.display = 'block';
             salaryInfo.querySelector('span').textContent = 
-                formatSalary(job.salary);
+                formatSalary(job);
         }
         
         // Set posted date
@@ -210,31 +215,42 @@ function renderJobs() {
     
     // Update results count
     const resultsTitle = document.querySelector('.results-title');
-    resultsTitle.textContent = `${sortedJobs.length} Vagas Encontradas`;
+    resultsTitle.textContent = `${resultsTotal} Vagas Encontradas`;
+}
+
+// Recarregar a primeira página da busca atual com os filtros escolhidos
+async function reloadResults() {
+    if (!currentSearchId) return;
+    showLoading(true);
+    try {
+        const data = await fetchResults(currentSearchId, resultParams(filters.remoteOnly, filters.sortBy));
+        jobs = data.jobs || [];
+        resultsTotal = data.total || 0;
+        if (jobs.length > 0) {
+            renderJobs();
+            showResults(true);
+        } else {
+            showNoResults(true);
+        }
+    } catch (error) {
+        showError(error.message);
+    } finally {
+        showLoading(false);
+    }
 }
 
 // Filter and Sort Functions
 function toggleRemoteFilter() {
     filters.remoteOnly = !filters.remoteOnly;
     toggleRemoteBtn.classList.toggle('active');
-    renderJobs();
+    reloadResults();
 }
 
 function sortJobs(by) {
     filters.sortBy = by;
     sortDateBtn.classList.toggle('active', by === 'date');
     sortSalaryBtn.classList.toggle('active', by === 'salary');
-    renderJobs();
-}
-
-function sortJobsList(jobsList) {
-    return [...jobsList].sort((a, b) => {
-        if (filters.sortBy === 'date') {
-            return new Date(b.posted_date) - new Date(a.posted_date);
-        } else {
-            return (b.salary || 0) - (a.salary || 0);
-        }
-    });
+    reloadResults();
 }
 
 // API Usage
@@ -276,11 +292,25 @@ function formatDate(dateStr) {
     return moment(dateStr).fromNow();
 }
 
-function formatSalary(salary) {
-    return new Intl.NumberFormat('pt-BR', {
+const SALARY_PERIODS = {
+    hour: '/hora',
+    day: '/dia',
+    week: '/semana',
+    month: '/mês',
+    year: '/ano'
+};
+
+// Salário normalizado pelo servidor (salary_min, salary_max, currency, period)
+function formatSalary(job) {
+    const format = value => new Intl.NumberFormat('pt-BR', {
         style: 'currency',
-        currency: 'BRL'
-    }).format(salary);
+        currency: job.currency || 'BRL',
+        maximumFractionDigits: 0
+    }).format(value);
+    const range = job.salary_max && job.salary_max !== job.salary_min
+        ? `${format(job.salary_min)} - ${format(job.salary_max)}`
+        : format(job.salary_min);
+    return range + (SALARY_PERIODS[job.period] || '');
 }
 
 function truncateText(text, length) {
@@ -320,8 +350,11 @@ document.addEventListener('DOMContentLoaded', () => {
     const totalJobsSpan = document.getElementById('totalJobs');
     const remoteFilterBtn = document.getElementById('remoteFilter');
     
-    let currentJobs = [];
+    let searchId = null;
     let showOnlyRemote = false;
+    let sortBy = 'relevance';
+    let loadedJobs = 0;
+    const PAGE_SIZE = 20;
 
     // Função para formatar a data
     function formatDate(dateString) {
@@ -337,12 +370,10 @@ document.addEventListener('DOMContentLoaded', () => {
         return `${Math.floor(diffDays / 30)} meses atrás`;
     }
 
-    // Função para formatar salário
-    function formatSalary(min, max) {
-        if (!min && !max) return '';
-        if (!max) return `A partir de $${min.toLocaleString()}`;
-        if (!min) return `Até $${max.toLocaleString()}`;
-        return `$${min.toLocaleString()} - $${max.toLocaleString()}`;
+    // Função para formatar salário (campos normalizados pelo servidor)
+    function formatSalary(job) {
+        if (!job.salary_min && !job.salary_max) return '';
+        return window.formatSalary(job);
     }
 
     // Função para criar card de vaga
@@ -350,8 +381,8 @@ document.addEventListener('DOMContentLoaded', () => {
         const card = document.createElement('div');
         card.className = 'col-md-6 col-lg-4 mb-4';
         
-        const salary = formatSalary(job.salary_min, job.salary_max);
-        const date = formatDate(job.created);
+        const salary = formatSalary(job);
+        const date = formatDate(job.posted_date || job.date_added);
         
         card.innerHTML = `
             <div class="card h-100">
@@ -366,7 +397,7 @@ document.addEventListener('DOMContentLoaded', () => {
                         <i class="bi bi-geo-alt"></i> ${job.location}
                     </p>
                     <p class="card-text description">${job.description}</p>
-                    ${salary ? `<p class="card-text"><small class="text-muted"><i class="bi bi-currency-dollar"></i> ${salary}</small></p>` : ''}
+                    ${salary ? `<p class="card-text"><small class="text-muted"><i class="bi bi-cash"></i> ${salary}</small></p>` : ''}
                     <p class="card-text"><small class="text-muted"><i class="bi bi-clock"></i> ${date}</small></p>
                 </div>
                 <div class="card-footer bg-transparent">
@@ -378,22 +409,61 @@ document.addEventListener('DOMContentLoaded', () => {
         return card;
     }
 
-    // Função para atualizar a lista de vagas
-    function updateJobsList(jobs) {
-        resultsDiv.innerHTML = '';
-        const filteredJobs = showOnlyRemote ? jobs.filter(job => job.remote) : jobs;
+    // Contagens por fonte calculadas no servidor (facetas)
+    function renderFacets(facets) {
+        let facetsSpan = document.getElementById('facets');
+        if (!facetsSpan) {
+            facetsSpan = document.createElement('span');
+            facetsSpan.id = 'facets';
+            facetsSpan.className = 'ms-3 text-muted small';
+            totalJobsSpan.after(facetsSpan);
+        }
+        facetsSpan.textContent = ((facets && facets.source) || [])
+            .map(facet => `${facet.value}: ${facet.count}`)
+            .join(' · ');
+    }
+
+    // Função para atualizar a lista de vagas (página recebida do servidor)
+    function updateJobsList(data, append = false) {
+        if (!append) {
+            resultsDiv.innerHTML = '';
+            loadedJobs = 0;
+        }
+        document.getElementById('loadMore')?.remove();
         
-        if (filteredJobs.length === 0) {
+        if (data.total === 0) {
             noResultsDiv.style.display = 'block';
             filtersDiv.style.display = 'none';
-        } else {
-            noResultsDiv.style.display = 'none';
-            filtersDiv.style.display = 'flex';
-            totalJobsSpan.textContent = `${filteredJobs.length} Vagas Encontradas`;
-            
-            filteredJobs.forEach(job => {
-                resultsDiv.appendChild(createJobCard(job));
-            });
+            return;
+        }
+        noResultsDiv.style.display = 'none';
+        filtersDiv.style.display = 'flex';
+        totalJobsSpan.textContent = `${data.total} Vagas Encontradas`;
+        renderFacets(data.facets);
+        
+        data.jobs.forEach(job => {
+            resultsDiv.appendChild(createJobCard(job));
+        });
+        loadedJobs += data.jobs.length;
+        
+        if (loadedJobs < data.total) {
+            const loadMore = document.createElement('div');
+            loadMore.id = 'loadMore';
+            loadMore.className = 'col-12 text-center';
+            loadMore.innerHTML = '<button class="btn btn-outline-primary">Carregar mais</button>';
+            loadMore.querySelector('button').addEventListener('click', () => loadResults(true));
+            resultsDiv.appendChild(loadMore);
+        }
+    }
+
+    // Filtro, ordenação e paginação rodam no servidor sobre os resultados guardados
+    async function loadResults(append = false) {
+        if (!searchId) return;
+        try {
+            const params = resultParams(showOnlyRemote, sortBy, append ? loadedJobs : 0, PAGE_SIZE);
+            updateJobsList(await fetchResults(searchId, params), append);
+        } catch (error) {
+            console.error('Erro:', error);
         }
     }
 
@@ -405,12 +475,15 @@ document.addEventListener('DOMContentLoaded', () => {
             noResultsDiv.style.display = 'none';
             filtersDiv.style.display = 'none';
 
-            const response = await fetch(`/api/jobs/search?keywords=${encodeURIComponent(keywords)}&location=${encodeURIComponent(location)}`);
+            const params = resultParams(showOnlyRemote, sortBy, 0, PAGE_SIZE);
+            params.set('keywords', keywords);
+            params.set('location', location);
+            const response = await fetch(`/api/jobs/search?${params}`, { method: 'POST' });
             const data = await response.json();
 
             if (response.ok) {
-                currentJobs = data.jobs;
-                updateJobsList(currentJobs);
+                searchId = data.search_id;
+                updateJobsList(data);
             } else {
                 throw new Error(data.detail || 'Erro ao buscar vagas');
             }
@@ -435,18 +508,14 @@ document.addEventListener('DOMContentLoaded', () => {
     remoteFilterBtn.addEventListener('click', () => {
         showOnlyRemote = !showOnlyRemote;
         remoteFilterBtn.classList.toggle('active');
-        updateJobsList(currentJobs);
+        loadResults();
     });
 
     document.querySelectorAll('[data-sort]').forEach(btn => {
         btn.addEventListener('click', (e) => {
-            const sortBy = e.target.dataset.sort;
-            if (sortBy === 'date') {
-                currentJobs.sort((a, b) => new Date(b.created) - new Date(a.created));
-            } else if (sortBy === 'salary') {
-                currentJobs.sort((a, b) => (b.salary_max || b.salary_min || 0) - (a.salary_max || a.salary_min || 0));
-            }
-            updateJobsList(currentJobs);
+            e.preventDefault();
+            sortBy = e.target.dataset.sort;
+            loadResults();
         });
     });
 
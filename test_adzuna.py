@@ -1,6 +1,7 @@
 import logging
 import argparse
 from src.services.adzuna_client import AdzunaClient
+from src.services.http_fixtures import http_fixtures
 
 # Configurar logging
 logging.basicConfig(
@@ -43,6 +44,9 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Teste da API do Adzuna")
     parser.add_argument("keywords", help="Palavras-chave para busca")
     parser.add_argument("location", help="Local da vaga")
+    parser.add_argument("--http-mode", choices=["live", "record", "replay"], default="live",
+                        help="live usa a internet, record grava fixtures, replay roda offline")
     
     args = parser.parse_args()
-    test_adzuna(args.keywords, args.location)
+    with http_fixtures(args.http_mode):
+        test_adzuna(args.keywords, args.location)
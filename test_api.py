@@ -1,6 +1,8 @@
 import uvicorn
 import argparse
 import asyncio
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
@@ -8,6 +10,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from src.api.jobs import router as jobs_router
 from src.config import settings
+from src.services.http_fixtures import http_fixtures
 
 # Configurar diretórios
 STATIC_DIR = Path(__file__).parent / "src" / "static"
@@ -17,11 +20,21 @@ TEMPLATES_DIR = Path(__file__).parent / "src" / "templates"
 STATIC_DIR.mkdir(exist_ok=True, parents=True)
 TEMPLATES_DIR.mkdir(exist_ok=True, parents=True)
 
+# Lido do ambiente também no processo do uvicorn (--reload), que reimporta o módulo
+HTTP_MODE = os.getenv("SCRAPER_HTTP_MODE", settings.fixtures.mode)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Buscas da API pelo transporte de fixtures (live, record ou replay)"""
+    with http_fixtures(HTTP_MODE):
+        yield
+
 # Criar app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    description=settings.APP_DESCRIPTION
+    description=settings.APP_DESCRIPTION,
+    lifespan=lifespan
 )
 
 # Montar arquivos estáticos
@@ -71,8 +84,11 @@ if __name__ == "__main__":
     parser.add_argument("--host", default=settings.HOST, help="Host")
     parser.add_argument("--port", type=int, default=settings.PORT, help="Porta")
     parser.add_argument("--reload", action="store_true", help="Reload automático")
+    parser.add_argument("--http-mode", choices=["live", "record", "replay"], default=HTTP_MODE,
+                        help="live usa a internet, record grava fixtures, replay roda offline")
     
     args = parser.parse_args()
+    os.environ["SCRAPER_HTTP_MODE"] = args.http_mode
     
     # Iniciar servidor
     uvicorn.run(
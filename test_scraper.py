@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 from src.config import settings
 from src.models.job import Job
 from src.services.job_scraper import JobScraper
+from src.services.http_fixtures import http_fixtures
 
 # Configurar logging
 logging.basicConfig(
@@ -109,11 +110,14 @@ if __name__ == "__main__":
     parser.add_argument('keywords', help='Palavras-chave para busca')
     parser.add_argument('location', help='Localização')
     parser.add_argument('--version', '-v', default='v1', help='Versão do scraper (v1, v2, v3)')
+    parser.add_argument('--http-mode', choices=['live', 'record', 'replay'], default='live',
+                        help='live usa a internet, record grava fixtures, replay roda offline')
     
     args = parser.parse_args()
     
     # Executar teste
-    jobs = asyncio.run(test_scraper(args.keywords, args.location, args.version))
+    with http_fixtures(args.http_mode):
+        jobs = asyncio.run(test_scraper(args.keywords, args.location, args.version))
     
     # Imprimir resultados
     print_results(jobs)
@@ -0,0 +1,59 @@
+import pytest
+
+from src.database.db import Database
+from src.models.job import Job, JobFilters
+
+
+def make_jobs(count):
+    jobs = [Job(title=f"Dev {i}", company="A", location="SP", url=f"https://x/{i}", source="Gupy") for i in range(count)]
+    for index, job in enumerate(jobs):
+        job.score = index % 4 / 4
+    return jobs
+
+
+def test_relevance_page_follows_the_index_without_sorting(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    db.save_jobs(make_jobs(20), "busca", "v1")
+    filters = JobFilters(search_id="busca", remote=False)
+    source, joined = db._from(filters)
+    where, params = db._where(filters)
+    with db.get_connection() as conn:
+        plan = [row[3] for row in conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT jobs.* FROM {source} {where} "
+            f"ORDER BY {db._order_by('relevance', True, filters)} LIMIT 5",
+            (*joined, *params)
+        )]
+    assert not any("TEMP B-TREE" in step for step in plan)
+
+    page = db.search_jobs(JobFilters(search_id="busca"), "relevance", limit=5)
+    assert [job["score"] for job in page] == [0.75] * 5
+    assert [job["id"] for job in page] == sorted(job["id"] for job in page)
+
+
+def test_saving_without_score_keeps_the_score_of_the_search(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    jobs = make_jobs(2)
+    db.save_jobs(jobs, "busca", "v1")
+    for job in jobs:
+        job.score = None
+    db.save_jobs(jobs, "busca", "v1")
+    db.save_jobs(jobs, "outra", "v1")
+    scores = {job["url"]: job["score"] for job in db.get_jobs("busca")}
+    assert scores == {"https://x/0": 0.0, "https://x/1": 0.25}
+    assert [job["score"] for job in db.get_jobs("outra")] == [0.0, 0.0]
+
+
+def test_salary_sort_compares_annual_values_within_one_currency(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'jobs.db'}")
+    salaries = {"mensal": "R$ 10.000 por mês", "anual": "R$ 100.000 por ano", "hora": "R$ 50 por hora",
+                "dolar": "$200,000 per year"}
+    db.save_jobs(
+        [Job(title=title, company="A", location="SP", url=f"https://x/{title}", source="Gupy", salary=salary)
+         for title, salary in salaries.items()],
+        "busca", "v1"
+    )
+
+    with pytest.raises(ValueError):
+        db.search_jobs(JobFilters(), "salary")
+    page = db.search_jobs(JobFilters(currency="brl"), "salary")
+    assert [job["title"] for job in page] == ["mensal", "hora", "anual"]
@@ -0,0 +1,56 @@
+import asyncio
+
+from src.models.job import Job
+from src.scrapers.engine import SourceEngine
+from src.scrapers.sources import Source
+from src.services.cache import TTLCache
+
+
+class OnePageSource(Source):
+    name = "uma_pagina"
+    label = "Uma Página"
+
+    def build_request(self, keywords, location, page):
+        return "https://example.com/vagas", {"q": keywords, "page": page}
+
+    def parse(self, payload, keywords, location):
+        return [Job(title=title, company="A", location=location, url=f"https://example.com/{title}",
+                    source=self.label) for title in payload]
+
+
+class StaticPayload:
+    """Política de tentativas que devolve a resposta sem acessar a rede"""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    async def run(self, name, call):
+        self.calls += 1
+        return self.payload
+
+
+def test_cached_page_gives_each_caller_its_own_jobs():
+    payload = StaticPayload(["dev", "qa"])
+    engine = SourceEngine(cache=TTLCache(), retry_policy=payload)
+    source = OnePageSource()
+
+    async def fetch_three_times():
+        try:
+            first = await engine.fetch_page(source, "python", "Recife", 1)
+            for job in first:
+                job.score = 1.0
+            second = await engine.fetch_page(source, "python", "Recife", 1)
+            for job in second:
+                job.score = 0.5
+            third = await engine.fetch_page(source, "python", "Recife", 1)
+            return first, second, third
+        finally:
+            await engine.close()
+
+    first, second, third = asyncio.run(fetch_three_times())
+    assert payload.calls == 1
+    assert [job.score for job in first] == [1.0, 1.0]
+    assert [job.score for job in second] == [0.5, 0.5]
+    assert [job.score for job in third] == [None, None]
+    assert [job.url for job in third] == [job.url for job in first]
@@ -0,0 +1,34 @@
+from src.services.extraction import SkillExtractor, TermMatcher
+
+
+def found(matcher: TermMatcher, text: str):
+    return [(match.start, match.term) for match in matcher.find(text)]
+
+
+def test_overlapping_terms_are_all_found():
+    matcher = TermMatcher({"penetration testing": None, "testing tools": None})
+    assert found(matcher, "penetration testing tools") == [
+        (0, "penetration testing"),
+        (12, "testing tools"),
+    ]
+
+
+def test_nested_terms_are_found_once():
+    matcher = TermMatcher({"network security": None, "security": None, "network": None})
+    assert found(matcher, "Network Security") == [
+        (0, "network security"),
+        (0, "network"),
+        (8, "security"),
+    ]
+
+
+def test_terms_match_on_word_boundaries_only():
+    matcher = TermMatcher({"java": None, "security+": None, "5+ years": None})
+    assert matcher.values("JavaScript, Security+ e 5+ years") == ["security+", "5+ years"]
+
+
+def test_skill_extractor_keeps_overlapping_skills():
+    extractor = SkillExtractor(["penetration testing", "testing tools", "python"])
+    assert extractor.extract_skills("Penetration testing tools em Python") == [
+        "penetration testing", "testing tools", "python"
+    ]
@@ -0,0 +1,44 @@
+import pytest
+
+from src.models.job import Job
+from src.services.salary import Salary, find_salary, parse_salary
+
+
+@pytest.mark.parametrize("text", [
+    "5 anos de experiência",
+    "2.000",
+    "120k-150k",
+    "3 vagas",
+    "A combinar",
+    "",
+])
+def test_numbers_without_currency_or_salary_context_are_not_salaries(text):
+    assert parse_salary(text) is None
+
+
+def test_job_keeps_non_salary_text_unparsed():
+    job = Job(title="Dev", company="A", location="SP", url="u", source="Gupy", salary="5 anos de experiência")
+    assert (job.salary_min, job.salary_max, job.currency, job.period) == (None, None, None, None)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("R$ 5.000 - 7.000", Salary(5000, 7000, "BRL", "month")),
+    ("$120k-150k per year", Salary(120_000, 150_000, "USD", "year")),
+    ("Salário: 4.500 por mês", Salary(4500, 4500, None, "month")),
+    ("Salary 30 per hour", Salary(30, 30, None, "hour")),
+])
+def test_salaries_with_currency_or_keyword(text, expected):
+    assert parse_salary(text) == expected
+
+
+def test_currency_from_the_source_counts_as_context():
+    assert parse_salary("5.000 - 7.000", currency="BRL") == Salary(5000, 7000, "BRL", "month")
+
+
+def test_numeric_salaries_are_unchanged():
+    assert parse_salary(85000, "USD") == Salary(85000, 85000, "USD", "year")
+
+
+def test_find_salary_ignores_loose_numbers():
+    assert find_salary("Mínimo de 5 anos de experiência, 2 vagas") is None
+    assert find_salary("Oferecemos R$ 6.000/mês e VR") == Salary(6000, 6000, "BRL", "month")
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+import requests
+
+from src.scrapers.tiered import TieredFetcher
+from src.services import job_scraper, job_service_async
+from src.services.circuit_breaker import OPEN, CircuitBreakerRegistry
+from src.services.job_service_async import AsyncJobService
+from src.services.retry import RetryPolicy
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    fetcher = TieredFetcher(state_file=str(tmp_path / "tiers.json"))
+
+    async def api_down(*args, **kwargs):
+        raise RuntimeError("api fora do ar")
+
+    def network_down(*args, **kwargs):
+        raise requests.ConnectionError("sem rede")
+
+    async def browser_down(*args, **kwargs):
+        raise RuntimeError("navegador indisponível")
+
+    monkeypatch.setattr(fetcher.engine, "search_source", api_down)
+    monkeypatch.setattr(fetcher.job_scraper.session, "get", network_down)
+    monkeypatch.setattr(job_scraper, "retry_policy", RetryPolicy(attempts=1))
+    monkeypatch.setattr(fetcher, "_fetch_browser", browser_down)
+    yield fetcher
+    asyncio.run(fetcher.engine.close())
+
+
+def test_static_tier_propagates_errors_only_when_asked(fetcher):
+    config = {"base_url": "https://example.com/?q={}&l={}", "selectors": {}}
+    assert fetcher.job_scraper.scrape_site("Exemplo", config, "python", "Recife") == []
+    with pytest.raises(requests.ConnectionError):
+        fetcher.job_scraper.scrape_site("Exemplo", config, "python", "Recife", raise_errors=True)
+
+
+def test_all_tiers_failing_raises(fetcher):
+    with pytest.raises(RuntimeError, match="navegador"):
+        asyncio.run(fetcher.search("LinkedIn", "python", "Recife", raise_errors=True))
+    assert asyncio.run(fetcher.search("LinkedIn", "python", "Recife")) == []
+
+
+def test_all_tiers_failing_opens_the_breaker(fetcher, monkeypatch):
+    registry = CircuitBreakerRegistry()
+    monkeypatch.setattr(job_service_async, "breakers", registry)
+    breaker = registry.get("linkedin")
+
+    async def search():
+        status = {}
+        for _ in range(breaker.failure_threshold):
+            call = fetcher.search("LinkedIn", "python", "Recife", raise_errors=True)
+            assert await AsyncJobService._guarded("linkedin", call, status) == []
+            assert status["linkedin"] == "failed"
+
+    asyncio.run(search())
+    assert breaker.state == OPEN
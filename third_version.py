@@ -10,6 +10,9 @@ import threading
 import re
 from urllib.parse import quote
 
+from src.scrapers.engine import SourceEngine
+from src.services.extraction import SkillExtractor
+
 class JobSearcher:
     def __init__(self):
         self.headers = {
@@ -30,22 +33,24 @@ class JobSearcher:
             'mid': ['mid level', 'intermediate', '2-5 years', '3-5 years', 'mid-level'],
             'senior': ['senior', 'lead', '5+ years', '6+ years', 'principal', 'architect']
         }
+        
+        # Skills and level terms compiled into one automaton (one scan per description)
+        self.extractor = SkillExtractor(self.common_pentesting_skills, self.level_keywords)
+        
+        self.engine = SourceEngine()
 
     def detect_level(self, text):
-        text_lower = text.lower()
-        for level, keywords in self.level_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return level.capitalize()
-        return "Not Specified"
+        level = self.extractor.detect_level(text)
+        return level.capitalize() if level else "Not Specified"
 
     def extract_skills_from_text(self, text):
-        found_skills = []
-        text_lower = text.lower()
-        for skill in self.common_pentesting_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        return found_skills
+        return self.extractor.extract_skills(text)
+
+    def analyze_description(self, text):
+        """Level and skills from a single scan of the description"""
+        found = self.extractor.extract(text)
+        level = found['level'].capitalize() if found['level'] else "Not Specified"
+        return level, found['skills']
 
     def search_linkedin(self, query, location):
         jobs = []
@@ -72,8 +77,7 @@ class JobSearcher:
                         description = job_soup.find('div', class_='description__text')
                         description_text = description.get_text() if description else ""
                         
-                        level = self.detect_level(description_text)
-                        skills = self.extract_skills_from_text(description_text)
+                        level, skills = self.analyze_description(description_text)
                         
                         jobs.append({
                             'title': title_elem.get_text().strip(),
@@ -109,8 +113,7 @@ class JobSearcher:
                     
                     if all([title, company, location]):
                         description_text = description.get_text() if description else ""
-                        level = self.detect_level(description_text)
-                        skills = self.extract_skills_from_text(description_text)
+                        level, skills = self.analyze_description(description_text)
                         
                         jobs.append({
                             'title': title.get_text().strip(),
@@ -131,35 +134,21 @@ class JobSearcher:
     def search_glassdoor(self, query, location):
         jobs = []
         try:
-            url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={quote(query)}&locT=&locId=&locKeyword={quote(location)}"
-            response = requests.get(url, headers=self.headers)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            listing = self.engine.search_sync(query, location, ['glassdoor'], 10)['glassdoor']
             
-            job_cards = soup.find_all('li', class_='react-job-listing')[:10]
-            
-            for card in job_cards:
-                try:
-                    title = card.find('a', class_='jobLink')
-                    company = card.find('div', class_='employer-name')
-                    location = card.find('span', class_='loc')
-                    
-                    if all([title, company, location]):
-                        description_text = ""
-                        level = self.detect_level(description_text)
-                        skills = self.extract_skills_from_text(description_text)
-                        
-                        jobs.append({
-                            'title': title.get_text().strip(),
-                            'company': company.get_text().strip(),
-                            'location': location.get_text().strip(),
-                            'url': 'https://www.glassdoor.com' + title['href'] if title.get('href') else '',
-                            'skills': ', '.join(skills) if skills else 'No specific skills listed',
-                            'level': level,
-                            'source': 'Glassdoor'
-                        })
-                except Exception as e:
-                    print(f"Error processing Glassdoor job: {e}")
-                    continue
+            for job in listing:
+                description_text = job.description or ""
+                level, skills = self.analyze_description(description_text)
+                
+                jobs.append({
+                    'title': job.title,
+                    'company': job.company,
+                    'location': job.location,
+                    'url': job.url,
+                    'skills': ', '.join(skills) if skills else 'No specific skills listed',
+                    'level': level,
+                    'source': 'Glassdoor'
+                })
         except Exception as e:
             print(f"Error searching Glassdoor: {e}")
         return jobs